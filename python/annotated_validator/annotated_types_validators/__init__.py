@@ -12,6 +12,7 @@ from .numerical_comparison import (
     lt_validator,
     multiple_of_validator,
 )
+from .predicate import predicate_validator
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +34,7 @@ SUPPORTED_ANNOTATED_TYPES: dict[at.BaseMetadata, BaseValidator] = {
     at.Lt: lt_validator,
     at.MultipleOf: multiple_of_validator,
     at.MinLen: min_len_validator,
+    at.Predicate: predicate_validator,
 }
 
 
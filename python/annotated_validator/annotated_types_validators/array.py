@@ -0,0 +1,28 @@
+"""Helpers to validate NumPy arrays and Pandas Series in a single vectorized pass."""
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+def is_array(value: Any) -> bool:
+    """`True` for NumPy arrays, Pandas Series and other objects that behave like an array."""
+    return (
+        value.__class__ is not bool
+        and getattr(value, "ndim", 0) > 0
+        and hasattr(value, "__array__")
+    )
+
+
+def invalid_positions(failed: Any) -> "np.ndarray":
+    """Flat positions where the element-wise result `failed` is `True`.
+
+    Missing values (`pd.NA`) in the result are treated as valid, the same as `NaN` comparisons.
+    """
+    # imported here so NumPy is only loaded once an array is validated
+    import numpy as np
+
+    if getattr(failed, "dtype", None) != np.bool_ and hasattr(failed, "fillna"):
+        failed = failed.fillna(False)
+    return np.flatnonzero(np.asarray(failed, dtype=bool))
@@ -1,6 +1,16 @@
+"""Numerical comparisons from `annotated_types`.
+
+Values can be scalars, or arrays (NumPy arrays, Pandas Series) that are validated element-wise.
+"""
+
 import annotated_types as at
 
 from ..exceptions.annotated_types import (
+    ArrayGreaterThanError,
+    ArrayGreaterThanOrEqualError,
+    ArrayLessThanError,
+    ArrayLessThanOrEqualError,
+    ArrayMultipleOfError,
     AtValidatorError,
     GreaterThanError,
     GreaterThanOrEqualError,
@@ -8,33 +18,69 @@ from ..exceptions.annotated_types import (
     LessThanOrEqualError,
     MultipleOfError,
 )
+from .array import invalid_positions, is_array
 
 
 def gt_validator(metadata: at.Gt, value) -> list[AtValidatorError]:
-    if metadata.gt >= value:
+    failed = metadata.gt >= value
+    if failed is False:
+        return []
+    if is_array(failed):
+        if (positions := invalid_positions(failed)).size:
+            return [ArrayGreaterThanError(metadata.gt, value, positions)]
+        return []
+    if failed:
         return [GreaterThanError(metadata.gt, value)]
     return []
 
 
 def ge_validator(metadata: at.Ge, value) -> list[AtValidatorError]:
-    if metadata.ge > value:
+    failed = metadata.ge > value
+    if failed is False:
+        return []
+    if is_array(failed):
+        if (positions := invalid_positions(failed)).size:
+            return [ArrayGreaterThanOrEqualError(metadata.ge, value, positions)]
+        return []
+    if failed:
         return [GreaterThanOrEqualError(metadata.ge, value)]
     return []
 
 
 def lt_validator(metadata: at.Lt, value) -> list[AtValidatorError]:
-    if metadata.lt <= value:
+    failed = metadata.lt <= value
+    if failed is False:
+        return []
+    if is_array(failed):
+        if (positions := invalid_positions(failed)).size:
+            return [ArrayLessThanError(metadata.lt, value, positions)]
+        return []
+    if failed:
         return [LessThanError(metadata.lt, value)]
     return []
 
 
 def le_validator(metadata: at.Le, value) -> list[AtValidatorError]:
-    if metadata.le < value:
+    failed = metadata.le < value
+    if failed is False:
+        return []
+    if is_array(failed):
+        if (positions := invalid_positions(failed)).size:
+            return [ArrayLessThanOrEqualError(metadata.le, value, positions)]
+        return []
+    if failed:
         return [LessThanOrEqualError(metadata.le, value)]
     return []
 
 
 def multiple_of_validator(metadata: at.MultipleOf, value) -> list[AtValidatorError]:
-    if value % metadata.multiple_of != 0:
+    failed = value % metadata.multiple_of != 0
+    if failed is False:
+        return []
+    if is_array(failed):
+        if (positions := invalid_positions(failed)).size:
+            return [ArrayMultipleOfError(metadata.multiple_of, value, positions)]
+        return []
+    if failed:
         return [MultipleOfError(metadata.multiple_of, value)]
     return []
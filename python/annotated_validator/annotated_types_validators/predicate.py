@@ -0,0 +1,30 @@
+"""`Predicate` from `annotated_types`.
+
+Predicates are called once with the whole value. If the value is an array (NumPy array, Pandas
+Series) and the predicate returns an array with the same shape (NumPy ufuncs such as `np.isfinite`,
+`pd.Series.notna`, `lambda x: x > 0`), each element is reported separately. Any other result is
+the result for the whole value.
+"""
+
+import annotated_types as at
+
+from ..exceptions.annotated_types import ArrayPredicateError, AtValidatorError, PredicateError
+from .array import is_array
+
+
+def predicate_validator(metadata: at.Predicate, value) -> list[AtValidatorError]:
+    result = metadata.func(value)
+    if is_array(value) and is_array(result):
+        # imported here so NumPy is only loaded once an array is validated
+        import numpy as np
+
+        if np.shape(result) == np.shape(value):
+            if hasattr(result, "fillna"):
+                # missing results are valid, the same as comparisons with missing values
+                result = result.fillna(True)
+            if (positions := np.flatnonzero(~np.asarray(result, dtype=bool))).size:
+                return [ArrayPredicateError(metadata.func, value, positions)]
+            return []
+    if not result:
+        return [PredicateError(metadata.func, value)]
+    return []
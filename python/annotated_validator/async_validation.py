@@ -0,0 +1,99 @@
+"""Validation plans for `async def` functions.
+
+Async validators (a `BaseMetaValidator` with an `async def validate`) of every parameter run
+concurrently. With the `offload` option, synchronous validators of arrays and Dataframes run in a
+thread (`asyncio.to_thread`) so they don't block the event loop. Errors are collected in the same
+order (and the same `ExceptionGroup` structure) as synchronous validation.
+"""
+
+import asyncio
+import functools
+from collections.abc import Awaitable, Callable, Sequence
+from typing import Any, TypeAlias
+
+from .base import ParameterExceptionGroup, ValidatorExceptionGroup
+from .options import ValidationOptions
+from .plan import MetadataPlan, ParameterPlan
+
+AsyncParametersCheck: TypeAlias = Callable[
+    [Sequence[Any]], Awaitable[list[ParameterExceptionGroup] | None]
+]
+"""Validates every parameter in a plan, the result must be awaited."""
+
+
+def _should_offload(value: Any) -> bool:
+    """Only values with a shape are offloaded, a thread costs more than validating a scalar."""
+    return getattr(value, "ndim", 0) > 0
+
+
+def start_check(
+    metadata_plan: MetadataPlan, value: Any, offload: bool
+) -> Callable[[], Awaitable[ValidatorExceptionGroup | None]] | None:
+    """Callable that starts an awaitable check of `value`, `None` if it is validated directly."""
+    if metadata_plan.is_async:
+        return functools.partial(metadata_plan.check, value)
+    if offload and _should_offload(value):
+        return functools.partial(asyncio.to_thread, metadata_plan.check, value)
+    return None
+
+
+async def run_check(
+    metadata_plan: MetadataPlan, value: Any, offload: bool
+) -> ValidatorExceptionGroup | None:
+    """Validate `value` against a single metadata item, awaiting the check if required."""
+    if (start := start_check(metadata_plan, value, offload)) is None:
+        return metadata_plan.check(value)
+    return await start()
+
+
+async def validate_parameters_async(
+    param_plans: Sequence[ParameterPlan], values: Sequence[Any], offload: bool = False
+) -> list[ParameterExceptionGroup] | None:
+    """Validate each value with its plan, awaitable checks of every parameter run concurrently."""
+    param_results: list[list[ValidatorExceptionGroup | None]] = []
+    starts = []
+    slots = []
+    for param_plan, value in zip(param_plans, values, strict=True):
+        results = []
+        for metadata_plan in param_plan.metadata:
+            if (start := start_check(metadata_plan, value, offload)) is None:
+                results.append(metadata_plan.check(value))
+                continue
+            slots.append((results, len(results)))
+            starts.append(start)
+            results.append(None)
+        param_results.append(results)
+    if starts:
+        awaited = await asyncio.gather(*(start() for start in starts))
+        for (results, index), result in zip(slots, awaited, strict=True):
+            results[index] = result
+    errors = [
+        ExceptionGroup(f"`{param_plan.name}` Validation Errors", validation_exception_groups)
+        for param_plan, results in zip(param_plans, param_results, strict=True)
+        if (validation_exception_groups := [result for result in results if result])
+    ]
+    return errors or None
+
+
+async def validate_parameters_first_error_async(
+    param_plans: Sequence[ParameterPlan], values: Sequence[Any], offload: bool = False
+) -> list[ParameterExceptionGroup] | None:
+    """Validate each value with its plan until a validator fails, checks run one at a time."""
+    for param_plan, value in zip(param_plans, values, strict=True):
+        for metadata_plan in param_plan.metadata:
+            if errors := await run_check(metadata_plan, value, offload):
+                return [ExceptionGroup(f"`{param_plan.name}` Validation Errors", [errors])]
+    return None
+
+
+def build_async_values_check(
+    param_plans: Sequence[ParameterPlan], options: ValidationOptions
+) -> AsyncParametersCheck:
+    """Create the awaitable check for a sequence of values, one for each plan in `param_plans`.
+
+    Async plans are always interpreted (`generate_code` is ignored).
+    """
+    validate = (
+        validate_parameters_first_error_async if options.fail_fast else validate_parameters_async
+    )
+    return functools.partial(validate, tuple(param_plans), offload=bool(options.offload))
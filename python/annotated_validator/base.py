@@ -0,0 +1,42 @@
+"""Base Class and type aliases shared by all validators."""
+
+from abc import abstractmethod
+from typing import ClassVar, TypeAlias
+
+from annotated_types import BaseMetadata
+
+from .exceptions.validator import ValidatorError
+
+
+class BaseMetaValidator(BaseMetadata):
+    """Base Class for all Validation Classes.
+
+    Metadata is checked to see if it of type `Validator` in order to be used for validation.
+    """
+
+    supports_sampling: ClassVar[bool] = False
+    """Validates arrays (and Dataframes) row by row, each row independently.
+
+    Opt-in, since most validators only accept a single value. Values are then also validated as
+    one array: sampled with a `SamplingPolicy`, in `Batches`, for containers and `validate_many`.
+    """
+    memoizable: ClassVar[bool] = True
+    """Result only depends on the value, so the `memoize` option can skip valid values."""
+
+    @staticmethod
+    def at_validate(metadata: "BaseMetaValidator", value) -> ExceptionGroup[ValidatorError] | None:
+        return metadata.validate(value)
+
+    @abstractmethod
+    def validate(self, value) -> ExceptionGroup[ValidatorError] | None:
+        ...
+
+
+ValidatorExceptionGroup: TypeAlias = ExceptionGroup[ValidatorError]
+"""All exceptions from a single validator are contained into this exeception group."""
+
+ParameterExceptionGroup: TypeAlias = ExceptionGroup[ValidatorExceptionGroup]
+"""All exceptions for a parameter are contained in this exception group.
+
+Can include errors from multiple validators.
+"""
@@ -0,0 +1,171 @@
+"""Merge the bound metadata of a parameter into a single interval when the plan is built.
+
+Annotations often stack several bounds, e.g. `Annotated[int, at.Ge(0), at.Lt(100), NumberRange(1,
+50)]`. The tightest lower and upper bound are found once, so a number can be checked with a single
+chained comparison (`1 <= value < 50`) instead of dispatching to every validator. Numbers outside
+the interval (and values that aren't plain numbers, e.g. arrays) are validated by the original
+validators, so errors still name the constraint that failed.
+
+Bounds that no value can satisfy (e.g. `at.Gt(10), at.Lt(5)`) are logged once when the plan is
+built.
+"""
+
+import logging
+from collections.abc import Callable, Iterable
+from decimal import Decimal
+from fractions import Fraction
+from typing import Any, NamedTuple
+
+import annotated_types as at
+
+from .annotated_types_validators import get_at_validators, unsuported_validator
+from .base import BaseMetaValidator
+from .number_validators import NumberRange
+
+logger = logging.getLogger(__name__)
+
+NUMBER_TYPES = frozenset({int, float, bool, Decimal, Fraction})
+"""Types of values (and bounds) that are compared with the folded interval."""
+
+_LOWER_BOUNDS: dict[type, tuple[str, bool]] = {at.Gt: ("gt", False), at.Ge: ("ge", True)}
+_UPPER_BOUNDS: dict[type, tuple[str, bool]] = {at.Lt: ("lt", False), at.Le: ("le", True)}
+
+
+class Bound(NamedTuple):
+    """A lower or upper bound of an interval."""
+
+    value: int | float | Decimal | Fraction
+    """The bound itself."""
+    inclusive: bool
+    """`True` if `value` is part of the interval."""
+    metadata: Any
+    """Metadata the bound is from, used in messages."""
+
+
+class Bounds(NamedTuple):
+    """The interval that satisfies every folded bound."""
+
+    low: Bound | None
+    """Tightest lower bound, `None` if there isn't one."""
+    high: Bound | None
+    """Tightest upper bound, `None` if there isn't one."""
+
+    @property
+    def is_empty(self) -> bool:
+        """`True` if no value is within the interval."""
+        if self.low is None or self.high is None:
+            return False
+        if self.low.value == self.high.value:
+            return not (self.low.inclusive and self.high.inclusive)
+        return self.low.value > self.high.value
+
+    def build_contains(self) -> Callable[[Any], bool]:
+        """Create a function that returns `True` if a value is a number within the interval.
+
+        `False` doesn't mean the value is invalid, e.g. arrays and `NaN` are never contained.
+        """
+        low = self.low.value if self.low is not None else float("-inf")
+        high = self.high.value if self.high is not None else float("inf")
+        low_inclusive = self.low is None or self.low.inclusive
+        high_inclusive = self.high is None or self.high.inclusive
+        number_types = NUMBER_TYPES
+
+        if low_inclusive and high_inclusive:
+
+            def contains(value: Any) -> bool:
+                return type(value) in number_types and low <= value <= high
+
+        elif low_inclusive:
+
+            def contains(value: Any) -> bool:
+                return type(value) in number_types and low <= value < high
+
+        elif high_inclusive:
+
+            def contains(value: Any) -> bool:
+                return type(value) in number_types and low < value <= high
+
+        else:
+
+            def contains(value: Any) -> bool:
+                return type(value) in number_types and low < value < high
+
+        return contains
+
+
+def _is_number(bound: Any) -> bool:
+    # `NaN` bounds can't be ordered, e.g. `at.Gt(nan)` never fails
+    return type(bound) in NUMBER_TYPES and bound == bound
+
+
+def metadata_bounds(metadata: Any) -> tuple[list[Bound], list[Bound]] | None:
+    """Lower and upper bounds of `metadata`, `None` if it isn't only numeric bounds.
+
+    Only the exact `NumberRange` type is folded, since subclasses could override `validate`.
+    """
+    lower: list[Bound] = []
+    upper: list[Bound] = []
+    if type(metadata) is NumberRange:
+        if metadata.low is not None:
+            lower.append(Bound(metadata.low, metadata.low_inclusive, metadata))
+        if metadata.high is not None:
+            upper.append(Bound(metadata.high, metadata.high_inclusive, metadata))
+    elif isinstance(metadata, at.BaseMetadata | at.GroupedMetadata) and not isinstance(
+        metadata, BaseMetaValidator
+    ):
+        for at_metadata, at_validator in get_at_validators(metadata):
+            if at_validator is unsuported_validator:
+                # skipped by the plan as well
+                continue
+            if (lower_bound := _LOWER_BOUNDS.get(type(at_metadata))) is not None:
+                attribute, inclusive = lower_bound
+                lower.append(Bound(getattr(at_metadata, attribute), inclusive, metadata))
+            elif (upper_bound := _UPPER_BOUNDS.get(type(at_metadata))) is not None:
+                attribute, inclusive = upper_bound
+                upper.append(Bound(getattr(at_metadata, attribute), inclusive, metadata))
+            else:
+                return None
+    else:
+        return None
+    if not all(_is_number(bound.value) for bound in (*lower, *upper)):
+        return None
+    return lower, upper
+
+
+def _tightest(bounds: Iterable[Bound], is_tighter: Callable[[Any, Any], bool]) -> Bound | None:
+    tightest = None
+    for bound in bounds:
+        if (
+            tightest is None
+            or is_tighter(bound.value, tightest.value)
+            # an exclusive bound is tighter than an inclusive bound with the same value
+            or (bound.value == tightest.value and not bound.inclusive)
+        ):
+            tightest = bound
+    return tightest
+
+
+def fold_bounds(name: str, metadata_items: Iterable[Any]) -> Bounds | None:
+    """Merge the bounds of `metadata_items` (see `metadata_bounds`) into a single interval.
+
+    Returns `None` if none of the metadata is a bound. Logs a warning if the interval is empty,
+    since every number is invalid for `name` then.
+    """
+    lower: list[Bound] = []
+    upper: list[Bound] = []
+    for metadata in metadata_items:
+        if (bounds := metadata_bounds(metadata)) is not None:
+            lower.extend(bounds[0])
+            upper.extend(bounds[1])
+    if not (lower or upper):
+        return None
+    folded = Bounds(
+        _tightest(lower, lambda bound, other: bound > other),
+        _tightest(upper, lambda bound, other: bound < other),
+    )
+    if folded.is_empty:
+        sources = dict.fromkeys(repr(bound.metadata) for bound in (folded.low, folded.high))
+        logger.warning(
+            "`%s`: no number satisfies %s, every number is invalid.", name, " and ".join(sources)
+        )
+    return folded
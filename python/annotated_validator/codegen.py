@@ -0,0 +1,175 @@
+"""Generate specialized Python functions from validation plans.
+
+Similar to `dataclasses` and `attrs`, source code is generated for each plan and compiled with
+`exec`. Comparisons from `annotated_types` (and `NumberRange`) are inlined as `if` statements so
+the success path doesn't dispatch to validators or allocate lists. When an inlined comparison
+fails, the interpreted validators are run for that parameter to build the exact same errors.
+
+Values that could be arrays (anything not in `INLINE_TYPES`) always use the interpreted validators
+since they are validated element-wise.
+"""
+
+import logging
+from collections.abc import Callable, Sequence
+from decimal import Decimal
+from fractions import Fraction
+from typing import Any, TypeAlias
+
+from .annotated_types_validators import get_at_validators, unsuported_validator
+from .annotated_types_validators.length_comparison import min_len_validator
+from .annotated_types_validators.numerical_comparison import (
+    ge_validator,
+    gt_validator,
+    le_validator,
+    lt_validator,
+    multiple_of_validator,
+)
+from .base import BaseMetaValidator, ParameterExceptionGroup
+from .number_validators import NumberRange
+from .plan import ParameterPlan, validate_parameter, validate_parameter_first_error
+
+logger = logging.getLogger(__name__)
+
+GeneratedCheck: TypeAlias = Callable[[Any], list[ParameterExceptionGroup] | None]
+"""Generated function, returns the errors of every invalid parameter or `None` if all are valid."""
+
+_FAILURE_TEMPLATES: dict[Callable, tuple[str, str]] = {
+    gt_validator: ("gt", "{bound} >= {value}"),
+    ge_validator: ("ge", "{bound} > {value}"),
+    lt_validator: ("lt", "{bound} <= {value}"),
+    le_validator: ("le", "{bound} < {value}"),
+    multiple_of_validator: ("multiple_of", "{value} % {bound} != 0"),
+    min_len_validator: ("min_length", "{bound} > len({value})"),
+}
+"""Validator -> (metadata attribute, failure condition). Conditions match the validators exactly."""
+
+
+INLINE_TYPES = frozenset(
+    {int, float, bool, Decimal, Fraction, str, bytes, list, tuple, dict, set, frozenset}
+)
+"""Types where inlined comparisons are used, any other type uses the interpreted validators."""
+
+
+class _Namespace:
+    """Collects the objects referenced by generated source code."""
+
+    def __init__(self):
+        self.objects: dict[str, Any] = {}
+
+    def bind(self, obj: Any) -> str:
+        name = f"_b{len(self.objects)}"
+        self.objects[name] = obj
+        return name
+
+
+def _at_failure_conditions(metadata: Any, value: str, namespace: _Namespace) -> list[str] | None:
+    conditions = []
+    for at_metadata, at_validator in get_at_validators(metadata):
+        if at_validator is unsuported_validator:
+            # skipped by the interpreted plan as well
+            continue
+        if at_validator not in _FAILURE_TEMPLATES:
+            return None
+        attribute, template = _FAILURE_TEMPLATES[at_validator]
+        bound = getattr(at_metadata, attribute)
+        if at_validator is min_len_validator and bound < 0:
+            # invalid metadata always produces an error, leave it to the validator
+            return None
+        conditions.append(template.format(bound=namespace.bind(bound), value=value))
+    return conditions
+
+
+def _number_range_failure_conditions(
+    metadata: NumberRange, value: str, namespace: _Namespace
+) -> list[str]:
+    conditions = []
+    if metadata.low is not None:
+        operator = "<=" if metadata.low_inclusive else "<"
+        conditions.append(f"not ({namespace.bind(metadata.low)} {operator} {value})")
+    if metadata.high is not None:
+        operator = ">=" if metadata.high_inclusive else ">"
+        conditions.append(f"not ({namespace.bind(metadata.high)} {operator} {value})")
+    return conditions
+
+
+def failure_conditions(
+    param_plan: ParameterPlan, value: str, namespace: _Namespace
+) -> list[str] | None:
+    """Inline conditions that are `True` when `value` is invalid, `None` if they can't inline."""
+    conditions = []
+    for metadata_plan in param_plan.metadata:
+        metadata = metadata_plan.metadata
+        # subclasses could override `validate`, only the exact type is inlined
+        if type(metadata) is NumberRange:
+            conditions.extend(_number_range_failure_conditions(metadata, value, namespace))
+        elif not isinstance(metadata, BaseMetaValidator):
+            if (at_conditions := _at_failure_conditions(metadata, value, namespace)) is None:
+                return None
+            conditions.extend(at_conditions)
+        else:
+            return None
+    return conditions
+
+
+def _append_errors(
+    errors: list[ParameterExceptionGroup] | None, param_errors: ParameterExceptionGroup | None
+) -> list[ParameterExceptionGroup] | None:
+    if param_errors is None:
+        return errors
+    if errors is None:
+        return [param_errors]
+    errors.append(param_errors)
+    return errors
+
+
+def generate_check(
+    name: str,
+    param_plans: Sequence[ParameterPlan],
+    argument: str,
+    value_expressions: Sequence[str],
+    fail_fast: bool = False,
+) -> GeneratedCheck:
+    """Generate a function that validates every parameter in `param_plans`.
+
+    The generated function takes a single `argument`, `value_expressions` are evaluated to get the
+    value of each parameter (e.g. `_values[0]` or `_obj.cost`). With `fail_fast`, the function
+    returns as soon as a parameter is invalid.
+    """
+    namespace = _Namespace()
+    namespace.objects.update(
+        {
+            "_validate": validate_parameter_first_error if fail_fast else validate_parameter,
+            "_append_errors": _append_errors,
+            "_inline_types": INLINE_TYPES,
+        }
+    )
+    lines = [f"def {name}({argument}):", "    _errors = None"]
+    for index, (param_plan, value_expression) in enumerate(
+        zip(param_plans, value_expressions, strict=True)
+    ):
+        value = f"_v{index}"
+        plan_name = namespace.bind(param_plan)
+        lines.append(f"    {value} = {value_expression}")
+        conditions = failure_conditions(param_plan, value, namespace)
+        validate = f"_errors = _append_errors(_errors, _validate({plan_name}, {value}))"
+        if conditions is None:
+            lines.append(f"    {validate}")
+            if fail_fast:
+                lines.append("    if _errors is not None:")
+                lines.append("        return _errors")
+            continue
+        if not conditions:
+            continue
+        conditions.insert(0, f"{value}.__class__ not in _inline_types")
+        lines.append(f"    if {' or '.join(conditions)}:")
+        lines.append(f"        {validate}")
+        if fail_fast:
+            lines.append("        if _errors is not None:")
+            lines.append("            return _errors")
+    lines.append("    return _errors")
+    source = "\n".join(lines)
+    logger.debug("Generated validator:\n%s", source)
+    exec(source, namespace.objects)
+    generated = namespace.objects[name]
+    generated.__source__ = source
+    return generated
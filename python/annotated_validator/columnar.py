@@ -0,0 +1,162 @@
+"""Validate many instances of a class at once, one field at a time.
+
+Instead of validating each object (every field checked once per object), the values of each field
+are collected into an array and validated once by the vectorized validators. Only objects with an
+invalid value are validated again one at a time, so the errors are the same as validating each
+object with `class_annotated_validator`.
+"""
+
+from collections.abc import Iterable, Mapping, Sequence
+from typing import Any
+
+import annotated_types as at
+import numpy as np
+
+from .base import ParameterExceptionGroup
+from .exceptions.array import InvalidElementsError
+from .plan import (
+    ParameterPlan,
+    get_class_plan,
+    validate_parameter,
+    validate_parameter_first_error,
+)
+from .sampling import supports_sampling
+
+VECTORIZED_KINDS = frozenset("biuf")
+"""NumPy dtype kinds (bool, integers, floats) that are validated with a single array operation."""
+
+
+def _columns(
+    param_plans: Sequence[ParameterPlan], objects: Any
+) -> tuple[int, list[Sequence[Any]]]:
+    """Number of objects and the values of each field.
+
+    `objects` is a Dataframe or a mapping of field names to values (columnar), or a sequence of
+    instances or mappings (records).
+    """
+    if isinstance(objects, Mapping) or hasattr(objects, "columns"):
+        missing = [param_plan.name for param_plan in param_plans if param_plan.name not in objects]
+        if missing:
+            raise ValueError(f"Fields are missing: {missing}")  # noqa: TRY003
+        columns = [objects[param_plan.name] for param_plan in param_plans]
+        lengths = {len(column) for column in columns}
+        if len(lengths) > 1:
+            raise ValueError(f"Fields have different lengths: {sorted(lengths)}")  # noqa: TRY003
+        count = len(objects) if hasattr(objects, "columns") else next(iter(lengths), 0)
+        return count, columns
+    records = objects if isinstance(objects, Sequence) else list(objects)
+    columns = [
+        [
+            record[name] if isinstance(record, Mapping) else getattr(record, name)
+            for record in records
+        ]
+        for name in (param_plan.name for param_plan in param_plans)
+    ]
+    return len(records), columns
+
+
+def _invalid_positions(errors: BaseException) -> np.ndarray | None:
+    """Positions of every invalid element, `None` if an error doesn't have positions."""
+    if isinstance(errors, InvalidElementsError):
+        return errors.positions
+    if not isinstance(errors, ExceptionGroup):
+        return None
+    positions = []
+    for error in errors.exceptions:
+        if (error_positions := _invalid_positions(error)) is None:
+            return None
+        positions.append(error_positions)
+    return np.concatenate(positions) if positions else np.empty(0, dtype=np.intp)
+
+
+def _min_length(metadata: Any) -> int | None:
+    """Minimum length required by `MinLen` (or `Len`) metadata, `None` for other metadata."""
+    if isinstance(metadata, at.MinLen):
+        return metadata.min_length
+    if isinstance(metadata, at.GroupedMetadata):
+        min_lengths = [sub.min_length for sub in metadata if isinstance(sub, at.MinLen)]
+        # `MaxLen` doesn't have a validator, other metadata can't be validated with the lengths
+        if min_lengths and all(isinstance(sub, at.MinLen | at.MaxLen) for sub in metadata):
+            return max(min_lengths)
+    return None
+
+
+def _numeric_array(column: Sequence[Any]) -> np.ndarray | None:
+    """`column` as a 1-D array of numbers, `None` if it can't be validated as one."""
+    try:
+        values = np.asarray(column) if not isinstance(column, np.ndarray) else column
+    except (TypeError, ValueError):
+        # e.g. lists with different lengths
+        return None
+    return values if values.ndim == 1 and values.dtype.kind in VECTORIZED_KINDS else None
+
+
+def invalid_rows(param_plan: ParameterPlan, column: Sequence[Any]) -> Iterable[int]:
+    """Positions of the values in `column` that are invalid for at least one validator.
+
+    Numeric columns are validated once by the metadata that is known to accept arrays (see
+    `supports_sampling`) and lengths (`MinLen`) are compared once for all of the values, everything
+    else is validated one value at a time.
+    """
+    values = _numeric_array(column)
+    lengths: np.ndarray | None = None
+    invalid: set[int] = set()
+    for metadata_plan in param_plan.metadata:
+        metadata = metadata_plan.metadata
+        if (min_length := _min_length(metadata)) is not None and min_length >= 0:
+            try:
+                if lengths is None:
+                    lengths = np.fromiter(map(len, column), dtype=np.intp, count=len(column))
+            except TypeError:
+                # a value doesn't have a length, let the validator report it
+                pass
+            else:
+                invalid.update(np.flatnonzero(lengths < min_length).tolist())
+                continue
+        if values is not None and not metadata_plan.is_async and supports_sampling(metadata):
+            if not (errors := metadata_plan.check(values)):
+                continue
+            if (positions := _invalid_positions(errors)) is not None:
+                invalid.update(positions.tolist())
+                continue
+        invalid.update(
+            position for position, value in enumerate(column) if metadata_plan.check(value)
+        )
+    return sorted(invalid)
+
+
+def validate_many(cls: type, objects: Any, *, force: bool = False) -> dict[int, ExceptionGroup]:
+    """Validate many instances of `cls`, returns the errors of each invalid object by position.
+
+    `objects` can be a sequence of instances (or of mappings with the same fields), a mapping of
+    field names to sequences of values or a Pandas Dataframe. Errors are the same as the
+    `ExceptionGroup` raised by `class_annotated_validator` for the object at that position,
+    including the `fail_fast` option of the class (only the first error of each object).
+    If validation is disabled for `cls` nothing is validated, unless `force` is `True`.
+    """
+    plan = get_class_plan(cls)
+    if not (plan.enabled or force) or not plan.parameters:
+        return {}
+    count, columns = _columns(plan.parameters, objects)
+    validate = validate_parameter_first_error if plan.fail_fast else validate_parameter
+    object_errors: dict[int, list[ParameterExceptionGroup]] = {}
+    for param_plan, column in zip(plan.parameters, columns, strict=True):
+        if not count:
+            break
+        if hasattr(column, "iloc"):
+            column = column.to_numpy()
+        for position in invalid_rows(param_plan, column):
+            if plan.fail_fast and position in object_errors:
+                # an earlier field of the object is already invalid
+                continue
+            value = column[position]
+            if isinstance(value, np.generic):
+                # the same value an instance built from the row would hold
+                value = value.item()
+            if param_errors := validate(param_plan, value):
+                object_errors.setdefault(position, []).append(param_errors)
+    # fields are validated in plan order, so errors of each object are in plan order as well
+    return {
+        position: ExceptionGroup(f"`{plan.name}` Validation Errors", errors)
+        for position, errors in sorted(object_errors.items())
+    }
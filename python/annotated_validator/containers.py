@@ -0,0 +1,355 @@
+"""Validate the elements of containers with metadata in their type arguments.
+
+Metadata can be nested in the arguments of a container annotation, each element is validated
+with the metadata of its type:
+
+```
+Prices: TypeAlias = list[Annotated[float, Gt(0)]]
+Limits: TypeAlias = dict[Annotated[str, MinLen(1)], Annotated[float, Le(1.0)]]
+Matrix: TypeAlias = Annotated[list[list[Annotated[int, Ge(0)]]], MinLen(1)]
+```
+
+Errors of each invalid element are grouped by its path: `prices[3]` for sequences and tuples,
+`limits['max']` for the values of a mapping and braces (`limits{''}`, `tags{'x'}`) for the keys
+of a mapping and the elements of a set. `Optional` elements (`Annotated[int, Gt(0)] | None`)
+are valid when they are `None`.
+
+Large lists and tuples (and mapping values) of numbers are converted to a NumPy array and
+validated once by the vectorized validators, if all of the metadata is known to accept arrays and
+validate each element independently (see `sampling.supports_sampling`, custom validators opt in).
+Elements are only validated one at a time when the array is invalid, so the errors are the same
+either way.
+"""
+
+import collections.abc
+import inspect
+import logging
+import typing
+from abc import abstractmethod
+from collections.abc import Iterable, Mapping, ValuesView
+from dataclasses import dataclass, replace
+from typing import Any, NamedTuple
+
+from .base import BaseMetaValidator, ParameterExceptionGroup, ValidatorExceptionGroup
+from .exceptions.validator import bounded_repr
+from .options import DEFAULT_OPTIONS, ValidationOptions
+from .plan import (
+    MetadataPlan,
+    ParameterPlan,
+    compile_annotated_metadata,
+    compile_metadata,
+    fold_metadata,
+    has_async_metadata,
+    validate_parameter,
+    validate_parameter_first_error,
+)
+from .sampling import supports_sampling
+from .type_processing import TypeAnnotation
+
+logger = logging.getLogger(__name__)
+
+ELEMENT_GROUP_SUFFIX = " Element Validation Errors"
+"""End of the message of the group with the errors of the elements of a container."""
+
+VECTORIZED_MIN_SIZE = 64
+"""Smaller containers are validated one element at a time, so they don't load NumPy."""
+
+SEQUENCE_ORIGINS = frozenset(
+    {
+        list,
+        collections.deque,
+        collections.abc.Sequence,
+        collections.abc.MutableSequence,
+        collections.abc.Collection,
+    }
+)
+"""Containers where elements are identified by their index."""
+
+SET_ORIGINS = frozenset(
+    {set, frozenset, collections.abc.Set, collections.abc.MutableSet, typing.AbstractSet}
+)
+"""Containers where elements are identified by their value."""
+
+MAPPING_ORIGINS = frozenset(
+    {
+        dict,
+        collections.OrderedDict,
+        collections.defaultdict,
+        collections.abc.Mapping,
+        collections.abc.MutableMapping,
+    }
+)
+"""Containers with keys and values."""
+
+_NUMBER_KINDS = {int: "iu", float: "iuf", bool: "b"}
+"""Element type -> NumPy dtype kinds of arrays that are validated by the vectorized validators.
+
+Other kinds (e.g. `float` for `int` elements, or `object` for mixed elements) are validated one
+element at a time.
+"""
+
+
+class ElementPlan(NamedTuple):
+    """Everything required to validate an element of a container."""
+
+    plan: ParameterPlan | None
+    """Metadata of the element type, `None` if only the elements of the element are validated."""
+    elements: "ContainerElements | None"
+    """Validates the elements of an element that is a container itself."""
+    optional: bool = False
+    """`None` is valid (`X | None`)."""
+    number_kinds: str = ""
+    """NumPy dtype kinds that `plan` validates as an array, empty if it can't."""
+    fail_fast: bool = False
+    """Stop at the first error of the element."""
+
+
+@dataclass(frozen=True)
+class ContainerElements(BaseMetaValidator):
+    """Validates the elements of a container, created from the type arguments of its annotation.
+
+    The errors of each invalid element are grouped with its path, starting at `name`.
+    """
+
+    name: str
+    """Name of the parameter, the start of each path."""
+    container_name: str
+    """Name of the container type, used in error messages."""
+    fail_fast: bool
+    """Stop at the first invalid element."""
+
+    def validate(self, value: Any) -> ValidatorExceptionGroup | None:
+        return self.validate_path(value, self.name)
+
+    def validate_path(self, value: Any, path: str) -> ValidatorExceptionGroup | None:
+        """Validate the elements of `value`, which is found at `path`."""
+        if errors := self.element_errors(value, path):
+            return ExceptionGroup(f"`{self.container_name}`{ELEMENT_GROUP_SUFFIX}", errors)
+        return None
+
+    @abstractmethod
+    def element_errors(self, value: Any, path: str) -> list[ParameterExceptionGroup]:
+        """Errors of each invalid element, values that aren't this type of container are valid."""
+
+    def _collect(
+        self, elements: Iterable[tuple[ElementPlan, Any, str]]
+    ) -> list[ParameterExceptionGroup]:
+        errors = []
+        for element_plan, element, element_path in elements:
+            if element_errors := validate_element(element_plan, element, element_path):
+                errors.append(element_errors)
+                if self.fail_fast:
+                    break
+        return errors
+
+
+@dataclass(frozen=True)
+class SequenceElements(ContainerElements):
+    """Elements of a sequence (`list[X]`, `tuple[X, ...]`) or a set (`set[X]`)."""
+
+    element: ElementPlan
+    """Plan for every element."""
+    is_set: bool = False
+    """Elements are identified by their value instead of their index."""
+
+    def element_errors(self, value: Any, path: str) -> list[ParameterExceptionGroup]:
+        if not _is_collection(value):
+            return []
+        if _is_valid_array(self.element, value):
+            return []
+        element = self.element
+        if self.is_set:
+            return self._collect(
+                (element, item, f"{path}{{{bounded_repr(item)}}}") for item in value
+            )
+        return self._collect(
+            (element, item, f"{path}[{index}]") for index, item in enumerate(value)
+        )
+
+
+@dataclass(frozen=True)
+class TupleElements(ContainerElements):
+    """Elements of a tuple with a type for each position (`tuple[X, Y]`)."""
+
+    positions: tuple[ElementPlan | None, ...]
+    """Plan for the element at each position, `None` if it isn't validated."""
+
+    def element_errors(self, value: Any, path: str) -> list[ParameterExceptionGroup]:
+        if not _is_collection(value):
+            return []
+        return self._collect(
+            (element, item, f"{path}[{index}]")
+            for index, (element, item) in enumerate(zip(self.positions, value, strict=False))
+            if element is not None
+        )
+
+
+@dataclass(frozen=True)
+class MappingElements(ContainerElements):
+    """Keys and values of a mapping (`dict[K, V]`)."""
+
+    key: ElementPlan | None
+    """Plan for every key, `None` if keys aren't validated."""
+    value: ElementPlan | None
+    """Plan for every value, `None` if values aren't validated."""
+
+    def element_errors(self, value: Any, path: str) -> list[ParameterExceptionGroup]:
+        if not isinstance(value, Mapping):
+            return []
+        errors = []
+        if (key := self.key) is not None:
+            errors = self._collect((key, item, f"{path}{{{bounded_repr(item)}}}") for item in value)
+            if errors and self.fail_fast:
+                return errors
+        mapped = self.value
+        if mapped is not None and not _is_valid_array(mapped, value.values()):
+            errors.extend(
+                self._collect(
+                    (mapped, item, f"{path}[{bounded_repr(item_key)}]")
+                    for item_key, item in value.items()
+                )
+            )
+        return errors
+
+
+def _is_collection(value: Any) -> bool:
+    """`True` for values with elements that can be iterated more than once (not strings)."""
+    if type(value) is list or type(value) is tuple:
+        return True
+    if isinstance(value, str | bytes | bytearray) or not isinstance(value, Iterable):
+        return False
+    # an iterator would be consumed
+    return iter(value) is not value
+
+
+def _is_valid_array(element_plan: ElementPlan, values: Any) -> bool:
+    """`True` if a large list, tuple or mapping values of numbers are valid as an array.
+
+    `False` if they are invalid, or if they can't be validated as an array.
+    """
+    if not element_plan.number_kinds or len(values) < VECTORIZED_MIN_SIZE:
+        return False
+    if isinstance(values, ValuesView):
+        values = list(values)
+    elif type(values) is not list and type(values) is not tuple:
+        return False
+    # imported here so NumPy is only loaded once a large container is validated
+    import numpy as np
+
+    try:
+        array = np.asarray(values)
+    except (TypeError, ValueError):
+        # e.g. nested sequences with different lengths
+        return False
+    if array.ndim != 1 or array.dtype.kind not in element_plan.number_kinds:
+        return False
+    return all(metadata_plan.check(array) is None for metadata_plan in element_plan.plan.metadata)
+
+
+def validate_element(
+    element_plan: ElementPlan, element: Any, path: str
+) -> ParameterExceptionGroup | None:
+    """Validate `element` (found at `path`) and its elements, returns the errors if any."""
+    if element is None and element_plan.optional:
+        return None
+    errors: list[ValidatorExceptionGroup] = []
+    if (param_plan := element_plan.plan) is not None:
+        validate = validate_parameter_first_error if element_plan.fail_fast else validate_parameter
+        if param_errors := validate(param_plan, element):
+            errors.extend(param_errors.exceptions)
+    elements = element_plan.elements
+    if (
+        elements is not None
+        and not (errors and element_plan.fail_fast)
+        and (elements_errors := elements.validate_path(element, path))
+    ):
+        errors.append(elements_errors)
+    return ExceptionGroup(f"`{path}` Validation Errors", errors) if errors else None
+
+
+def compile_elements(
+    name: str, py_type: Any, options: ValidationOptions = DEFAULT_OPTIONS
+) -> MetadataPlan | None:
+    """Create the plan that validates the elements of a container annotation.
+
+    Returns `None` if the type arguments don't contain metadata. Metadata on the container itself
+    (`Annotated[list[...], MinLen(1)]`) isn't included.
+    """
+    elements = compile_container(name, TypeAnnotation.from_py_type(py_type).inner, options)
+    return compile_metadata(elements) if elements is not None else None
+
+
+def compile_container(
+    name: str, annotation: TypeAnnotation, options: ValidationOptions = DEFAULT_OPTIONS
+) -> ContainerElements | None:
+    """Create the validator for the elements of `annotation`, `None` if nothing is validated.
+
+    `X | None` validates the elements of `X`, `None` doesn't have any elements.
+    """
+    if (optional_type := annotation.optional_type) is not None:
+        annotation = TypeAnnotation.from_py_type(optional_type).inner
+    if not annotation.has_nested_metadata:
+        return None
+    origin, arguments = annotation.origin, annotation.arguments
+    container_name = getattr(origin, "__name__", str(origin))
+    fail_fast = bool(options.fail_fast)
+    if origin is tuple and arguments[-1] is not Ellipsis:
+        positions = tuple(
+            compile_element(f"{name}[{index}]", argument, options)
+            for index, argument in enumerate(arguments)
+        )
+        return TupleElements(name, container_name, fail_fast, positions)
+    if origin is tuple or origin in SEQUENCE_ORIGINS or origin in SET_ORIGINS:
+        if (element := compile_element(f"{name}[]", arguments[0], options)) is None:
+            return None
+        return SequenceElements(
+            name, container_name, fail_fast, element, is_set=origin in SET_ORIGINS
+        )
+    if origin in MAPPING_ORIGINS:
+        key = compile_element(f"{name}{{}}", arguments[0], options)
+        value = compile_element(f"{name}[]", arguments[1], options)
+        if key is None and value is None:
+            return None
+        return MappingElements(name, container_name, fail_fast, key, value)
+    logger.debug("%s: the elements of %s aren't validated.", name, origin)
+    return None
+
+
+def compile_element(
+    name: str, py_type: Any, options: ValidationOptions = DEFAULT_OPTIONS
+) -> ElementPlan | None:
+    """Create the plan for each element of type `py_type`, `None` if there is nothing to validate.
+
+    Elements aren't memoized or tracked (see `memo` and `provenance`), only the container is.
+    """
+    annotation = TypeAnnotation.from_py_type(py_type)
+    optional = (optional_type := annotation.optional_type) is not None
+    if optional:
+        # `Annotated[X, ...] | None`
+        py_type = optional_type
+        annotation = TypeAnnotation.from_py_type(py_type)
+    metadata_plans = compile_annotated_metadata(
+        py_type, replace(options, memoize=False, provenance=False)
+    )
+    plan = None
+    if metadata_plans:
+        plan = ParameterPlan(
+            name,
+            None,
+            inspect.Parameter.empty,
+            metadata_plans,
+            folded=fold_metadata(name, metadata_plans),
+        )
+        if has_async_metadata((plan,)):
+            raise TypeError(  # noqa: TRY003
+                f"`{name}`: async validators can't validate the elements of a container."
+            )
+    elements = compile_container(name, annotation.inner, options)
+    if plan is None and elements is None:
+        return None
+    number_kinds = ""
+    if elements is None and all(
+        supports_sampling(metadata_plan.metadata) for metadata_plan in metadata_plans
+    ):
+        number_kinds = _NUMBER_KINDS.get(annotation.inner.origin, "")
+    return ElementPlan(plan, elements, optional, number_kinds, bool(options.fail_fast))
@@ -0,0 +1,158 @@
+"""Validate the objects nested in the attributes of an object.
+
+With the `deep` option, `class_annotated_validator` also validates the dataclasses, Pydantic
+models and `ValidateAnnotated` classes found in the attributes of the object, including the ones
+in lists, tuples, sets and the values of dicts, at any depth:
+
+```
+@dataclass
+class Order(ValidateAnnotated, deep=True):
+    items: list[Item]
+```
+
+Objects are remembered by their identity while an object is validated, so an object that is
+referenced more than once (or by itself) is only validated once. Objects are validated level by
+level, so the errors of an object come before the errors of the objects nested in it. Each nested
+object is validated with the plan (and options) of its own class, objects of classes that have
+validation disabled are only searched for other objects. Objects nested more than `max_depth`
+levels below the validated object aren't validated.
+
+Errors are reported with the path of the attribute relative to the validated object, which isn't
+part of the path since the outer group already names its class. The error of the `cost` of the
+fourth item of `order.items` is in the group "`items[3].cost` Validation Errors", inside
+"`Order` Validation Errors".
+"""
+
+import dataclasses
+import logging
+import weakref
+from collections import deque
+from collections.abc import Iterator
+from typing import Any, ClassVar, get_origin, get_type_hints
+
+from .base import ParameterExceptionGroup
+from .containers import ELEMENT_GROUP_SUFFIX
+from .exceptions.validator import bounded_repr
+from .plan import ClassPlan, get_class_plan
+
+logger = logging.getLogger(__name__)
+
+_field_names: "weakref.WeakKeyDictionary[type, tuple[str, ...]]" = weakref.WeakKeyDictionary()
+"""Names of the attributes that are searched for nested objects, by class."""
+
+
+def is_validated_class(cls: type) -> bool:
+    """`True` for dataclasses, Pydantic models and `ValidateAnnotated` classes."""
+    return (
+        dataclasses.is_dataclass(cls)
+        or hasattr(cls, "model_fields")
+        or hasattr(cls, "__validation_options__")
+    )
+
+
+def field_names(cls: type) -> tuple[str, ...]:
+    """Names of the attributes of `cls` that can contain nested objects, cached per class."""
+    try:
+        return _field_names[cls]
+    except KeyError:
+        pass
+    if dataclasses.is_dataclass(cls):
+        names = tuple(field.name for field in dataclasses.fields(cls))
+    elif isinstance(model_fields := getattr(cls, "model_fields", None), dict):
+        names = tuple(model_fields)
+    else:
+        names = tuple(
+            name
+            for name, py_type in get_type_hints(cls).items()
+            if get_origin(py_type) is not ClassVar and py_type is not ClassVar
+        )
+    _field_names[cls] = names
+    return names
+
+
+def _elements(value: Any, path: str) -> Iterator[tuple[Any, str]] | None:
+    """Elements of a list, tuple, set or the values of a dict with their paths, `None` otherwise."""
+    if type(value) is list or type(value) is tuple:
+        return ((item, f"{path}[{index}]") for index, item in enumerate(value))
+    if isinstance(value, dict):
+        return ((item, f"{path}[{bounded_repr(key)}]") for key, item in value.items())
+    if isinstance(value, set | frozenset):
+        return ((item, f"{path}{{{bounded_repr(item)}}}") for item in value)
+    return None
+
+
+def _nested_objects(obj: Any, path: str, visited: set[int]) -> Iterator[tuple[Any, str]]:
+    """Objects in the attributes of `obj` (and in containers in them) that weren't visited yet.
+
+    Containers are searched in place, so they don't count as a level of nesting.
+    """
+    prefix = f"{path}." if path else ""
+    stack = [(getattr(obj, name, None), f"{prefix}{name}") for name in field_names(type(obj))]
+    stack.reverse()
+    while stack:
+        value, value_path = stack.pop()
+        if id(value) in visited:
+            continue
+        if is_validated_class(type(value)):
+            visited.add(id(value))
+            yield value, value_path
+        elif (elements := _elements(value, value_path)) is not None:
+            visited.add(id(value))
+            # reversed, so elements are visited in order
+            stack.extend(reversed(list(elements)))
+
+
+def _rename(group: ExceptionGroup, prefix: str) -> ExceptionGroup:
+    """Prefix the path in the message of `group` (and of its element groups) with `prefix`."""
+    message = group.message
+    if message.endswith(ELEMENT_GROUP_SUFFIX):
+        # every sub group is the group of an element, e.g. "`values[1]` Validation Errors"
+        return ExceptionGroup(message, [_rename(error, prefix) for error in group.exceptions])
+    exceptions = [
+        _rename(error, prefix)
+        if isinstance(error, ExceptionGroup) and error.message.endswith(ELEMENT_GROUP_SUFFIX)
+        else error
+        for error in group.exceptions
+    ]
+    return ExceptionGroup(f"`{prefix}.{message[1:]}", exceptions)
+
+
+def deep_errors(
+    obj: Any, plan: ClassPlan, *, force: bool = False, max_depth: int | None = None
+) -> list[ParameterExceptionGroup]:
+    """Validate `obj` and the objects nested in its attributes, returns the errors if any.
+
+    `plan` is the plan of the class of `obj`, which is validated if it is enabled (or `force` is
+    `True`), nested objects are validated if their class has validation enabled (or `force`).
+    """
+    max_depth = plan.max_depth if max_depth is None else max_depth
+    errors: list[ParameterExceptionGroup] = []
+    visited = {id(obj)}
+    # breadth first, so each object is validated at its lowest depth (and deep object graphs don't
+    # reach the recursion limit)
+    queue: deque[tuple[Any, str, int]] = deque([(obj, "", 0)])
+    truncated = False
+    while queue:
+        value, path, depth = queue.popleft()
+        if path:
+            object_plan = get_class_plan(type(value))
+            if (object_plan.enabled or force) and (object_errors := object_plan.check(value)):
+                errors.extend(_rename(error, path) for error in object_errors)
+                if plan.fail_fast:
+                    break
+        elif (plan.enabled or force) and (object_errors := plan.check(value)):
+            errors.extend(object_errors)
+            if plan.fail_fast:
+                break
+        if depth == max_depth:
+            truncated = truncated or next(_nested_objects(value, path, visited), None) is not None
+            continue
+        queue.extend(
+            (nested, nested_path, depth + 1)
+            for nested, nested_path in _nested_objects(value, path, visited)
+        )
+    if truncated:
+        logger.warning(
+            "Objects nested deeper than %d levels in `%s` weren't validated.", max_depth, plan.name
+        )
+    return errors
@@ -1,6 +1,7 @@
 import annotated_types as at
 
-from .validator import ValidatorError
+from .array import InvalidElementsError
+from .validator import ValidatorError, bounded_repr
 
 
 class AtValidatorError(ValidatorError):
@@ -17,55 +18,134 @@ class InvalidMetadataError(AtValidatorError):
 class NotSupportedAnnotatedTypeError(AtValidatorError):
     def __init__(self, metadata: at.BaseMetadata):
         self.metadata = metadata
-        self.message = f"{metadata} is not a supported type for validation."
-        super().__init__(self.message)
+        super().__init__(metadata)
+
+    def format_message(self) -> str:
+        return f"{self.metadata} is not a supported type for validation."
 
 
 class GreaterThanError(AtValidatorError):
     def __init__(self, bound, value):
         self.bound = bound
         self.value = value
-        self.message = f"Value: {value} is not greater than the Bound: {bound}"
-        super().__init__(self.message)
+        super().__init__(bound, value)
+
+    def format_message(self) -> str:
+        return f"Value: {bounded_repr(self.value)} is not greater than the Bound: {self.bound}"
 
 
 class GreaterThanOrEqualError(AtValidatorError):
     def __init__(self, bound, value):
         self.bound = bound
         self.value = value
-        self.message = f"Value: {value} is not greater than or equal to the Bound: {bound}"
-        super().__init__(self.message)
+        super().__init__(bound, value)
+
+    def format_message(self) -> str:
+        return (
+            f"Value: {bounded_repr(self.value)} is not greater than or equal to the Bound: "
+            f"{self.bound}"
+        )
 
 
 class LessThanError(AtValidatorError):
     def __init__(self, bound, value):
         self.bound = bound
         self.value = value
-        self.message = f"Value: {value} is not less than the Bound: {bound}"
-        super().__init__(self.message)
+        super().__init__(bound, value)
+
+    def format_message(self) -> str:
+        return f"Value: {bounded_repr(self.value)} is not less than the Bound: {self.bound}"
 
 
 class LessThanOrEqualError(AtValidatorError):
     def __init__(self, bound, value):
         self.bound = bound
         self.value = value
-        self.message = f"Value: {value} is not less than or equal to the Bound: {bound}"
-        super().__init__(self.message)
+        super().__init__(bound, value)
+
+    def format_message(self) -> str:
+        return (
+            f"Value: {bounded_repr(self.value)} is not less than or equal to the "
+            f"Bound: {self.bound}"
+        )
 
 
 class MultipleOfError(AtValidatorError):
     def __init__(self, multiple, value):
         self.multiple = multiple
         self.value = value
-        self.message = f"Value: {value} is not a multiple of {multiple}"
-        super().__init__(self.message)
+        super().__init__(multiple, value)
+
+    def format_message(self) -> str:
+        return f"Value: {bounded_repr(self.value)} is not a multiple of {self.multiple}"
 
 
 class MinLenError(AtValidatorError):
     def __init__(self, min_len: int, value):
         self.min_len = min_len
         self.value = value
-        self.message = (
-            f"Length of `{value}` ({len(value)}) is less than the minimum length: {min_len}."
+        super().__init__(min_len, value)
+
+    def format_message(self) -> str:
+        return (
+            f"Length of `{bounded_repr(self.value)}` ({len(self.value)}) is less than the minimum "
+            f"length: {self.min_len}."
         )
-        super().__init__(self.message)
+
+
+def predicate_name(func) -> str:
+    """Name of a predicate function, e.g. `isfinite` or `str.isdigit`."""
+    return getattr(func, "__qualname__", None) or getattr(func, "__name__", None) or repr(func)
+
+
+class PredicateError(AtValidatorError):
+    def __init__(self, func, value):
+        self.func = func
+        self.value = value
+        super().__init__(func, value)
+
+    def format_message(self) -> str:
+        return (
+            f"Value: {bounded_repr(self.value)} doesn't satisfy the predicate: "
+            f"{predicate_name(self.func)}"
+        )
+
+
+class ArrayGreaterThanError(InvalidElementsError, GreaterThanError):
+    description = "are not greater than the Bound: {bound}"
+
+
+class ArrayGreaterThanOrEqualError(InvalidElementsError, GreaterThanOrEqualError):
+    description = "are not greater than or equal to the Bound: {bound}"
+
+
+class ArrayLessThanError(InvalidElementsError, LessThanError):
+    description = "are not less than the Bound: {bound}"
+
+
+class ArrayLessThanOrEqualError(InvalidElementsError, LessThanOrEqualError):
+    description = "are not less than or equal to the Bound: {bound}"
+
+
+class ArrayMultipleOfError(InvalidElementsError, MultipleOfError):
+    description = "are not a multiple of {bound}"
+
+    def __init__(self, multiple, value, positions):
+        self.multiple = multiple
+        super().__init__(multiple, value, positions)
+
+
+class ArrayMinLenError(InvalidElementsError, MinLenError):
+    description = "have a length less than the minimum length: {bound}"
+
+    def __init__(self, min_len: int, value, positions):
+        self.min_len = min_len
+        super().__init__(min_len, value, positions)
+
+
+class ArrayPredicateError(InvalidElementsError, PredicateError):
+    description = "don't satisfy the predicate: {bound}"
+
+    def __init__(self, func, value, positions):
+        self.func = func
+        super().__init__(predicate_name(func), value, positions)
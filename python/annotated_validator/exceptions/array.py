@@ -0,0 +1,64 @@
+"""Errors for arrays (NumPy arrays, Pandas Series) where some of the elements are invalid.
+
+NumPy is imported where it is used, so it is only loaded once an array is validated.
+"""
+
+from typing import TYPE_CHECKING, ClassVar
+
+from .validator import ValidatorError, bounded_repr
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+class InvalidElementsError(ValidatorError):
+    """Base Exception for arrays where some of the elements failed validation.
+
+    Concrete errors also inherit from the scalar error they replace (e.g. `GreaterThanError`), so
+    existing `except` clauses keep working.
+    """
+
+    description: ClassVar[str] = "are invalid for the Bound: {bound}"
+    """Completes the sentence `"<count> of <size> values ..."`."""
+    max_reported: ClassVar[int] = 10
+    """Maximum number of positions/values included in the message."""
+    sample = None
+    """Rows that were validated (`annotated_validator.sampling.Sample`), `None` if all of them."""
+
+    def __init__(self, bound, value, positions: "np.ndarray"):
+        import numpy as np
+
+        self.bound = bound
+        self.value = value
+        self.positions = positions
+        """Flat positions of all invalid elements."""
+        self.count = len(positions)
+        self.size = int(np.size(value))
+        ValidatorError.__init__(self, bound, value, positions)
+
+    @property
+    def original_positions(self) -> "np.ndarray":
+        """Flat positions of the invalid elements in the value before it was sampled."""
+        if self.sample is None:
+            return self.positions
+        import numpy as np
+
+        row_size = max(self.size // max(len(self.sample.positions), 1), 1)
+        rows, offsets = np.divmod(self.positions, row_size)
+        return self.sample.positions[rows] * row_size + offsets
+
+    def format_message(self) -> str:
+        import numpy as np
+
+        reported_positions = self.positions[: self.max_reported]
+        reported_values = np.asarray(self.value).ravel()[reported_positions]
+        values = ", ".join(bounded_repr(value) for value in reported_values.tolist())
+        counted = f"{self.count} of {self.size}"
+        if self.sample is not None:
+            counted = f"{counted} sampled"
+            reported_positions = self.original_positions[: self.max_reported]
+        return (
+            f"{counted} values {self.description.format(bound=self.bound)}. "
+            f"Invalid positions (first {len(reported_positions)}): {reported_positions.tolist()}, "
+            f"values: [{values}]"
+        )
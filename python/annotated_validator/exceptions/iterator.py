@@ -0,0 +1,43 @@
+"""Errors from iterators that are validated while they are consumed."""
+
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+from .validator import ValidationErrorGroup
+
+
+class IteratorValidationErrorGroup(ValidationErrorGroup):
+    """Raised by a validated iterator when an item (or a chunk of a Dataframe) is invalid.
+
+    `index` is the position of the invalid item in the iterator and `offset` is the number of rows
+    in the items before it (the same as `index` for items without rows).
+    """
+
+    def __new__(
+        cls,
+        message: str,
+        exceptions: Sequence[Exception],
+        checked: Mapping[str, Any],
+        index: int = 0,
+        offset: int = 0,
+    ):
+        group = super().__new__(cls, message, exceptions, checked)
+        group.index = index
+        group.offset = offset
+        return group
+
+    def __init__(
+        self,
+        message: str,
+        exceptions: Sequence[Exception],
+        checked: Mapping[str, Any],
+        index: int = 0,  # noqa: ARG002
+        offset: int = 0,  # noqa: ARG002
+    ):
+        # `index` and `offset` are set by `__new__`
+        super().__init__(message, exceptions, checked)
+
+    def derive(self, excs: Sequence[Exception]) -> "IteratorValidationErrorGroup":
+        return IteratorValidationErrorGroup(
+            self.message, excs, self.checked, self.index, self.offset
+        )
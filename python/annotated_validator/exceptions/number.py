@@ -1,6 +1,7 @@
 """Errors from the `number_validators` module."""
 
-from .validator import ValidatorError
+from .array import InvalidElementsError
+from .validator import ValidatorError, bounded_repr
 
 
 class LowBoundError(ValidatorError):
@@ -9,8 +10,10 @@ class LowBoundError(ValidatorError):
     def __init__(self, bound: int, value: int):
         self.bound = bound
         self.value = value
-        self.message = f"{value} is smaller than the lower bound: {bound}"
-        super().__init__(self.message)
+        super().__init__(bound, value)
+
+    def format_message(self) -> str:
+        return f"{bounded_repr(self.value)} is smaller than the lower bound: {self.bound}"
 
 
 class HighBoundError(ValidatorError):
@@ -19,5 +22,19 @@ class HighBoundError(ValidatorError):
     def __init__(self, bound: int, value: int):
         self.bound = bound
         self.value = value
-        self.message = f"{value} is larger than the higher bound: {bound}"
-        super().__init__(self.message)
+        super().__init__(bound, value)
+
+    def format_message(self) -> str:
+        return f"{bounded_repr(self.value)} is larger than the higher bound: {self.bound}"
+
+
+class ArrayLowBoundError(InvalidElementsError, LowBoundError):
+    """Error when numbers in an array are smaller than the lower bound."""
+
+    description = "are smaller than the lower bound: {bound}"
+
+
+class ArrayHighBoundError(InvalidElementsError, HighBoundError):
+    """Error when numbers in an array are larger than the higher bound."""
+
+    description = "are larger than the higher bound: {bound}"
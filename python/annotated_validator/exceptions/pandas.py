@@ -8,8 +8,10 @@ class RequiredColumnDoesntExistError(ValidatorError):
 
     def __init__(self, required_column: str):
         self.required_column = required_column
-        self.message = f"Required column `{required_column}` doesn't exist in the dataframe."
-        super().__init__(self.message)
+        super().__init__(required_column)
+
+    def format_message(self) -> str:
+        return f"Required column `{self.required_column}` doesn't exist in the dataframe."
 
 
 class RequiredColumnTypeMismatchError(ValidatorError):
@@ -19,5 +21,7 @@ class RequiredColumnTypeMismatchError(ValidatorError):
         self.column_name = column_name
         self.required_type = required_type
         self.current_type = current_type
-        self.message = f"Type mismatch for required column `{column_name}`: Required Type: {required_type}, Current Type: {current_type}. Can set required type to `object` if you do not wish to enforce type."
-        super().__init__(self.message)
+        super().__init__(column_name, required_type, current_type)
+
+    def format_message(self) -> str:
+        return f"Type mismatch for required column `{self.column_name}`: Required Type: {self.required_type}, Current Type: {self.current_type}. Can set required type to `object` if you do not wish to enforce type."
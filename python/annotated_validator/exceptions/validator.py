@@ -1,10 +1,83 @@
 """Base Exception for all Validator Errors."""
 
+import reprlib
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+_bounded_repr = reprlib.Repr()
+_bounded_repr.maxstring = 80
+_bounded_repr.maxother = 80
+_bounded_repr.maxlong = 40
+
+
+def bounded_repr(value: Any) -> str:
+    """Repr of `value` that doesn't grow with the size of the data.
+
+    Arrays and Dataframes (anything with a `shape`) only show their type and shape.
+    """
+    if getattr(value, "ndim", 0) > 0 and (shape := getattr(value, "shape", None)) is not None:
+        return f"<{value.__class__.__name__} shape={shape}>"
+    return _bounded_repr.repr(value)
+
 
 class ValidatorError(Exception):
     """Base Exception for all Validator Errors.
 
     Errors that inherit from this Exception are collected in an Exception Group during validation.
+
+    Messages are only formatted when they are used (`message`, `str()`), subclasses implement
+    `format_message` and store references to the values in `__init__`. A message can still be
+    assigned directly (`self.message = "..."`).
+    """
+
+    _message: str | None = None
+
+    def format_message(self) -> str:
+        """Create the message, called the first time `message` is used."""
+        return super().__str__()
+
+    @property
+    def message(self) -> str:
+        """Description of the error."""
+        if self._message is None:
+            self._message = self.format_message()
+        return self._message
+
+    @message.setter
+    def message(self, message: str) -> None:
+        self._message = message
+
+    def __str__(self) -> str:
+        return self.message
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.message!r})"
+
+
+class ValidationErrorGroup(ExceptionGroup):
+    """Raised when the parameters or return value of a function are invalid.
+
+    The values that were checked are stored in `checked` and only included (with bounded reprs)
+    when the group is converted to a string.
     """
 
-    ...
+    def __new__(cls, message: str, exceptions: Sequence[Exception], checked: Mapping[str, Any]):
+        group = super().__new__(cls, message, exceptions)
+        group.checked = checked
+        return group
+
+    def __init__(
+        self,
+        message: str,
+        exceptions: Sequence[Exception],
+        checked: Mapping[str, Any],  # noqa: ARG002
+    ):
+        # `checked` is set by `__new__`
+        super().__init__(message, exceptions)
+
+    def derive(self, excs: Sequence[Exception]) -> "ValidationErrorGroup":
+        return ValidationErrorGroup(self.message, excs, self.checked)
+
+    def __str__(self) -> str:
+        checked = ", ".join(f"{name}={bounded_repr(value)}" for name, value in self.checked.items())
+        return f"{super().__str__()} Checked: {checked}"
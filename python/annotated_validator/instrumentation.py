@@ -0,0 +1,227 @@
+"""Measure how long each validator takes, and how often it fails.
+
+Hooks are called after every check with the `CheckKey` (function or class, parameter and type of
+the validator), the duration in seconds and whether the value was invalid. `ValidatorStats` is a
+hook that keeps call and failure counts, cumulative time and the 99th percentile of recent calls.
+Span factories return a context manager that is entered around each check, e.g. a tracing span:
+
+```
+stats = ValidatorStats()
+add_hook(stats)
+add_span_factory(lambda key: tracer.start_as_current_span(f"validate {key.parameter}"))
+set_slow_threshold(0.01)
+```
+
+Checks are only instrumented if a hook, a span factory or a slow threshold is set when the plan
+is built (functions when they are decorated, classes when the first instance is validated), so
+instrumentation doesn't cost anything otherwise. Instrumented plans are always interpreted
+(`generate_code` is ignored) and bounds aren't folded (see `bounds`), since both skip some checks.
+Iterator items aren't instrumented.
+"""
+
+import collections
+import contextlib
+import logging
+import math
+import threading
+import time
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import AbstractContextManager
+from typing import Any, NamedTuple, TypeAlias, TypeVar
+
+logger = logging.getLogger(__name__)
+
+
+class CheckKey(NamedTuple):
+    """Identifies the checks of a validator on a parameter."""
+
+    owner: str
+    """Qualified name of the function or class (with its module)."""
+    parameter: str
+    """Name of the parameter or attribute (`return` for the return value)."""
+    validator: str
+    """Name of the type of the metadata, e.g. `Gt` or `RequiredColumns`."""
+
+
+Hook: TypeAlias = Callable[[CheckKey, float, bool], Any]
+"""Called after each check with its key, the duration in seconds and `True` if it failed."""
+
+SpanFactory: TypeAlias = Callable[[CheckKey], AbstractContextManager]
+"""Returns a context manager that is entered around each check."""
+
+_hooks: list[Hook] = []
+_span_factories: list[SpanFactory] = []
+_slow_threshold: float | None = None
+
+
+def add_hook(hook: Hook) -> None:
+    """Call `hook` after each instrumented check.
+
+    Only plans built while a hook, span factory or slow threshold is set are instrumented, so
+    functions decorated (and classes first validated) before the first one is added aren't.
+    """
+    _hooks.append(hook)
+
+
+def remove_hook(hook: Hook) -> None:
+    """Stop calling `hook`."""
+    _hooks.remove(hook)
+
+
+def add_span_factory(span_factory: SpanFactory) -> None:
+    """Enter the context manager returned by `span_factory` around each instrumented check.
+
+    Like hooks, spans are only entered around the checks of plans that were built while
+    instrumentation was active (see `add_hook`).
+    """
+    _span_factories.append(span_factory)
+
+
+def remove_span_factory(span_factory: SpanFactory) -> None:
+    """Stop using `span_factory`."""
+    _span_factories.remove(span_factory)
+
+
+def set_slow_threshold(seconds: float | None) -> None:
+    """Log a warning for checks that take at least `seconds`, `None` doesn't log anything.
+
+    Only checks of plans that were built while instrumentation was active are timed (see
+    `add_hook`).
+    """
+    global _slow_threshold
+    _slow_threshold = seconds
+
+
+def is_active() -> bool:
+    """`True` if plans that are built now should be instrumented."""
+    return bool(_hooks or _span_factories or _slow_threshold is not None)
+
+
+def _record(key: CheckKey, seconds: float, failed: bool) -> None:
+    # hooks and spans are read on every call, so they can change after plans are built
+    for hook in _hooks:
+        hook(key, seconds, failed)
+    if _slow_threshold is not None and seconds >= _slow_threshold:
+        logger.warning(
+            "Validating `%s` of `%s` with %s took %.3f ms.",
+            key.parameter,
+            key.owner,
+            key.validator,
+            seconds * 1e3,
+        )
+
+
+@contextlib.contextmanager
+def _spans(key: CheckKey) -> Iterator[None]:
+    with contextlib.ExitStack() as stack:
+        for span_factory in _span_factories:
+            stack.enter_context(span_factory(key))
+        yield
+
+
+def instrumented_check(key: CheckKey, check: Callable, is_async: bool = False) -> Callable:
+    """Wrap `check` so every call is recorded by the hooks (and run in spans)."""
+    if is_async:
+
+        async def timed_async(value: Any) -> Any:
+            start = time.perf_counter()
+            errors = await check(value)
+            _record(key, time.perf_counter() - start, bool(errors))
+            return errors
+
+        async def instrumented_async(value: Any) -> Any:
+            if not _span_factories:
+                return await timed_async(value)
+            with _spans(key):
+                return await timed_async(value)
+
+        return instrumented_async
+
+    def timed(value: Any) -> Any:
+        start = time.perf_counter()
+        errors = check(value)
+        _record(key, time.perf_counter() - start, bool(errors))
+        return errors
+
+    def instrumented(value: Any) -> Any:
+        if not _span_factories:
+            return timed(value)
+        with _spans(key):
+            return timed(value)
+
+    return instrumented
+
+
+Plan = TypeVar("Plan")
+
+
+def instrument_plans(owner: str, param_plans: Iterable[Plan]) -> list[Plan]:
+    """Instrument the metadata checks of each `ParameterPlan` in `param_plans`."""
+    return [
+        param_plan._replace(
+            metadata=tuple(
+                metadata_plan._replace(
+                    check=instrumented_check(
+                        CheckKey(owner, param_plan.name, type(metadata_plan.metadata).__name__),
+                        metadata_plan.check,
+                        metadata_plan.is_async,
+                    )
+                )
+                for metadata_plan in param_plan.metadata
+            ),
+            # folded bounds would skip the instrumented checks
+            folded=None,
+        )
+        for param_plan in param_plans
+    ]
+
+
+class CheckSummary(NamedTuple):
+    """Statistics of the checks with the same `CheckKey`."""
+
+    calls: int
+    """Number of checks."""
+    failures: int
+    """Number of checks that found an invalid value."""
+    total_seconds: float
+    """Cumulative duration of every check."""
+    p99_seconds: float
+    """99th percentile of the duration of recent checks (see `ValidatorStats.window`)."""
+
+
+class ValidatorStats:
+    """Hook that keeps statistics per `CheckKey`, see `summary`."""
+
+    def __init__(self, window: int = 1024):
+        self.window = window
+        """Number of recent durations kept for each key, used for the percentile."""
+        self._counts: dict[CheckKey, list] = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, key: CheckKey, seconds: float, failed: bool) -> None:
+        """Record a check."""
+        with self._lock:
+            if (counts := self._counts.get(key)) is None:
+                counts = self._counts[key] = [0, 0, 0.0, collections.deque(maxlen=self.window)]
+            counts[0] += 1
+            counts[1] += failed
+            counts[2] += seconds
+            counts[3].append(seconds)
+
+    def summary(self) -> dict[CheckKey, CheckSummary]:
+        """Statistics of every key that was checked."""
+        with self._lock:
+            return {
+                key: CheckSummary(calls, failures, total, _percentile(recent, 0.99))
+                for key, (calls, failures, total, recent) in self._counts.items()
+            }
+
+    def clear(self) -> None:
+        """Remove all of the statistics."""
+        with self._lock:
+            self._counts.clear()
+
+
+def _percentile(durations: Iterable[float], percentile: float) -> float:
+    ordered = sorted(durations)
+    return ordered[max(0, math.ceil(percentile * len(ordered)) - 1)] if ordered else 0.0
@@ -0,0 +1,181 @@
+"""Skip validation of immutable values that were already valid.
+
+With the `memoize` option, each check of a plan remembers the values it found valid in a shared,
+bounded LRU cache, so a function that receives the same frozen config, enum member or small int
+again and again only validates it once. Only values that can't change are cached (see
+`cache_key`), and validators that depend on anything other than the value can opt out with
+`BaseMetaValidator.memoizable`. Errors aren't cached, an invalid value is validated every time so
+every call raises new exceptions.
+"""
+
+import dataclasses
+import datetime
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from decimal import Decimal
+from enum import Enum
+from fractions import Fraction
+from typing import Any, NamedTuple, TypeAlias
+
+from .base import BaseMetaValidator
+
+Check: TypeAlias = Callable[[Any], Any]
+"""Validates a value, returns the errors if there are any (a falsy value if it is valid)."""
+
+IMMUTABLE_TYPES = frozenset(
+    {
+        type(None),
+        bool,
+        int,
+        float,
+        complex,
+        str,
+        bytes,
+        range,
+        Decimal,
+        Fraction,
+        datetime.date,
+        datetime.datetime,
+        datetime.time,
+        datetime.timedelta,
+    }
+)
+"""Types that are cached by value. Subclasses aren't included, they can have mutable attributes."""
+
+DEFAULT_MAX_SIZE = 4096
+"""Number of valid results that are kept by default."""
+
+
+class CacheStats(NamedTuple):
+    """Usage of the validation cache since it was created (or cleared)."""
+
+    hits: int
+    """Validations that were skipped because the value was already valid."""
+    misses: int
+    """Validations of cacheable values that weren't in the cache."""
+    evictions: int
+    """Least recently used values that were removed to keep the cache within `max_size`."""
+    size: int
+    """Number of valid results in the cache."""
+    max_size: int
+    """Maximum number of valid results in the cache."""
+
+
+class ValidationCache:
+    """Bounded LRU cache of the (check, value) pairs that were valid."""
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE):
+        if max_size < 0:
+            raise ValueError(f"`max_size`: {max_size} must be greater than or equal to 0.")  # noqa: TRY003
+        self.max_size = max_size
+        """Maximum number of valid results in the cache."""
+        self._valid: OrderedDict[Hashable, None] = OrderedDict()
+        # checks can run on the `parallel` thread pool
+        self._lock = threading.Lock()
+        self._hits = self._misses = self._evictions = 0
+
+    def __contains__(self, key: Hashable) -> bool:
+        """`True` if `key` was valid, it becomes the most recently used key."""
+        with self._lock:
+            if key in self._valid:
+                self._valid.move_to_end(key)
+                self._hits += 1
+                return True
+            self._misses += 1
+            return False
+
+    def add(self, key: Hashable) -> None:
+        """Remember that `key` is valid, evicting the least recently used keys if it is full."""
+        with self._lock:
+            self._valid[key] = None
+            self._evict()
+
+    def _evict(self) -> None:
+        while len(self._valid) > self.max_size:
+            self._valid.popitem(last=False)
+            self._evictions += 1
+
+    def resize(self, max_size: int) -> None:
+        """Change `max_size`, evicting the least recently used keys that don't fit."""
+        if max_size < 0:
+            raise ValueError(f"`max_size`: {max_size} must be greater than or equal to 0.")  # noqa: TRY003
+        with self._lock:
+            self.max_size = max_size
+            self._evict()
+
+    def clear(self) -> None:
+        """Remove every key and reset the statistics."""
+        with self._lock:
+            self._valid.clear()
+            self._hits = self._misses = self._evictions = 0
+
+    def stats(self) -> CacheStats:
+        """Current usage of the cache."""
+        with self._lock:
+            return CacheStats(
+                self._hits, self._misses, self._evictions, len(self._valid), self.max_size
+            )
+
+
+_cache = ValidationCache()
+
+
+def get_cache() -> ValidationCache:
+    """Cache shared by every plan with the `memoize` option."""
+    return _cache
+
+
+def cache_key(value: Any) -> Hashable | None:
+    """Key of an immutable value, `None` if the value is mutable (or might be).
+
+    Keys include the type of the value, so `1`, `1.0` and `True` (which are equal) are validated
+    separately. Tuples, frozensets and frozen dataclasses are immutable if all of their items are.
+    """
+    value_type = type(value)
+    if value_type in IMMUTABLE_TYPES or isinstance(value, Enum):
+        return value_type, value
+    if value_type is tuple or (isinstance(value, tuple) and hasattr(value_type, "_fields")):
+        items = tuple(cache_key(item) for item in value)
+    elif value_type is frozenset:
+        items = frozenset(cache_key(item) for item in value)
+    elif dataclasses.is_dataclass(value) and value_type.__dataclass_params__.frozen:
+        items = tuple(cache_key(getattr(value, field.name)) for field in dataclasses.fields(value))
+    else:
+        return None
+    if None in items:
+        return None
+    return value_type, items
+
+
+def is_memoizable(metadata: Any) -> bool:
+    """`True` if valid results of `metadata` should be cached.
+
+    Validators can opt out with `memoizable`. `annotated_types` constraints are a single
+    comparison, which is faster than looking up the cache, so they aren't cached.
+    """
+    return isinstance(metadata, BaseMetaValidator) and metadata.memoizable
+
+
+def memoized_check(check: Check) -> Check:
+    """Wrap `check` so values it found valid aren't validated again (with the shared cache).
+
+    Values that aren't immutable (see `cache_key`) are always validated.
+    """
+
+    def memoized(value: Any) -> Any:
+        if (value_key := cache_key(value)) is None:
+            return check(value)
+        key = (check, value_key)
+        try:
+            if key in _cache:
+                return None
+        except TypeError:
+            # e.g. `Decimal("sNaN")` can't be hashed
+            return check(value)
+        if errors := check(value):
+            return errors
+        _cache.add(key)
+        return None
+
+    return memoized
@@ -2,17 +2,29 @@
 
 import logging
 from dataclasses import dataclass
+from typing import ClassVar
 
-from ..exceptions.number import HighBoundError, LowBoundError
+from ..annotated_types_validators.array import invalid_positions, is_array
+from ..base import BaseMetaValidator
+from ..exceptions.number import (
+    ArrayHighBoundError,
+    ArrayLowBoundError,
+    HighBoundError,
+    LowBoundError,
+)
 from ..exceptions.validator import ValidatorError
-from ..validator import Validator
 
 logger = logging.getLogger(__name__)
 
 
 @dataclass
-class NumberRange(Validator):
-    """Validates that a number is within an upper/lower bound."""
+class NumberRange(BaseMetaValidator):
+    """Validates that a number is within an upper/lower bound.
+
+    NumPy arrays and Pandas Series are validated element-wise.
+    """
+
+    supports_sampling: ClassVar[bool] = True
 
     low: int | float | None
     high: int | float | None
@@ -20,7 +32,7 @@ class NumberRange(Validator):
     high_inclusive: bool = True
 
     def __post_init__(self):
-        if not (self.low and self.high):
+        if self.low is None or self.high is None:
             return
         if self.low > self.high:
             logger.warning(
@@ -32,20 +44,34 @@ class NumberRange(Validator):
             self.low = self.high
 
     def _lower_bound(self, number: int | float) -> bool:
-        if not self.low:
+        if self.low is None:
             return True
         if self.low_inclusive:
             return self.low <= number
         return self.low < number
 
     def _higher_bound(self, number: int | float) -> bool:
-        if not self.high:
+        if self.high is None:
             return True
         if self.high_inclusive:
             return self.high >= number
         return self.high > number
 
-    def validate(self, number: int | float) -> None | ExceptionGroup[ValidatorError]:
+    def _validate_array(self, numbers) -> ExceptionGroup[ValidatorError] | None:
+        exceptions = []
+        if self.low is not None:
+            positions = invalid_positions(~self._lower_bound(numbers))
+            if positions.size:
+                exceptions.append(ArrayLowBoundError(self.low, numbers, positions))
+        if self.high is not None:
+            positions = invalid_positions(~self._higher_bound(numbers))
+            if positions.size:
+                exceptions.append(ArrayHighBoundError(self.high, numbers, positions))
+        return ExceptionGroup("number_range", exceptions) if exceptions else None
+
+    def validate(self, number: int | float) -> ExceptionGroup[ValidatorError] | None:
+        if is_array(number):
+            return self._validate_array(number)
         exceptions = []
         if not self._lower_bound(number):
             exceptions.append(LowBoundError(bound=self.low, value=number))
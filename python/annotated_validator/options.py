@@ -0,0 +1,142 @@
+"""Options that change how validation plans are built and run."""
+
+import os
+from collections.abc import Mapping
+from dataclasses import dataclass, fields, replace
+from typing import Any
+
+ENABLED_VARIABLE = "ANNOTATED_VALIDATOR_ENABLED"
+"""Environment variable that disables all validation when set to `0`, `false`, `no` or `off`."""
+
+DISABLED_MODULES_VARIABLE = "ANNOTATED_VALIDATOR_DISABLED_MODULES"
+"""Environment variable with a comma separated list of modules (and packages) to not validate."""
+
+_FALSE_VALUES = frozenset({"0", "false", "no", "off"})
+
+
+@dataclass(frozen=True)
+class ValidationOptions:
+    """Options used when building the validation plan of a function or class.
+
+    Functions receive options through `validate_annotated`, classes that inherit from
+    `ValidateAnnotated` receive them as class keywords (`class Item(ValidateAnnotated,
+    generate_code=True)`) and any other class can set a `__validation_options__` attribute.
+
+    Options that are `None` use the options of the module the function or class is defined in
+    (see `set_module_options`), and then the global value (see `set_global_options`).
+    """
+
+    generate_code: bool | None = None
+    """Generate a specialized Python function for the plan instead of interpreting it."""
+    fail_fast: bool | None = None
+    """Stop at the first invalid metadata instead of collecting every error."""
+    enabled: bool | None = None
+    """Validate at all. When `False` functions aren't wrapped and classes skip validation."""
+    offload: bool | None = None
+    """In `async def` functions, run synchronous validators of arrays and Dataframes in a thread."""
+    parallel: bool | None = None
+    """Validate large values on a shared thread pool (see `annotated_validator.parallel`)."""
+    parallel_threshold: int | None = None
+    """Minimum number of elements (`value.size`) for a value to be validated on the thread pool."""
+    memoize: bool | None = None
+    """Skip immutable values that were already valid (see `annotated_validator.memo`)."""
+    provenance: bool | None = None
+    """Skip objects that were already valid (see `annotated_validator.provenance`)."""
+    strict_provenance: bool | None = None
+    """With `provenance`, only skip objects that can't have changed since they were validated."""
+    deep: bool | None = None
+    """Classes also validate the objects in their attributes (see `annotated_validator.deep`)."""
+    max_depth: int | None = None
+    """With `deep`, number of nested objects below the validated object that are validated."""
+
+    def merge(self, options: "ValidationOptions") -> "ValidationOptions":
+        """Replace these options with the options that are set in `options`."""
+        return replace(
+            self,
+            **{
+                field.name: value
+                for field in fields(options)
+                if (value := getattr(options, field.name)) is not None
+            },
+        )
+
+    def resolve(self, module: str | None = None) -> "ValidationOptions":
+        """Replace options that aren't set with the options of `module` and the global options.
+
+        Options of a package also apply to its modules (`pkg` applies to `pkg.fast`).
+        """
+        options = _global_options
+        if module is not None and _module_options:
+            parts = module.split(".")
+            for end in range(1, len(parts) + 1):
+                if (module_options := _module_options.get(".".join(parts[:end]))) is not None:
+                    options = options.merge(module_options)
+        return options.merge(self)
+
+
+OPTION_NAMES = frozenset(field.name for field in fields(ValidationOptions))
+"""Names of all of the options, used to separate options from other keywords."""
+
+DEFAULT_OPTIONS = ValidationOptions()
+"""Options used when none are provided."""
+
+
+def options_from_environment(environ: Mapping[str, str]) -> tuple[bool, list[str]]:
+    """Read whether validation is enabled and the disabled modules from environment variables."""
+    enabled = environ.get(ENABLED_VARIABLE, "1").strip().lower() not in _FALSE_VALUES
+    disabled_modules = [
+        module.strip()
+        for module in environ.get(DISABLED_MODULES_VARIABLE, "").split(",")
+        if module.strip()
+    ]
+    return enabled, disabled_modules
+
+
+_enabled, _disabled_modules = options_from_environment(os.environ)
+_global_options = ValidationOptions(
+    generate_code=False,
+    fail_fast=False,
+    enabled=_enabled,
+    offload=False,
+    parallel=False,
+    parallel_threshold=100_000,
+    memoize=False,
+    provenance=False,
+    strict_provenance=False,
+    deep=False,
+    max_depth=32,
+)
+_module_options: dict[str, ValidationOptions] = {
+    module: ValidationOptions(enabled=False) for module in _disabled_modules
+}
+
+
+def get_global_options() -> ValidationOptions:
+    """Options used for every plan when they aren't set on the function, class or module."""
+    return _global_options
+
+
+def set_global_options(**options: Any) -> None:
+    """Change the global options, e.g. `set_global_options(fail_fast=True)`.
+
+    Options are resolved when a plan is built: functions are planned when they are decorated and
+    classes when the first instance is validated, so set global options before either happens.
+    `enabled` is also read when a class that inherits from `ValidateAnnotated` is created.
+    """
+    global _global_options
+    _global_options = replace(_global_options, **options)
+
+
+def get_module_options(module: str) -> ValidationOptions:
+    """Options set for `module` (not including the options of its packages)."""
+    return _module_options.get(module, DEFAULT_OPTIONS)
+
+
+def set_module_options(module: str, **options: Any) -> None:
+    """Change the options of a module or package.
+
+    E.g. `set_module_options(__name__, enabled=False)` disables validation in a module. Options of
+    a module take priority over the global options, like the global options they must be set
+    before the functions and classes in the module are planned.
+    """
+    _module_options[module] = replace(get_module_options(module), **options)
@@ -0,0 +1,84 @@
+"""Apache Arrow `Table` and `RecordBatch` backend for `RequiredColumns`.
+
+Only imported when an Arrow value is validated, `pyarrow` is an optional dependency. Dtypes are
+compared with the Arrow schema and bounds use Arrow compute kernels, so columns aren't converted.
+"""
+
+from collections.abc import Iterable
+from typing import Any
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from .backends import Column, ColumnBackend
+
+_KERNELS = {"lt": pc.less, "le": pc.less_equal, "gt": pc.greater, "ge": pc.greater_equal}
+"""`operator` name -> Arrow compute function."""
+
+
+def _field_index(schema: pa.Schema, column_name: str) -> int | None:
+    # duplicate column names use the first column, the same as Pandas
+    indices = schema.get_all_field_indices(column_name)
+    return indices[0] if indices else None
+
+
+class ArrowBackend(ColumnBackend):
+    """Arrow tables and record batches, nulls are valid (the same as missing values in Pandas)."""
+
+    name = "pyarrow"
+
+    def fingerprint(self, value: Any, column_names: Iterable[str]) -> tuple[Any, ...]:
+        schema = value.schema
+        return tuple(
+            schema.field(index).type
+            if (index := _field_index(schema, column_name)) is not None
+            else None
+            for column_name in column_names
+        )
+
+    def dtype_matches(self, required: Any, current: Any) -> bool:
+        """Strings are Arrow aliases (e.g. `"int64"`, `"float64"`, `"string"`) or type names."""
+        if isinstance(required, str):
+            try:
+                required = pa.type_for_alias(required)
+            except ValueError:
+                # e.g. `"timestamp[ms]"`, which isn't an alias
+                return str(current) == required
+        return current == required
+
+    def row_count(self, value: Any) -> int:
+        return value.num_rows
+
+    def column(self, value: Any, column_name: str) -> Column:
+        return value.column(_field_index(value.schema, column_name))
+
+    def take(self, column: Column, positions: np.ndarray) -> Column:
+        return column.take(positions)
+
+    def compare(self, column: Column, comparison: str, bound: Any) -> Column:
+        return _KERNELS[comparison](column, bound)
+
+    def lengths(self, column: Column) -> Column:
+        column_type = column.type
+        if pa.types.is_string(column_type) or pa.types.is_large_string(column_type):
+            return pc.utf8_length(column)
+        if pa.types.is_binary(column_type) or pa.types.is_large_binary(column_type):
+            return pc.binary_length(column)
+        if (
+            pa.types.is_list(column_type)
+            or pa.types.is_large_list(column_type)
+            or pa.types.is_fixed_size_list(column_type)
+        ):
+            return pc.list_value_length(column)
+        raise TypeError(f"Elements of a `{column_type}` column don't have a length.")  # noqa: TRY003
+
+    def true_positions(self, mask: Column) -> np.ndarray:
+        return np.flatnonzero(np.asarray(pc.fill_null(mask, False)))
+
+    def to_numpy(self, column: Column) -> np.ndarray:
+        # zero-copy for numeric columns without nulls
+        return np.asarray(column)
+
+
+ARROW_BACKEND = ArrowBackend()
@@ -0,0 +1,246 @@
+"""Dataframe libraries that `RequiredColumns` can validate.
+
+A backend reads the schema and the columns of one type of Dataframe without converting it, and
+provides the element-wise operations used by value constraints. The backend is chosen by the
+module of the type of the value, so a library is never imported just to check the type:
+
+- Pandas `DataFrame` (and anything else), see `PandasBackend`.
+- Apache Arrow `Table` and `RecordBatch`, see `arrow_backend`.
+- Polars `DataFrame`, see `polars_backend`.
+"""
+
+import operator
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterable
+from typing import TYPE_CHECKING, Any, ClassVar, TypeAlias
+
+import annotated_types as at
+
+from ..annotated_types_validators import get_at_validators, unsuported_validator
+from ..annotated_types_validators.array import invalid_positions
+from ..base import ValidatorExceptionGroup
+from ..exceptions.annotated_types import (
+    ArrayGreaterThanError,
+    ArrayGreaterThanOrEqualError,
+    ArrayLessThanError,
+    ArrayLessThanOrEqualError,
+)
+from ..exceptions.number import ArrayHighBoundError, ArrayLowBoundError
+from ..number_validators import NumberRange
+from ..plan import compile_metadata
+
+if TYPE_CHECKING:
+    import numpy as np
+
+Column: TypeAlias = Any
+"""A column of a Dataframe in the native type of its library (e.g. `pd.Series`, `pa.Array`)."""
+
+ColumnCheck: TypeAlias = Callable[[Column], ValidatorExceptionGroup | None]
+"""Validates all of the values in a column, returns the errors if there are any."""
+
+_COMPARISONS: dict[type, tuple[str, str, type]] = {
+    at.Gt: ("gt", "le", ArrayGreaterThanError),
+    at.Ge: ("ge", "lt", ArrayGreaterThanOrEqualError),
+    at.Lt: ("lt", "ge", ArrayLessThanError),
+    at.Le: ("le", "gt", ArrayLessThanOrEqualError),
+}
+"""Metadata type -> (bound attribute, comparison that fails, error)."""
+
+_NATIVE_BOUND_TYPES = (int, float)
+"""Bounds that every backend can compare with a column, other bounds use `to_numpy`."""
+
+
+class ColumnBackend(ABC):
+    """Reads the schema and columns of one type of Dataframe for `RequiredColumns`."""
+
+    name: ClassVar[str] = ""
+    """Name of the library."""
+
+    @abstractmethod
+    def fingerprint(self, value: Any, column_names: Iterable[str]) -> tuple[Any, ...]:
+        """Current dtype of each column (`None` if it doesn't exist), only reads the schema."""
+        ...
+
+    def dtype_matches(self, required: Any, current: Any) -> bool:
+        """`True` if the `current` dtype of a column is the `required` dtype."""
+        return required == current
+
+    def row_count(self, value: Any) -> int:
+        """Number of rows in the Dataframe."""
+        return len(value)
+
+    @abstractmethod
+    def column(self, value: Any, column_name: str) -> Column:
+        """The first column named `column_name`."""
+        ...
+
+    @abstractmethod
+    def take(self, column: Column, positions: "np.ndarray") -> Column:
+        """Rows of `column` at `positions`."""
+        ...
+
+    @abstractmethod
+    def compare(self, column: Column, comparison: str, bound: Any) -> Column:
+        """Element-wise `column <comparison> bound`, `comparison` is a name from `operator`."""
+        ...
+
+    @abstractmethod
+    def lengths(self, column: Column) -> Column:
+        """Length of each element, raises `TypeError` if the elements don't have one."""
+        ...
+
+    @abstractmethod
+    def true_positions(self, mask: Column) -> "np.ndarray":
+        """Positions where the boolean `mask` is `True`, missing values are `False`."""
+        ...
+
+    @abstractmethod
+    def to_numpy(self, column: Column) -> "np.ndarray":
+        """`column` as a NumPy array, used for metadata without a native operation.
+
+        Nulls become `NaN` (`None` for columns that aren't numeric), as in Pandas.
+        """
+        ...
+
+    def compile_check(self, metadata: Any) -> ColumnCheck | None:
+        """Create the check for metadata that isn't a length constraint.
+
+        Bounds (`annotated_types` comparisons and `NumberRange`) are compared by the library, any
+        other metadata validates the column converted with `to_numpy`.
+        """
+        if (check := _compile_bounds_check(self, metadata)) is not None:
+            return check
+        if (metadata_plan := compile_metadata(metadata)) is None:
+            return None
+        numpy_check = metadata_plan.check
+        return lambda column: numpy_check(self.to_numpy(column))
+
+
+class PandasBackend(ColumnBackend):
+    """Pandas Dataframes, Series are validated by the same validators as any other value."""
+
+    name = "pandas"
+
+    def fingerprint(self, value: Any, column_names: Iterable[str]) -> tuple[Any, ...]:
+        import numpy as np
+
+        dtypes = value.dtypes
+        columns = dtypes.index
+        dtype_values = dtypes.to_numpy()
+        fingerprint = []
+        for column_name in column_names:
+            if column_name not in columns:
+                fingerprint.append(None)
+                continue
+            dtype = dtype_values[columns.get_loc(column_name)]
+            # duplicate column names return all of their dtypes, use the first one
+            fingerprint.append(dtype[0] if isinstance(dtype, np.ndarray) else dtype)
+        return tuple(fingerprint)
+
+    def column(self, value: Any, column_name: str) -> Column:
+        return value[column_name]
+
+    def take(self, column: Column, positions: "np.ndarray") -> Column:
+        return column.iloc[positions]
+
+    def compare(self, column: Column, comparison: str, bound: Any) -> Column:
+        return getattr(operator, comparison)(column, bound)
+
+    def lengths(self, column: Column) -> Column:
+        try:
+            accessor = column.str
+        except AttributeError:
+            # only columns of strings (or lists) have the `str` accessor
+            raise TypeError(  # noqa: TRY003
+                f"Elements of a `{column.dtype}` column don't have a length."
+            ) from None
+        return accessor.len()
+
+    def true_positions(self, mask: Column) -> "np.ndarray":
+        return invalid_positions(mask)
+
+    def to_numpy(self, column: Column) -> "np.ndarray":
+        return column.to_numpy()
+
+    def compile_check(self, metadata: Any) -> ColumnCheck | None:
+        metadata_plan = compile_metadata(metadata)
+        return metadata_plan.check if metadata_plan is not None else None
+
+
+PANDAS_BACKEND = PandasBackend()
+
+
+def get_backend(value: Any) -> ColumnBackend:
+    """The backend for the type of `value`, Pandas for types from any other library."""
+    library = type(value).__module__.partition(".")[0]
+    # imported here, the library is already loaded since `value` is one of its types
+    if library == "pyarrow":
+        from .arrow_backend import ARROW_BACKEND
+
+        return ARROW_BACKEND
+    if library == "polars":
+        from .polars_backend import POLARS_BACKEND
+
+        return POLARS_BACKEND
+    return PANDAS_BACKEND
+
+
+def _comparison_check(
+    backend: ColumnBackend, comparison: str, bound: Any, error: type
+) -> Callable[[Column], list]:
+    def check(column: Column) -> list:
+        positions = backend.true_positions(backend.compare(column, comparison, bound))
+        return [error(bound, column, positions)] if positions.size else []
+
+    return check
+
+
+def _number_range_checks(
+    backend: ColumnBackend, metadata: NumberRange
+) -> list[Callable[[Column], list]]:
+    checks = []
+    if metadata.low is not None:
+        comparison = "lt" if metadata.low_inclusive else "le"
+        checks.append(_comparison_check(backend, comparison, metadata.low, ArrayLowBoundError))
+    if metadata.high is not None:
+        comparison = "gt" if metadata.high_inclusive else "ge"
+        checks.append(_comparison_check(backend, comparison, metadata.high, ArrayHighBoundError))
+    return checks
+
+
+def _compile_bounds_check(backend: ColumnBackend, metadata: Any) -> ColumnCheck | None:
+    """Check for metadata that only contains numeric bounds, `None` for any other metadata.
+
+    Errors are grouped the same way as the validators group them.
+    """
+    if type(metadata) is NumberRange:
+        if not all(
+            isinstance(bound, _NATIVE_BOUND_TYPES)
+            for bound in (metadata.low, metadata.high)
+            if bound is not None
+        ):
+            return None
+        checks = _number_range_checks(backend, metadata)
+        group_message = "number_range"
+    elif isinstance(metadata, at.BaseMetadata | at.GroupedMetadata):
+        checks = []
+        for at_metadata, at_validator in get_at_validators(metadata):
+            if at_validator is unsuported_validator:
+                continue
+            if (comparison := _COMPARISONS.get(type(at_metadata))) is None:
+                return None
+            attribute, failure, error = comparison
+            if not isinstance(bound := getattr(at_metadata, attribute), _NATIVE_BOUND_TYPES):
+                return None
+            checks.append(_comparison_check(backend, failure, bound, error))
+        if not checks:
+            return None
+        group_message = f"`{metadata.__class__.__name__}` Validation Errors"
+    else:
+        return None
+
+    def bounds_check(column: Column) -> ValidatorExceptionGroup | None:
+        errors = [error for check in checks for error in check(column)]
+        return ExceptionGroup(group_message, errors) if errors else None
+
+    return bounds_check
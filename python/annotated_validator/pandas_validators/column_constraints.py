@@ -0,0 +1,127 @@
+"""Value constraints for the columns of a Pandas Dataframe.
+
+Constraints use the same metadata as everything else (`annotated_types` and `BaseMetaValidator`)
+and each one is validated with a single vectorized operation on the column. Checks are compiled
+for a `ColumnBackend`, Pandas if it isn't specified.
+"""
+
+from collections.abc import Iterable
+from typing import Annotated, Any, ForwardRef, NamedTuple, TypeAlias, get_args, get_origin
+
+import annotated_types as at
+
+from ..base import ValidatorExceptionGroup
+from ..exceptions.annotated_types import ArrayMinLenError, InvalidMetadataError
+from ..sampling import Sample, mark_sampled, sampled_message
+from .backends import PANDAS_BACKEND, Column, ColumnBackend, ColumnCheck
+
+ColumnRequirement: TypeAlias = Any
+"""A dtype (`"int64"`), metadata (`MinLen(1)`) or both (`Annotated["int64", Ge(0)]`)."""
+
+UNENFORCED_DTYPE = "object"
+"""Columns with this dtype can be any type."""
+
+
+class ColumnSpec(NamedTuple):
+    """Parsed requirements for a single column."""
+
+    dtype: Any
+    """Required dtype of the column, `object` if the dtype isn't enforced."""
+    metadata: tuple[Any, ...]
+    """Metadata used to validate the values in the column."""
+    checks: tuple[ColumnCheck, ...]
+    """Resolved checks for `metadata`."""
+
+
+def _min_len_check(metadata: at.MinLen, backend: ColumnBackend) -> ColumnCheck:
+    """Element lengths are compared, `len` of the column is the number of rows.
+
+    A column with elements that don't have a length (e.g. numbers) is reported as an error, the
+    dtype of a column with only metadata isn't enforced.
+    """
+    group_message = f"`{metadata.__class__.__name__}` Validation Errors"
+
+    def min_len_check(column: Column) -> ValidatorExceptionGroup | None:
+        if metadata.min_length < 0:
+            message = f"`min_length`: {metadata.min_length} must be greater than or equal to 0."
+            return ExceptionGroup(group_message, [InvalidMetadataError(metadata, message=message)])
+        try:
+            lengths = backend.lengths(column)
+        except TypeError as error:
+            return ExceptionGroup(group_message, [InvalidMetadataError(metadata, str(error))])
+        positions = backend.true_positions(backend.compare(lengths, "lt", metadata.min_length))
+        if positions.size:
+            return ExceptionGroup(
+                group_message, [ArrayMinLenError(metadata.min_length, column, positions)]
+            )
+        return None
+
+    return min_len_check
+
+
+def compile_column_check(
+    metadata: Any, backend: ColumnBackend = PANDAS_BACKEND
+) -> ColumnCheck | None:
+    """Create the check for a single metadata item, `None` if it can't be validated."""
+    if isinstance(metadata, at.MinLen):
+        return _min_len_check(metadata, backend)
+    if isinstance(metadata, at.GroupedMetadata) and any(
+        isinstance(sub_metadata, at.MinLen) for sub_metadata in metadata
+    ):
+        # e.g. `Len`, the `MinLen` it contains is validated per element
+        checks = [
+            check for sub in metadata if (check := compile_column_check(sub, backend)) is not None
+        ]
+        if not checks:
+            return None
+        if len(checks) == 1:
+            return checks[0]
+
+        def grouped_check(column: Column) -> ValidatorExceptionGroup | None:
+            errors = [error for check in checks if (error := check(column)) is not None]
+            if errors:
+                return ExceptionGroup(f"`{metadata.__class__.__name__}` Validation Errors", errors)
+            return None
+
+        return grouped_check
+    return backend.compile_check(metadata)
+
+
+def compile_column_checks(
+    metadata: Iterable[Any], backend: ColumnBackend = PANDAS_BACKEND
+) -> tuple[ColumnCheck, ...]:
+    """Create the checks for the metadata of a column, skips metadata that can't be validated."""
+    return tuple(
+        check for sub_metadata in metadata if (check := compile_column_check(sub_metadata, backend))
+    )
+
+
+def parse_column_requirement(requirement: ColumnRequirement) -> ColumnSpec:
+    """Split a column requirement into its dtype and value constraints."""
+    if get_origin(requirement) is Annotated:
+        dtype, *metadata = get_args(requirement)
+        if isinstance(dtype, ForwardRef):
+            # `Annotated["int64", ...]` stores the dtype string as a forward reference
+            dtype = dtype.__forward_arg__
+    elif isinstance(requirement, at.BaseMetadata | at.GroupedMetadata):
+        dtype, metadata = UNENFORCED_DTYPE, [requirement]
+    else:
+        dtype, metadata = requirement, []
+    return ColumnSpec(dtype, tuple(metadata), compile_column_checks(metadata))
+
+
+def validate_column_values(
+    column_name: str, spec: ColumnSpec, column: Column, sample: Sample | None = None
+) -> ValidatorExceptionGroup | None:
+    """Validate every value in `column`, returns the errors if there are any.
+
+    `sample` is the rows that `column` was taken from, if it is a sample of the original column.
+    """
+    errors = [error for check in spec.checks if (error := check(column)) is not None]
+    if not errors:
+        return None
+    group = ExceptionGroup(f"`{column_name}` Column Validation Errors", errors)
+    if sample is None:
+        return group
+    mark_sampled(group, sample)
+    return ExceptionGroup(sampled_message(group.message, sample), group.exceptions)
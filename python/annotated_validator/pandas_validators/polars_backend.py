@@ -0,0 +1,74 @@
+"""Polars `DataFrame` backend for `RequiredColumns`.
+
+Only imported when a Polars value is validated, `polars` is an optional dependency. Dtypes are
+compared with the Polars schema and bounds are evaluated as Polars expressions, so columns aren't
+converted.
+"""
+
+import operator
+from collections.abc import Iterable
+from typing import Any
+
+import numpy as np
+import polars as pl
+
+from .backends import Column, ColumnBackend
+
+_DTYPE_ALIASES = {"bool": "boolean", "str": "string", "utf8": "string"}
+"""Lower case names used by Pandas and Arrow -> lower case name of the Polars dtype."""
+
+
+class PolarsBackend(ColumnBackend):
+    """Polars Dataframes, nulls are valid (the same as missing values in Pandas).
+
+    Polars orders `NaN` above every number, `NaN` values in float columns are treated like nulls
+    instead so they are valid (the same as `NaN` comparisons everywhere else).
+    """
+
+    name = "polars"
+
+    def fingerprint(self, value: Any, column_names: Iterable[str]) -> tuple[Any, ...]:
+        schema = value.schema
+        return tuple(schema.get(column_name) for column_name in column_names)
+
+    def dtype_matches(self, required: Any, current: Any) -> bool:
+        """Strings are case-insensitive dtype names, e.g. `"Int64"`, `"int64"` or `"String"`."""
+        if isinstance(required, str):
+            required = required.lower()
+            return str(current).lower() == _DTYPE_ALIASES.get(required, required)
+        return current == required
+
+    def row_count(self, value: Any) -> int:
+        return value.height
+
+    def column(self, value: Any, column_name: str) -> Column:
+        return value.get_column(column_name)
+
+    def take(self, column: Column, positions: np.ndarray) -> Column:
+        return column.gather(positions)
+
+    def compare(self, column: Column, comparison: str, bound: Any) -> Column:
+        expression = pl.col(column.name)
+        if column.dtype.is_float():
+            expression = expression.fill_nan(None)
+        return (
+            column.to_frame().select(getattr(operator, comparison)(expression, bound)).to_series()
+        )
+
+    def lengths(self, column: Column) -> Column:
+        """Length of strings (in characters) or lists."""
+        if column.dtype == pl.String:
+            return column.str.len_chars()
+        if column.dtype == pl.List:
+            return column.list.len()
+        raise TypeError(f"Elements of a `{column.dtype}` column don't have a length.")  # noqa: TRY003
+
+    def true_positions(self, mask: Column) -> np.ndarray:
+        return mask.fill_null(False).arg_true().to_numpy()
+
+    def to_numpy(self, column: Column) -> np.ndarray:
+        # zero-copy for numeric columns without nulls
+        return column.to_numpy()
+
+
+POLARS_BACKEND = PolarsBackend()
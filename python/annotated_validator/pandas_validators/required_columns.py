@@ -1,33 +1,142 @@
-"""Validates that a Pandas Dataframe has the required columns with the correct types."""
+"""Validates that a Dataframe has the required columns with the correct types.
 
-from dataclasses import dataclass
+Pandas, Apache Arrow and Polars Dataframes are supported, see `backends`. None of the libraries
+are imported by this module, the library is already loaded when one of its Dataframes is validated.
+"""
 
-import pandas as pd
+from dataclasses import dataclass, field
+from typing import Any, ClassVar
 
 from ..exceptions.pandas import RequiredColumnDoesntExistError, RequiredColumnTypeMismatchError
 from ..exceptions.validator import ValidatorError
+from ..sampling import Sample, SamplingPolicy
 from ..validator import BaseMetaValidator
+from .backends import PANDAS_BACKEND, ColumnBackend, get_backend
+from .column_constraints import (
+    UNENFORCED_DTYPE,
+    ColumnRequirement,
+    ColumnSpec,
+    compile_column_checks,
+    parse_column_requirement,
+    validate_column_values,
+)
 
 
 @dataclass
 class RequiredColumns(BaseMetaValidator):
-    """Validates that a Pandas Dataframe has the required columns with the correct types."""
+    """Validates that a Pandas Dataframe has the required columns with the correct types.
 
-    column_map: dict[str, str]
-    """Keys are column names, values are Pandas Datafram Types."""
+    Values in a column can also be validated by adding metadata to the column type:
 
-    def validate(self, value: pd.DataFrame) -> None | ExceptionGroup[ValidatorError]:
+    ```
+    RequiredColumns(
+        {
+            "name": MinLen(1),
+            "cost": Annotated["int64", Ge(0)],
+            "quantity": "int64",
+        }
+    )
+    ```
+
+    With a `sampling` policy, value constraints only validate the sampled rows. Columns and dtypes
+    are always validated in full.
+
+    The same requirements validate Apache Arrow `Table`s and `RecordBatch`es and Polars
+    `DataFrame`s against their own schema, without converting them. Dtypes can be strings (Arrow
+    aliases like `"int64"` and `"string"`, Polars names like `"Int64"` and `"String"`) or dtypes of
+    the library, e.g. `pa.int64()` or `pl.Int64`.
+    """
+
+    supports_sampling: ClassVar[bool] = True
+
+    column_map: dict[str, ColumnRequirement]
+    """Keys are column names, values are Dataframe Types (optionally with metadata)."""
+    sampling: SamplingPolicy | None = None
+    """Rows that are used to validate values, all of them if `None`."""
+    column_specs: dict[str, ColumnSpec] = field(init=False, repr=False, compare=False)
+    """Parsed `column_map`, with checks for Pandas."""
+    backend_specs: dict[str, dict[str, ColumnSpec]] = field(
+        init=False, repr=False, compare=False, default_factory=dict
+    )
+    """Backend name -> `column_specs` with checks for the backend, compiled on the first use."""
+    schema_cache: dict[tuple[str, tuple[Any, ...]], tuple[bool, ...]] = field(
+        init=False, repr=False, compare=False, default_factory=dict
+    )
+    """(Backend name, schema fingerprint) -> whether each required column has the required dtype."""
+
+    max_cached_schemas: ClassVar[int] = 128
+    """Oldest fingerprints are removed once the cache has this many entries."""
+
+    def __post_init__(self):
+        self.column_specs = {
+            column_name: parse_column_requirement(requirement)
+            for column_name, requirement in self.column_map.items()
+        }
+
+    def schema_fingerprint(self, value: Any) -> tuple[Any, ...]:
+        """Current dtype of each required column (`None` if it doesn't exist).
+
+        Only reads the schema (e.g. `value.dtypes`), no columns are materialized.
+        """
+        return get_backend(value).fingerprint(value, self.column_specs)
+
+    def _dtype_matches(
+        self, backend: ColumnBackend, fingerprint: tuple[Any, ...]
+    ) -> tuple[bool, ...]:
+        key = (backend.name, fingerprint)
+        try:
+            return self.schema_cache[key]
+        except KeyError:
+            pass
+        matches = tuple(
+            current_dtype is not None
+            and (spec.dtype == UNENFORCED_DTYPE or backend.dtype_matches(spec.dtype, current_dtype))
+            for spec, current_dtype in zip(self.column_specs.values(), fingerprint, strict=True)
+        )
+        if len(self.schema_cache) >= self.max_cached_schemas:
+            del self.schema_cache[next(iter(self.schema_cache))]
+        self.schema_cache[key] = matches
+        return matches
+
+    def _specs(self, backend: ColumnBackend) -> dict[str, ColumnSpec]:
+        if backend is PANDAS_BACKEND:
+            return self.column_specs
+        try:
+            return self.backend_specs[backend.name]
+        except KeyError:
+            specs = self.backend_specs[backend.name] = {
+                column_name: spec._replace(checks=compile_column_checks(spec.metadata, backend))
+                for column_name, spec in self.column_specs.items()
+            }
+            return specs
+
+    def validate(self, value: Any) -> ExceptionGroup[ValidatorError] | None:
         exceptions = []
-        column_index = value.columns
-        value_column_map = {column_name: value[column_name].dtype for column_name in column_index}
-        for column_name, required_dtype in self.column_map.items():
-            if column_name not in value_column_map:
+        # rows are only sampled once a column with value constraints has the correct dtype
+        sample: Sample | None = None
+        sampled = self.sampling is None
+        backend = get_backend(value)
+        fingerprint = backend.fingerprint(value, self.column_specs)
+        dtype_matches = self._dtype_matches(backend, fingerprint)
+        for (column_name, spec), current_dtype, dtype_match in zip(
+            self._specs(backend).items(), fingerprint, dtype_matches, strict=True
+        ):
+            if current_dtype is None:
                 exceptions.append(RequiredColumnDoesntExistError(column_name))
                 continue
-            if required_dtype != "object" and required_dtype != (
-                current_dtype := value_column_map[column_name]
-            ):
+            if not dtype_match:
                 exceptions.append(
-                    RequiredColumnTypeMismatchError(column_name, required_dtype, current_dtype)
+                    RequiredColumnTypeMismatchError(column_name, spec.dtype, current_dtype)
                 )
+                continue
+            if not spec.checks:
+                continue
+            if not sampled:
+                sample = self.sampling.select(backend.row_count(value))
+                sampled = True
+            column = backend.column(value, column_name)
+            if sample is not None:
+                column = backend.take(column, sample.positions)
+            if errors := validate_column_values(column_name, spec, column, sample):
+                exceptions.append(errors)
         return ExceptionGroup("pandas_required_columns", exceptions) if exceptions else None
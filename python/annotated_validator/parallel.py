@@ -0,0 +1,145 @@
+"""Validate large values on a shared thread pool.
+
+NumPy and Pandas release the GIL for most element-wise operations, so validating several large
+arrays or Dataframes (or one large value against several metadata items) can overlap. With the
+`parallel` option, each metadata check of a value with at least `parallel_threshold` elements is
+submitted to a `ThreadPoolExecutor`, everything else is validated in the calling thread. Results
+are merged in the order of the plan, so errors have the same structure as serial validation.
+"""
+
+import functools
+import os
+import threading
+from collections.abc import Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any
+
+from .base import ParameterExceptionGroup, ValidatorExceptionGroup
+from .options import ValidationOptions
+from .plan import ParameterPlan, ParametersCheck
+
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+CPU_COUNT = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count()
+"""CPUs available to this process, validation stays serial if there is only one."""
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """Executor shared by every plan with the `parallel` option, created when first used."""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(thread_name_prefix="annotated_validator")
+    return _executor
+
+
+def set_executor(executor: ThreadPoolExecutor | None) -> None:
+    """Use `executor` for parallel validation, `None` creates a new default executor when needed.
+
+    The previous executor isn't shut down.
+    """
+    global _executor
+    with _executor_lock:
+        _executor = executor
+
+
+def value_size(value: Any) -> int:
+    """Number of elements in an array or Dataframe, `0` for anything else."""
+    size = getattr(value, "size", 0)
+    return size if isinstance(size, int) else 0
+
+
+def _submit_checks(
+    param_plans: Sequence[ParameterPlan], values: Sequence[Any], threshold: int
+) -> list[list[ValidatorExceptionGroup | Future | None]]:
+    """Result of each metadata check, checks of large values are `Future`s if there are several."""
+    large = [(size := value_size(value)) > 0 and size >= threshold for value in values]
+    dispatched = sum(
+        len(param_plan.metadata)
+        for param_plan, is_large in zip(param_plans, large, strict=True)
+        if is_large
+    )
+    # a single large check is faster in the calling thread, nothing else would run meanwhile
+    executor = get_executor() if dispatched > 1 and (CPU_COUNT or 1) > 1 else None
+    results: list = [None] * len(param_plans)
+    if executor is not None:
+        # submit everything first, so the calling thread validates small values meanwhile
+        for index, (param_plan, value) in enumerate(zip(param_plans, values, strict=True)):
+            if large[index]:
+                results[index] = [
+                    executor.submit(metadata_plan.check, value)
+                    for metadata_plan in param_plan.metadata
+                ]
+    for index, (param_plan, value) in enumerate(zip(param_plans, values, strict=True)):
+        if results[index] is None:
+            results[index] = [metadata_plan.check(value) for metadata_plan in param_plan.metadata]
+    return results
+
+
+def validate_parameters_parallel(
+    param_plans: Sequence[ParameterPlan], values: Sequence[Any], threshold: int
+) -> list[ParameterExceptionGroup] | None:
+    """Validate each value with its plan, large values are validated on the executor."""
+    errors = []
+    all_results = _submit_checks(param_plans, values, threshold)
+    for param_plan, results in zip(param_plans, all_results, strict=True):
+        validation_exception_groups = [
+            metadata_errors
+            for result in results
+            if (metadata_errors := result.result() if isinstance(result, Future) else result)
+        ]
+        if validation_exception_groups:
+            group_message = f"`{param_plan.name}` Validation Errors"
+            errors.append(ExceptionGroup(group_message, validation_exception_groups))
+    return errors or None
+
+
+def validate_parameters_first_error_parallel(
+    param_plans: Sequence[ParameterPlan], values: Sequence[Any], threshold: int
+) -> list[ParameterExceptionGroup] | None:
+    """Validate each value with its plan, returns the first error in the order of the plan.
+
+    Checks that haven't started when an error is found are cancelled.
+    """
+    all_results = _submit_checks(param_plans, values, threshold)
+    for param_plan, results in zip(param_plans, all_results, strict=True):
+        for result in results:
+            if metadata_errors := result.result() if isinstance(result, Future) else result:
+                for remaining in all_results:
+                    for future in remaining:
+                        if isinstance(future, Future):
+                            future.cancel()
+                group_message = f"`{param_plan.name}` Validation Errors"
+                return [ExceptionGroup(group_message, [metadata_errors])]
+    return None
+
+
+def build_parallel_values_check(
+    param_plans: Sequence[ParameterPlan], options: ValidationOptions
+) -> ParametersCheck:
+    """Create the check for a sequence of values, one for each plan in `param_plans`.
+
+    Parallel plans are always interpreted (`generate_code` is ignored).
+    """
+    validate = (
+        validate_parameters_first_error_parallel
+        if options.fail_fast
+        else validate_parameters_parallel
+    )
+    return functools.partial(validate, tuple(param_plans), threshold=options.parallel_threshold)
+
+
+def build_parallel_attributes_check(
+    param_plans: Sequence[ParameterPlan], options: ValidationOptions
+) -> ParametersCheck:
+    """Create the check for the attributes of an instance, one for each plan in `param_plans`."""
+    check_values = build_parallel_values_check(param_plans, options)
+    names = tuple(param_plan.name for param_plan in param_plans)
+
+    def check_attributes(obj: Any) -> list[ParameterExceptionGroup] | None:
+        return check_values([getattr(obj, name) for name in names])
+
+    return check_attributes
+
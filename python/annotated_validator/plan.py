@@ -0,0 +1,722 @@
+"""Validation plans that are built once and reused for every validated call.
+
+Resolving which metadata can be validated (and which validator handles it) only depends on the
+type annotations, so that work is done when a function is decorated instead of on every call.
+"""
+
+import functools
+import inspect
+import logging
+import weakref
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import replace
+from typing import Annotated, Any, NamedTuple, TypeAlias, get_origin, get_type_hints
+
+from annotated_types import BaseMetadata, GroupedMetadata
+
+from . import instrumentation
+from .annotated_types_validators import get_at_validators, unsuported_validator
+from .base import BaseMetaValidator, ParameterExceptionGroup, ValidatorExceptionGroup
+from .bounds import fold_bounds, metadata_bounds
+from .memo import is_memoizable, memoized_check
+from .options import DEFAULT_OPTIONS, ValidationOptions
+from .provenance import tracked_check
+from .sampling import SamplingPolicy, sample_check, supports_sampling
+from .streaming import (
+    Batches,
+    BatchValidatedIterator,
+    ValidatedIterator,
+    item_type,
+    iterator_batches,
+)
+
+logger = logging.getLogger(__name__)
+
+MetadataCheck: TypeAlias = Callable[[Any], ValidatorExceptionGroup | None]
+"""Validates a value against a single metadata item, returns the errors if there are any."""
+
+ParametersCheck: TypeAlias = Callable[[Any], list[ParameterExceptionGroup] | None]
+"""Validates every parameter in a plan, returns the errors of each invalid parameter (if any).
+
+Function plans pass a sequence of values, class plans pass the instance being validated.
+"""
+
+
+class MetadataPlan(NamedTuple):
+    """A metadata item and the resolved callable used to validate it."""
+
+    metadata: Any
+    """Original metadata from the `Annotated` type."""
+    check: MetadataCheck
+    """Callable that validates a value against `metadata`."""
+    is_async: bool = False
+    """`check` is a coroutine function (an `async` `BaseMetaValidator.validate`)."""
+
+
+class FoldedBounds(NamedTuple):
+    """The bound metadata of a parameter merged into a single interval, see `bounds`."""
+
+    contains: Callable[[Any], bool]
+    """`True` if a value is a number within every folded bound."""
+    remaining: tuple[MetadataPlan, ...]
+    """Metadata that isn't folded, the only checks required for values that are `contains`ed."""
+
+
+class ParameterPlan(NamedTuple):
+    """Everything required to validate a single parameter."""
+
+    name: str
+    """Name of the parameter (`return` for the return value)."""
+    index: int | None
+    """Position of the parameter in `args`, `None` if it can only be passed as a keyword."""
+    default: Any
+    """Default value of the parameter, `inspect.Parameter.empty` if there isn't one."""
+    metadata: tuple[MetadataPlan, ...]
+    """Validators for the parameter in the order they were annotated."""
+    wrap: Callable[[Any], Any] | None = None
+    """Replaces the value with one that is validated lazily (iterators), `metadata` is empty."""
+    folded: FoldedBounds | None = None
+    """Skips the bound metadata for values within its interval, `None` if nothing is folded.
+
+    Must be reset (or folded again) when `metadata` is replaced.
+    """
+
+
+class FunctionPlan(NamedTuple):
+    """Everything required to validate the parameters and return value of a function."""
+
+    signature: inspect.Signature
+    """Signature of the validated function."""
+    parameters: tuple[ParameterPlan, ...]
+    """Parameters that have metadata that can be validated."""
+    return_parameter: ParameterPlan | None
+    """Return value plan, `None` if the return value doesn't need validation."""
+    max_positional: int | None
+    """Number of parameters that can be passed by position, `None` if `*args` is accepted."""
+    requires_binding: bool
+    """Values can't be found by index/name alone, `inspect.Signature.bind` must be used."""
+    check_inputs: ParametersCheck
+    """Validates the values returned by `bind_values`."""
+    check_return: ParametersCheck
+    """Validates a sequence that only contains the return value."""
+    is_async: bool = False
+    """`check_inputs` and `check_return` are coroutine functions, their results must be awaited."""
+    wrapped_parameters: tuple[ParameterPlan, ...] = ()
+    """Parameters that are replaced by `wrap_arguments` instead of being validated directly."""
+
+    @property
+    def is_empty(self) -> bool:
+        """`True` if there is nothing to validate."""
+        return (
+            not self.parameters and self.return_parameter is None and not self.wrapped_parameters
+        )
+
+    def wrap_arguments(self, args: tuple, kwargs: dict[str, Any]) -> tuple[tuple, dict[str, Any]]:
+        """Replace the values of `wrapped_parameters`, defaults aren't replaced."""
+        if self.requires_binding:
+            bound_args = self.signature.bind(*args, **kwargs)
+            for param_plan in self.wrapped_parameters:
+                if param_plan.name in bound_args.arguments:
+                    value = bound_args.arguments[param_plan.name]
+                    bound_args.arguments[param_plan.name] = param_plan.wrap(value)
+            return bound_args.args, bound_args.kwargs
+        args = list(args)
+        for param_plan in self.wrapped_parameters:
+            if param_plan.index is not None and param_plan.index < len(args):
+                args[param_plan.index] = param_plan.wrap(args[param_plan.index])
+            elif param_plan.name in kwargs:
+                kwargs = {**kwargs, param_plan.name: param_plan.wrap(kwargs[param_plan.name])}
+        return tuple(args), kwargs
+
+    def bind_values(self, args: tuple, kwargs: dict[str, Any]) -> list[Any]:
+        """Get the values of the validated parameters, in the same order as `parameters`."""
+        if self.requires_binding or (
+            self.max_positional is not None and len(args) > self.max_positional
+        ):
+            return self._bind_with_signature(args, kwargs)
+        values = []
+        for param_plan in self.parameters:
+            if param_plan.index is not None and param_plan.index < len(args):
+                values.append(args[param_plan.index])
+            elif param_plan.name in kwargs:
+                values.append(kwargs[param_plan.name])
+            elif param_plan.default is not inspect.Parameter.empty:
+                values.append(param_plan.default)
+            else:
+                # a required parameter is missing, let `bind` raise the usual `TypeError`
+                return self._bind_with_signature(args, kwargs)
+        return values
+
+    def _bind_with_signature(self, args: tuple, kwargs: dict[str, Any]) -> list[Any]:
+        bound_args = self.signature.bind(*args, **kwargs)
+        bound_args.apply_defaults()
+        return [bound_args.arguments[param_plan.name] for param_plan in self.parameters]
+
+
+class ClassPlan(NamedTuple):
+    """Everything required to validate the attributes of a class instance."""
+
+    name: str
+    """Name of the class, used in error messages."""
+    parameters: tuple[ParameterPlan, ...]
+    """Attributes that have metadata that can be validated."""
+    check: ParametersCheck
+    """Validates the attributes of an instance."""
+    enabled: bool
+    """`False` if validation is disabled for the class, `check` is only used when forced."""
+    fail_fast: bool = False
+    """Stop at the first invalid attribute (and, with `deep`, the first invalid object)."""
+    deep: bool = False
+    """Also validate the objects in the attributes, see `deep`."""
+    max_depth: int = 0
+    """With `deep`, number of nested objects below an instance that are validated."""
+
+
+def is_annotated(py_type: Any) -> bool:
+    """`True` if `py_type` is an `Annotated` type."""
+    return get_origin(py_type) is Annotated
+
+
+def compile_at_metadata(
+    metadata: BaseMetadata | GroupedMetadata, fail_fast: bool = False
+) -> MetadataCheck | None:
+    """Resolve the `annotated_types` validators for `metadata` into a single callable.
+
+    Returns `None` if none of the metadata has an implemented validator. With `fail_fast`, the
+    validators in `GroupedMetadata` stop at the first error.
+    """
+    at_validators = tuple(
+        (at_metadata, at_validator)
+        for at_metadata, at_validator in get_at_validators(metadata)
+        if at_validator is not unsuported_validator
+    )
+    if not at_validators:
+        logger.debug("%s doesn't have an implemented validator.", metadata)
+        return None
+    group_message = f"`{metadata.__class__.__name__}` Validation Errors"
+
+    if len(at_validators) == 1:
+        # most metadata (everything that isn't `GroupedMetadata`) has a single validator
+        ((single_metadata, single_validator),) = at_validators
+
+        def single_at_check(value) -> ValidatorExceptionGroup | None:
+            if errors := single_validator(single_metadata, value):
+                return ExceptionGroup(group_message, errors)
+            return None
+
+        return single_at_check
+
+    def at_check(value) -> ValidatorExceptionGroup | None:
+        errors = []
+        for at_metadata, at_validator in at_validators:
+            errors.extend(at_validator(at_metadata, value))
+        return ExceptionGroup(group_message, errors) if errors else None
+
+    def first_error_at_check(value) -> ValidatorExceptionGroup | None:
+        for at_metadata, at_validator in at_validators:
+            if errors := at_validator(at_metadata, value):
+                return ExceptionGroup(group_message, errors)
+        return None
+
+    return first_error_at_check if fail_fast else at_check
+
+
+def compile_metadata(metadata: Any, fail_fast: bool = False) -> MetadataPlan | None:
+    """Create the plan for a single metadata item, `None` if it can't be validated."""
+    if isinstance(metadata, BaseMetaValidator):
+        return MetadataPlan(
+            metadata, metadata.validate, inspect.iscoroutinefunction(metadata.validate)
+        )
+    # this is metadata from `annotated_types` and should be validated
+    if isinstance(metadata, BaseMetadata | GroupedMetadata):
+        if (at_check := compile_at_metadata(metadata, fail_fast)) is None:
+            return None
+        return MetadataPlan(metadata, at_check)
+    logger.debug(
+        "Metadata: %s was not an instance of the `Validator` or `annotated_types.BaseMetadata`.",
+        metadata,
+    )
+    return None
+
+
+def compile_parameter(
+    name: str,
+    py_type: Any,
+    index: int | None = None,
+    default: Any = inspect.Parameter.empty,
+    options: ValidationOptions = DEFAULT_OPTIONS,
+) -> ParameterPlan | None:
+    """Create the plan for a single parameter, `None` if there is nothing to validate.
+
+    `options` must already be resolved. If the metadata contains a `SamplingPolicy`, the other
+    (synchronous) metadata only validates sampled rows. Iterators are validated lazily, see
+    `streaming`. Synchronous metadata can skip values it already validated, see `memo` (equal
+    immutable values) and `provenance` (the same object). Bounds (e.g. `at.Ge`, `at.Lt` and
+    `NumberRange`) are merged into a single interval, see `bounds`. Metadata in the type arguments
+    (e.g. `list[Annotated[int, Gt(0)]]`) validates the elements, see `containers`.
+    """
+    if (iterated_type := item_type(py_type)) is not None:
+        batches = iterator_batches(py_type)
+        return compile_iterator_parameter(name, iterated_type, index, default, options, batches)
+    metadata_plans = compile_annotated_metadata(py_type, options)
+    # imported here since it depends on this module
+    from .containers import compile_elements
+
+    if (elements_plan := compile_elements(name, py_type, options)) is not None:
+        metadata_plans = (*metadata_plans, _wrap_check(elements_plan, None, options))
+    if not metadata_plans:
+        logger.debug("%s doesn't contain metadata, skipping validation.", name)
+        return None
+    return ParameterPlan(
+        name, index, default, metadata_plans, folded=fold_metadata(name, metadata_plans)
+    )
+
+
+def compile_annotated_metadata(
+    py_type: Any, options: ValidationOptions = DEFAULT_OPTIONS
+) -> tuple[MetadataPlan, ...]:
+    """Create the plans for the metadata of an `Annotated` type, empty for any other type.
+
+    If the metadata contains a `SamplingPolicy`, the other metadata only validates sampled rows.
+    """
+    if not is_annotated(py_type):
+        return ()
+    policy = next(
+        (metadata for metadata in py_type.__metadata__ if isinstance(metadata, SamplingPolicy)),
+        None,
+    )
+    return tuple(
+        _wrap_check(metadata_plan, policy, options)
+        for metadata in py_type.__metadata__
+        if not isinstance(metadata, SamplingPolicy)
+        and (metadata_plan := compile_metadata(metadata, bool(options.fail_fast))) is not None
+    )
+
+
+def fold_metadata(name: str, metadata_plans: tuple[MetadataPlan, ...]) -> FoldedBounds | None:
+    """Merge the bounds in `metadata_plans` into a single interval, `None` if there aren't any.
+
+    Bounds that no value satisfies aren't folded, since every number has to be validated.
+    """
+    bounds = fold_bounds(name, (metadata_plan.metadata for metadata_plan in metadata_plans))
+    if bounds is None or bounds.is_empty:
+        return None
+    remaining = tuple(
+        metadata_plan
+        for metadata_plan in metadata_plans
+        if metadata_bounds(metadata_plan.metadata) is None
+    )
+    return FoldedBounds(bounds.build_contains(), remaining)
+
+
+def _wrap_check(
+    metadata_plan: MetadataPlan, policy: SamplingPolicy | None, options: ValidationOptions
+) -> MetadataPlan:
+    """Add sampling, memoization and provenance to the check of a synchronous metadata item."""
+    if metadata_plan.is_async:
+        return metadata_plan
+    metadata, check = metadata_plan.metadata, metadata_plan.check
+    sampled = policy is not None and supports_sampling(metadata)
+    if sampled:
+        check = sample_check(policy, check)
+    if options.memoize and is_memoizable(metadata):
+        check = memoized_check(check)
+    # a valid sample doesn't mean the object is valid (this includes `RequiredColumns.sampling`)
+    if options.provenance and not sampled and getattr(metadata, "sampling", None) is None:
+        check = tracked_check(metadata, check, bool(options.strict_provenance))
+    return metadata_plan._replace(check=check)
+
+
+def compile_iterator_parameter(
+    name: str,
+    iterated_type: Any,
+    index: int | None = None,
+    default: Any = inspect.Parameter.empty,
+    options: ValidationOptions = DEFAULT_OPTIONS,
+    batches: Batches | None = None,
+) -> ParameterPlan | None:
+    """Create the plan for an iterator, each item is validated with the plan for `iterated_type`.
+
+    With `batches`, metadata that is known to accept arrays (see `supports_sampling`) validates
+    whole batches, the rest of the metadata validates each item. If none of the metadata accepts
+    arrays, `batches` is ignored.
+    """
+    item_plan = compile_parameter(name, iterated_type, options=options)
+    if item_plan is None:
+        return None
+    if has_async_metadata((item_plan,)):
+        raise TypeError(  # noqa: TRY003
+            f"`{name}`: async validators can't validate the items of an iterator."
+        )
+    validate = validate_parameter_first_error if options.fail_fast else validate_parameter
+    batch_metadata = tuple(
+        metadata_plan
+        for metadata_plan in item_plan.metadata
+        if batches is not None and supports_sampling(metadata_plan.metadata)
+    )
+    if not batch_metadata:
+        # e.g. containers (`Iterator[list[Annotated[int, Gt(0)]]]`) are validated one at a time
+        check = functools.partial(validate, item_plan)
+        wrap = functools.partial(ValidatedIterator, name=name, check=check)
+        return ParameterPlan(name, index, default, (), wrap)
+    item_metadata = tuple(
+        metadata_plan for metadata_plan in item_plan.metadata if metadata_plan not in batch_metadata
+    )
+    wrap = functools.partial(
+        BatchValidatedIterator,
+        name=name,
+        check=functools.partial(validate, item_plan._replace(metadata=item_metadata, folded=None))
+        if item_metadata
+        else None,
+        batch_check=functools.partial(
+            validate, item_plan._replace(metadata=batch_metadata, folded=None)
+        ),
+        size=batches.size,
+    )
+    return ParameterPlan(name, index, default, (), wrap)
+
+
+_BINDING_KINDS = frozenset(
+    {
+        inspect.Parameter.POSITIONAL_ONLY,
+        inspect.Parameter.VAR_POSITIONAL,
+        inspect.Parameter.VAR_KEYWORD,
+    }
+)
+"""Parameter kinds where a value can't be found by its index or name alone."""
+
+
+def _evaluated_signature(func: Callable) -> inspect.Signature:
+    """Signature of `func` with its string annotations evaluated.
+
+    Annotations are strings with `from __future__ import annotations` or when quoted. Annotations
+    that can't be evaluated yet, e.g. a forward reference to a class that is defined after `func`,
+    are left as strings and aren't validated.
+    """
+    try:
+        return inspect.signature(func, eval_str=True)
+    except NameError:
+        pass
+    signature = inspect.signature(func)
+    namespace = getattr(inspect.unwrap(func), "__globals__", {})
+
+    def evaluate(name: str, annotation: Any) -> Any:
+        if not isinstance(annotation, str):
+            return annotation
+        try:
+            return eval(annotation, namespace)  # noqa: S307
+        except NameError as error:
+            logger.warning("`%s` of `%s` isn't validated: %s", name, func.__qualname__, error)
+            return annotation
+
+    return signature.replace(
+        parameters=[
+            param_sig.replace(annotation=evaluate(param_name, param_sig.annotation))
+            for param_name, param_sig in signature.parameters.items()
+        ],
+        return_annotation=evaluate("return", signature.return_annotation),
+    )
+
+
+def compile_function(func: Callable, options: ValidationOptions = DEFAULT_OPTIONS) -> FunctionPlan:
+    """Create the validation plan for the parameters and return value of `func`.
+
+    String annotations are evaluated like the annotations of classes (see `get_class_plan`).
+    """
+    options = options.resolve(getattr(func, "__module__", None))
+    signature = _evaluated_signature(func)
+    parameter_plans = []
+    wrapped_plans = []
+    requires_binding = False
+    max_positional: int | None = 0
+    for index, (param_name, param_sig) in enumerate(signature.parameters.items()):
+        if param_sig.kind is inspect.Parameter.VAR_POSITIONAL:
+            max_positional = None
+        elif max_positional is not None and param_sig.kind in {
+            inspect.Parameter.POSITIONAL_ONLY,
+            inspect.Parameter.POSITIONAL_OR_KEYWORD,
+        }:
+            max_positional += 1
+        positional_index = (
+            index if param_sig.kind is inspect.Parameter.POSITIONAL_OR_KEYWORD else None
+        )
+        param_plan = compile_parameter(
+            param_name, param_sig.annotation, positional_index, param_sig.default, options
+        )
+        if param_plan is None:
+            continue
+        if param_plan.wrap is not None:
+            wrapped_plans.append(param_plan)
+        else:
+            parameter_plans.append(param_plan)
+        requires_binding = requires_binding or param_sig.kind in _BINDING_KINDS
+
+    return_plan = compile_parameter("return", signature.return_annotation, options=options)
+    if instrumentation.is_active():
+        owner = f"{func.__module__}.{func.__qualname__}"
+        parameter_plans = instrumentation.instrument_plans(owner, parameter_plans)
+        if return_plan is not None:
+            (return_plan,) = instrumentation.instrument_plans(owner, (return_plan,))
+        # generated code would inline some of the instrumented checks
+        options = replace(options, generate_code=False)
+    return_plans = (return_plan,) if return_plan is not None and return_plan.metadata else ()
+    has_async_validators = has_async_metadata((*parameter_plans, *return_plans))
+    is_coroutine_function = inspect.iscoroutinefunction(func)
+    if has_async_validators and not is_coroutine_function:
+        raise TypeError(  # noqa: TRY003
+            f"`{func.__name__}` has async validators, they can only be used with `async def`."
+        )
+    is_async = is_coroutine_function and (has_async_validators or bool(options.offload))
+    if is_async:
+        # imported here since it depends on this module
+        from .async_validation import build_async_values_check
+
+        check_inputs = build_async_values_check(parameter_plans, options)
+        check_return = build_async_values_check(return_plans, options)
+    else:
+        check_inputs = build_values_check(f"{func.__name__}_inputs", parameter_plans, options)
+        check_return = build_values_check(f"{func.__name__}_return", return_plans, options)
+    return FunctionPlan(
+        signature=signature,
+        parameters=tuple(parameter_plans),
+        return_parameter=return_plan,
+        max_positional=max_positional,
+        requires_binding=requires_binding,
+        check_inputs=check_inputs,
+        check_return=check_return,
+        is_async=is_async,
+        wrapped_parameters=tuple(wrapped_plans),
+    )
+
+
+def has_async_metadata(param_plans: Iterable[ParameterPlan]) -> bool:
+    """`True` if any of the metadata in `param_plans` has an async validator."""
+    return any(
+        metadata_plan.is_async
+        for param_plan in param_plans
+        for metadata_plan in param_plan.metadata
+    )
+
+
+def validate_parameter(param_plan: ParameterPlan, value: Any) -> ParameterExceptionGroup | None:
+    """Validate `value` with every validator in the plan, returns the errors if there are any."""
+    metadata_plans = param_plan.metadata
+    if (folded := param_plan.folded) is not None and folded.contains(value):
+        metadata_plans = folded.remaining
+    validation_exception_groups = []
+    for metadata_plan in metadata_plans:
+        if errors := metadata_plan.check(value):
+            validation_exception_groups.append(errors)
+    if validation_exception_groups:
+        return ExceptionGroup(f"`{param_plan.name}` Validation Errors", validation_exception_groups)
+    return None
+
+
+def validate_parameter_first_error(
+    param_plan: ParameterPlan, value: Any
+) -> ParameterExceptionGroup | None:
+    """Validate `value` until a validator fails, returns the errors of that validator."""
+    metadata_plans = param_plan.metadata
+    if (folded := param_plan.folded) is not None and folded.contains(value):
+        metadata_plans = folded.remaining
+    for metadata_plan in metadata_plans:
+        if errors := metadata_plan.check(value):
+            return ExceptionGroup(f"`{param_plan.name}` Validation Errors", [errors])
+    return None
+
+
+def validate_parameters(
+    param_plans: Sequence[ParameterPlan], values: Iterable[Any]
+) -> list[ParameterExceptionGroup] | None:
+    """Validate each value with its plan, returns the errors of every invalid parameter."""
+    errors = [
+        param_errors
+        for param_plan, value in zip(param_plans, values, strict=True)
+        if (param_errors := validate_parameter(param_plan, value))
+    ]
+    return errors or None
+
+
+def validate_parameters_first_error(
+    param_plans: Sequence[ParameterPlan], values: Iterable[Any]
+) -> list[ParameterExceptionGroup] | None:
+    """Validate each value with its plan until a parameter is invalid, returns its errors."""
+    for param_plan, value in zip(param_plans, values, strict=True):
+        if param_errors := validate_parameter_first_error(param_plan, value):
+            return [param_errors]
+    return None
+
+
+def build_values_check(
+    name: str, param_plans: Sequence[ParameterPlan], options: ValidationOptions
+) -> ParametersCheck:
+    """Create the check for a sequence of values, one for each plan in `param_plans`."""
+    if options.parallel:
+        # imported here since it depends on this module
+        from .parallel import build_parallel_values_check
+
+        return build_parallel_values_check(param_plans, options)
+    if options.generate_code:
+        # imported here since the generated code calls back into this module
+        from .codegen import generate_check
+
+        value_expressions = [f"_values[{index}]" for index in range(len(param_plans))]
+        return generate_check(
+            f"_validate_{name}", param_plans, "_values", value_expressions, options.fail_fast
+        )
+    validate = validate_parameters_first_error if options.fail_fast else validate_parameters
+    return functools.partial(validate, tuple(param_plans))
+
+
+def build_attributes_check(
+    name: str, param_plans: Sequence[ParameterPlan], options: ValidationOptions
+) -> ParametersCheck:
+    """Create the check for the attributes of an instance, one for each plan in `param_plans`."""
+    if options.parallel:
+        from .parallel import build_parallel_attributes_check
+
+        return build_parallel_attributes_check(param_plans, options)
+    if options.generate_code:
+        from .codegen import generate_check
+
+        value_expressions = [
+            f"_obj.{param_plan.name}"
+            if param_plan.name.isidentifier()
+            else f"getattr(_obj, {param_plan.name!r})"
+            for param_plan in param_plans
+        ]
+        return generate_check(
+            f"_validate_{name}", param_plans, "_obj", value_expressions, options.fail_fast
+        )
+
+    def check_attributes(obj: Any) -> list[ParameterExceptionGroup] | None:
+        errors = [
+            param_errors
+            for param_plan in param_plans
+            if (param_errors := validate_parameter(param_plan, getattr(obj, param_plan.name)))
+        ]
+        return errors or None
+
+    def check_attributes_first_error(obj: Any) -> list[ParameterExceptionGroup] | None:
+        # attributes are only read until a parameter is invalid
+        for param_plan in param_plans:
+            value = getattr(obj, param_plan.name)
+            if param_errors := validate_parameter_first_error(param_plan, value):
+                return [param_errors]
+        return None
+
+    return check_attributes_first_error if options.fail_fast else check_attributes
+
+
+def compile_class(cls: type) -> ClassPlan:
+    """Create the validation plan for the annotated attributes of `cls` (including base classes).
+
+    Options are read from the `__validation_options__` attribute of the class (if it exists).
+    Raises a `NameError` if a forward reference can't be resolved yet, and a `TypeError` if an
+    attribute has an async validator (instances are validated synchronously). Iterator attributes
+    aren't validated, since they can only be validated by replacing them.
+    """
+    options = getattr(cls, "__validation_options__", DEFAULT_OPTIONS).resolve(cls.__module__)
+    parameter_plans = tuple(
+        param_plan
+        for param_name, param_type in get_type_hints(cls, include_extras=True).items()
+        if (
+            param_plan := compile_parameter(param_name, param_type, options=options)
+        )
+        is not None
+        and param_plan.wrap is None
+    )
+    if has_async_metadata(parameter_plans):
+        raise TypeError(  # noqa: TRY003
+            f"`{cls.__name__}` has async validators, they can only be used with `async def`."
+        )
+    if instrumentation.is_active():
+        owner = f"{cls.__module__}.{cls.__qualname__}"
+        parameter_plans = tuple(instrumentation.instrument_plans(owner, parameter_plans))
+        options = replace(options, generate_code=False)
+    return ClassPlan(
+        cls.__name__,
+        parameter_plans,
+        build_attributes_check(cls.__name__, parameter_plans, options),
+        options.enabled,
+        bool(options.fail_fast),
+        bool(options.deep),
+        options.max_depth or 0,
+    )
+
+
+MAX_PARAMETER_PLANS = 1024
+"""Number of plans kept by `get_parameter_plan`, the least recently used plans are removed."""
+
+
+class _IdentityKey:
+    """Cache key for an annotation that isn't hashable (e.g. metadata like `NumberRange`).
+
+    The annotation is identified by its identity, the cache keeps it alive so it isn't reused.
+    """
+
+    __slots__ = ("py_type",)
+
+    def __init__(self, py_type: Any):
+        self.py_type = py_type
+
+    def __hash__(self) -> int:
+        return id(self.py_type)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _IdentityKey) and other.py_type is self.py_type
+
+
+@functools.lru_cache(maxsize=MAX_PARAMETER_PLANS)
+def _cached_parameter_plan(name: str, key: Any, instrumented: bool) -> ParameterPlan | None:
+    py_type = key.py_type if isinstance(key, _IdentityKey) else key
+    param_plan = compile_parameter(name, py_type)
+    if instrumented and param_plan is not None:
+        (param_plan,) = instrumentation.instrument_plans("annotated_validator", (param_plan,))
+    return param_plan
+
+
+def get_parameter_plan(name: str, py_type: Any) -> ParameterPlan | None:
+    """Get the cached plan for a parameter (see `compile_parameter`), built on the first request.
+
+    Used by `validator.annotated_validator`, which is called with the annotations every time.
+    Equal annotations share a plan, annotations with unhashable metadata only share a plan with
+    the same annotation object (e.g. a type alias). Plans are cached with and without
+    instrumentation, the instrumented plan is used while `instrumentation.is_active()`.
+    """
+    instrumented = instrumentation.is_active()
+    try:
+        hash(py_type)
+    except TypeError:
+        return _cached_parameter_plan(name, _IdentityKey(py_type), instrumented)
+    return _cached_parameter_plan(name, py_type, instrumented)
+
+
+_class_plans: "weakref.WeakKeyDictionary[type, ClassPlan]" = weakref.WeakKeyDictionary()
+"""Plans are cached per class, subclasses always get their own plan."""
+
+
+def get_class_plan(cls: type) -> ClassPlan:
+    """Get the cached validation plan for `cls`, building it the first time it is requested.
+
+    Plans are only cached once all forward references resolve, so a class that references a type
+    defined later in its module is planned on the first validation after that type exists.
+    """
+    try:
+        return _class_plans[cls]
+    except KeyError:
+        plan = _class_plans[cls] = compile_class(cls)
+        return plan
+
+
+def clear_class_plans(cls: type | None = None) -> None:
+    """Remove the cached plan for `cls` (and its subclasses), or every plan if `cls` is `None`.
+
+    Only required if annotations are changed after a class has been validated.
+    """
+    if cls is None:
+        _class_plans.clear()
+        return
+    for planned_cls in list(_class_plans):
+        if issubclass(planned_cls, cls):
+            del _class_plans[planned_cls]
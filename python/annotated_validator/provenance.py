@@ -0,0 +1,130 @@
+"""Remember which objects were already validated, so they aren't validated again.
+
+In pipelines like `get_sale_items(add_items_by_dict(df, ...))` the same Dataframe is validated as
+the return value of one function and again as the input of the next one. With the `provenance`
+option, each validator records the objects it found valid in a registry keyed by the identity of
+the object (with a weak reference, so objects aren't kept alive), and skips objects it already
+validated. Objects validated by a function with a `SamplingPolicy` aren't recorded.
+
+Objects can be changed after they were validated. `invalidate` (or `clear_provenance`) removes
+an object from the registry after it is changed. With `strict_provenance`, objects are validated
+again unless they can't be changed (see `is_immutable`), e.g. read-only NumPy arrays.
+"""
+
+import threading
+import weakref
+from collections.abc import Callable, Hashable
+from typing import Any, NamedTuple, TypeAlias
+
+from .memo import cache_key
+
+Check: TypeAlias = Callable[[Any], Any]
+"""Validates a value, returns the errors if there are any (a falsy value if it is valid)."""
+
+
+class _Record(NamedTuple):
+    ref: weakref.ref
+    """Weak reference to the validated object, removes the record when the object is deleted."""
+    metadata: dict[Hashable, Any]
+    """Metadata the object is valid for, by `_metadata_key`."""
+
+
+_registry: dict[int, _Record] = {}
+"""Records of validated objects by `id`."""
+# reentrant, since an object can be collected (removing its record) while the lock is held
+_registry_lock = threading.RLock()
+
+
+def _metadata_key(metadata: Any) -> Hashable:
+    """Equal metadata (e.g. two `Gt(0)`) shares records, unhashable metadata uses its identity."""
+    try:
+        hash(metadata)
+    except TypeError:
+        return id(metadata)
+    return metadata
+
+
+def _remove(object_id: int, ref: weakref.ref) -> None:
+    with _registry_lock:
+        if (record := _registry.get(object_id)) is not None and record.ref is ref:
+            del _registry[object_id]
+
+
+def is_immutable(value: Any) -> bool:
+    """`True` if `value` can't be changed after it was validated.
+
+    Immutable values are the values that can be memoized (see `memo.cache_key`) and NumPy arrays
+    that are read-only, including every array they are a view of.
+    """
+    if cache_key(value) is not None:
+        return True
+    flags = getattr(value, "flags", None)
+    if flags is None or not hasattr(flags, "writeable"):
+        return False
+    while flags is not None:
+        if flags.writeable:
+            return False
+        value = value.base
+        if value is None or isinstance(value, bytes):
+            return True
+        flags = getattr(value, "flags", None)
+    # a view of a buffer that isn't an array (e.g. a `mmap`), which might be writeable
+    return False
+
+
+def is_validated(value: Any, metadata: Any, strict: bool = False) -> bool:
+    """`True` if `value` (the same object) was found valid for `metadata` before.
+
+    With `strict`, only objects that can't have changed since (see `is_immutable`) are valid.
+    """
+    record = _registry.get(id(value))
+    if record is None or record.ref() is not value:
+        return False
+    if _metadata_key(metadata) not in record.metadata:
+        return False
+    return not strict or is_immutable(value)
+
+
+def mark_validated(value: Any, metadata: Any) -> None:
+    """Record that `value` is valid for `metadata`, objects without weak references are ignored."""
+    object_id = id(value)
+    with _registry_lock:
+        record = _registry.get(object_id)
+        if record is None or record.ref() is not value:
+            try:
+                ref = weakref.ref(value, lambda ref: _remove(object_id, ref))
+            except TypeError:
+                # e.g. `int` and `tuple`, they can be memoized instead
+                return
+            record = _registry[object_id] = _Record(ref, {})
+        record.metadata[_metadata_key(metadata)] = metadata
+
+
+def invalidate(value: Any) -> None:
+    """Forget that `value` was validated, call it after changing an object that was validated."""
+    with _registry_lock:
+        if (record := _registry.get(id(value))) is not None and record.ref() is value:
+            del _registry[id(value)]
+
+
+def clear_provenance() -> None:
+    """Forget every validated object."""
+    with _registry_lock:
+        _registry.clear()
+
+
+def tracked_check(metadata: Any, check: Check, strict: bool = False) -> Check:
+    """Wrap the `check` of `metadata` so objects it already found valid are skipped."""
+
+    def tracked(value: Any) -> Any:
+        if not type(value).__weakrefoffset__:
+            # e.g. `int` and `tuple` can't be tracked, they can be memoized instead
+            return check(value)
+        if is_validated(value, metadata, strict):
+            return None
+        if errors := check(value):
+            return errors
+        mark_validated(value, metadata)
+        return None
+
+    return tracked
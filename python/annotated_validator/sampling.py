@@ -0,0 +1,194 @@
+"""Validate a sample of the rows in large arrays, Series and Dataframes.
+
+A `SamplingPolicy` can be added to an `Annotated` type (element-wise validators in the same
+annotation only check the sampled rows) or passed to `RequiredColumns` (value constraints only
+check the sampled rows, the schema is always checked in full):
+
+```
+SampledPrices: TypeAlias = Annotated[pd.Series, Gt(0), SamplingPolicy(rows=10_000, seed=0)]
+```
+"""
+
+import functools
+import math
+import sys
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+import annotated_types as at
+
+from .base import BaseMetaValidator, ValidatorExceptionGroup
+from .exceptions.array import InvalidElementsError
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+class Sample(NamedTuple):
+    """Rows selected from a value."""
+
+    positions: "np.ndarray"
+    """Sorted positions of the sampled rows in the original value."""
+    total: int
+    """Number of rows in the original value."""
+
+
+@dataclass(frozen=True)
+class SamplingPolicy:
+    """Selects the rows that are validated.
+
+    Rows are selected from the `head`, the `tail` and at random from the rows in between (a fixed
+    number of `rows` or a `fraction` of them). If the selection would include every row, the
+    whole value is validated.
+    """
+
+    rows: int | None = None
+    """Number of rows selected at random."""
+    fraction: float | None = None
+    """Fraction of the rows selected at random, ignored if `rows` is set."""
+    head: int = 0
+    """Number of rows always selected from the start."""
+    tail: int = 0
+    """Number of rows always selected from the end."""
+    seed: int | None = None
+    """Seed for the random number generator, the sequence of samples is reproducible if set."""
+
+    def __post_init__(self):
+        if self.rows is None and self.fraction is None and not (self.head or self.tail):
+            raise ValueError("At least one of `rows`, `fraction`, `head` or `tail` is required.")  # noqa: TRY003
+        if self.fraction is not None and not 0 <= self.fraction <= 1:
+            raise ValueError(f"`fraction`: {self.fraction} must be between 0 and 1.")  # noqa: TRY003
+
+    @functools.cached_property
+    def rng(self) -> "np.random.Generator":
+        """Random number generator shared by every sample taken with this policy.
+
+        Created on the first sample, so policies in annotations don't load NumPy on import.
+        """
+        import numpy as np
+
+        return np.random.default_rng(self.seed)
+
+    def random_rows(self, total: int) -> int:
+        """Number of rows that are selected at random from `total` rows."""
+        if self.rows is not None:
+            return self.rows
+        if self.fraction is not None:
+            return math.ceil(self.fraction * total)
+        return 0
+
+    def select(self, total: int) -> Sample | None:
+        """Select rows from `total` rows, `None` if every row should be validated."""
+        head = min(self.head, total)
+        tail = min(self.tail, total - head)
+        middle = total - head - tail
+        random_rows = self.random_rows(total)
+        if random_rows >= middle:
+            return None
+        import numpy as np
+
+        random_positions = self.rng.choice(middle, size=random_rows, replace=False, shuffle=False)
+        positions = np.concatenate(
+            [
+                np.arange(head),
+                np.sort(random_positions + head),
+                np.arange(total - tail, total),
+            ]
+        )
+        return Sample(positions, total)
+
+    def detection_probability(self, total: int, invalid: int) -> float:
+        """Probability that at least one of `invalid` rows (spread at random) is sampled.
+
+        Only the randomly selected rows are considered, so this is a lower bound when invalid rows
+        can also be in the head or tail.
+        """
+        sampled = min(self.random_rows(total), total)
+        if invalid <= 0:
+            return 0.0
+        if sampled + invalid > total:
+            return 1.0
+        # hypergeometric: 1 - C(total - invalid, sampled) / C(total, sampled)
+        log_missed = (
+            math.lgamma(total - invalid + 1)
+            + math.lgamma(total - sampled + 1)
+            - math.lgamma(total - invalid - sampled + 1)
+            - math.lgamma(total + 1)
+        )
+        return 1.0 - math.exp(log_missed)
+
+
+def take(value: Any, positions: "np.ndarray") -> Any:
+    """Rows of `value` at `positions` (first axis for arrays, rows for Dataframes)."""
+    if hasattr(value, "iloc"):
+        return value.iloc[positions]
+    import numpy as np
+
+    if isinstance(value, np.ndarray):
+        return value[positions]
+    return [value[position] for position in positions]
+
+
+def row_count(value: Any) -> int:
+    """Number of rows in `value`."""
+    shape = getattr(value, "shape", None)
+    if shape:
+        return shape[0]
+    return len(value)
+
+
+def mark_sampled(errors: BaseException, sample: Sample) -> None:
+    """Record that `errors` were found in `sample`, so positions refer to the original value."""
+    if isinstance(errors, ExceptionGroup):
+        for error in errors.exceptions:
+            mark_sampled(error, sample)
+    elif isinstance(errors, InvalidElementsError):
+        errors.sample = sample
+
+
+def sampled_message(message: str, sample: Sample) -> str:
+    """Add the size of the sample to a group message."""
+    return f"{message} (sampled {len(sample.positions):,} of {sample.total:,} rows)"
+
+
+def is_sampleable(value: Any) -> bool:
+    """`True` for values with rows that can be sampled (arrays, Series, Dataframes, sequences)."""
+    if isinstance(value, str | bytes):
+        return False
+    return getattr(value, "ndim", 0) > 0 or isinstance(value, Sequence)
+
+
+def supports_sampling(metadata: Any) -> bool:
+    """`True` if `metadata` gives the same result for each row when only some rows are checked.
+
+    Length constraints describe the whole value, so they are always checked in full. Predicates
+    can describe the whole value as well (e.g. `lambda x: x.is_monotonic_increasing`), only NumPy
+    ufuncs are known to check each element independently.
+    """
+    if isinstance(metadata, BaseMetaValidator):
+        return metadata.supports_sampling
+    if isinstance(metadata, at.Predicate):
+        # a ufunc can't exist before NumPy is loaded, so it isn't imported just to check
+        numpy = sys.modules.get("numpy")
+        return numpy is not None and isinstance(metadata.func, numpy.ufunc)
+    return not isinstance(metadata, at.MinLen | at.MaxLen | at.Len)
+
+
+def sample_check(
+    policy: SamplingPolicy, check: Callable[[Any], ValidatorExceptionGroup | None]
+) -> Callable[[Any], ValidatorExceptionGroup | None]:
+    """Wrap `check` so it only validates the rows selected by `policy`.
+
+    Scalars and values that are too small to sample are validated in full.
+    """
+
+    def check_sample(value: Any) -> ValidatorExceptionGroup | None:
+        if not is_sampleable(value) or (sample := policy.select(row_count(value))) is None:
+            return check(value)
+        if errors := check(take(value, sample.positions)):
+            mark_sampled(errors, sample)
+            return ExceptionGroup(sampled_message(errors.message, sample), errors.exceptions)
+        return None
+
+    return check_sample
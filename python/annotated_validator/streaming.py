@@ -0,0 +1,226 @@
+"""Validate the items of iterators while they are consumed.
+
+Iterators can't be validated when they are passed to (or returned from) a function without
+consuming them, so they are wrapped instead and each item is validated when it is produced. Only
+counters are kept, memory doesn't depend on the number of items.
+
+Metadata of an iterator annotation applies to each item, which is how chunked Dataframes (e.g.
+`pd.read_csv(chunksize=...)`) are validated:
+
+```
+ItemChunks: TypeAlias = Annotated[Iterator[pd.DataFrame], RequiredColumns({"cost": "int64"})]
+```
+
+Items can also be annotated directly (`Iterator[Annotated[int, Gt(0)]]`). Scalar items can be
+validated in batches with the vectorized (array) validators by adding `Batches` to the iterator:
+
+```
+Prices: TypeAlias = Annotated[Iterator[Annotated[float, Gt(0)]], Batches(1024)]
+```
+"""
+
+import collections
+import collections.abc
+import itertools
+import typing
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from typing import Annotated, Any, TypeAlias, get_args, get_origin
+
+from .base import ParameterExceptionGroup
+from .exceptions.iterator import IteratorValidationErrorGroup
+
+ItemCheck: TypeAlias = Callable[[Any], ParameterExceptionGroup | None]
+"""Validates a single item, returns the errors if there are any."""
+
+ITERATOR_TYPES = frozenset(
+    {collections.abc.Iterator, collections.abc.Generator, typing.Iterator, typing.Generator}
+)
+"""Annotations that are wrapped. `Iterable` isn't included, it can be iterated more than once."""
+
+
+@dataclass(frozen=True)
+class Batches:
+    """Validate the items of an iterator in batches of `size` items.
+
+    Each batch is converted to an array and validated once by the validators that accept arrays
+    and check each element independently (see `sampling.supports_sampling`, custom validators opt
+    in), other validators still validate each item. Items are only produced once their batch is
+    valid, so up to `size` items are read ahead and `send`/`throw` can't be used. Batches are
+    meant for scalar items, the row offset of an error is the same as the index of the item.
+    """
+
+    size: int = 1024
+    """Number of items in a batch."""
+
+    def __post_init__(self):
+        if self.size < 1:
+            raise ValueError(f"`size`: {self.size} must be greater than 0.")  # noqa: TRY003
+
+
+def iterator_batches(py_type: Any) -> Batches | None:
+    """`Batches` metadata of an iterator annotation, `None` if items are validated one at a time."""
+    if get_origin(py_type) is not Annotated:
+        return None
+    return next(
+        (metadata for metadata in py_type.__metadata__ if isinstance(metadata, Batches)), None
+    )
+
+
+def item_type(py_type: Any) -> Any | None:
+    """Type of the items of an iterator annotation, `None` if `py_type` isn't an iterator.
+
+    Metadata on the iterator (`Annotated[Iterator[X], ...]`) is added to the item type.
+    """
+    metadata: tuple[Any, ...] = ()
+    if get_origin(py_type) is Annotated:
+        metadata = tuple(
+            metadata for metadata in py_type.__metadata__ if not isinstance(metadata, Batches)
+        )
+        py_type = py_type.__origin__
+    # types with unhashable metadata in their arguments can't be hashed, only the origin is
+    if (get_origin(py_type) or py_type) not in ITERATOR_TYPES:
+        return None
+    args = get_args(py_type)
+    item = args[0] if args else Any
+    return Annotated[item, *metadata] if metadata else item
+
+
+def row_count(item: Any) -> int:
+    """Rows in a Dataframe or array item, `1` for anything else."""
+    shape = getattr(item, "shape", None)
+    return shape[0] if shape else 1
+
+
+class ValidatedIterator(Iterator):
+    """Wraps an iterator (or generator) and validates each item before it is returned.
+
+    An invalid item raises an `IteratorValidationErrorGroup` from `__next__` (or `send`) with the
+    index of the item and the number of rows before it. `send`, `throw` and `close` are forwarded
+    to the wrapped generator.
+    """
+
+    def __init__(self, iterator: Any, name: str, check: ItemCheck):
+        self.iterator = iter(iterator)
+        """Wrapped iterator."""
+        self.name = name
+        """Name of the parameter (`return` for the return value), used in error messages."""
+        self.check = check
+        self.index = 0
+        """Number of items that have been produced."""
+        self.offset = 0
+        """Number of rows in the items that have been produced."""
+
+    def _validate(self, item: Any) -> Any:
+        index, offset = self.index, self.offset
+        self.index += 1
+        self.offset += row_count(item)
+        if errors := self.check(item):
+            label = "chunk" if getattr(item, "shape", None) else "item"
+            raise IteratorValidationErrorGroup(
+                f"Validation error(s) in {label} {index} (row offset {offset}) of `{self.name}`.",
+                [errors],
+                {self.name: item},
+                index,
+                offset,
+            )
+        return item
+
+    def __iter__(self) -> "ValidatedIterator":
+        return self
+
+    def __next__(self) -> Any:
+        return self._validate(next(self.iterator))
+
+    def send(self, value: Any) -> Any:
+        """Send `value` to the wrapped generator and validate the item it produces."""
+        return self._validate(self.iterator.send(value))
+
+    def throw(self, *args: Any) -> Any:
+        """Raise an exception in the wrapped generator and validate the item it produces."""
+        return self._validate(self.iterator.throw(*args))
+
+    def close(self) -> None:
+        """Close the wrapped iterator (if it can be closed)."""
+        if (close := getattr(self.iterator, "close", None)) is not None:
+            close()
+
+    def __enter__(self) -> "ValidatedIterator":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+class BatchValidatedIterator(ValidatedIterator):
+    """Validates the items of an iterator in batches, see `Batches`.
+
+    `batch_check` validates an array of items (a batch), `check` validates each item with the
+    validators that can't validate a batch (and can be `None`). Positions in array errors are
+    relative to the start of the batch, which is the `index` of the error group.
+    """
+
+    def __init__(
+        self,
+        iterator: Any,
+        name: str,
+        check: ItemCheck | None,
+        batch_check: ItemCheck,
+        size: int,
+    ):
+        super().__init__(iterator, name, check)
+        self.batch_check = batch_check
+        self.size = size
+        """Number of items in a batch."""
+        self.buffer: collections.deque = collections.deque()
+        """Validated items that haven't been produced yet."""
+
+    def _raise(self, value: Any, errors: ParameterExceptionGroup, index: int, label: str) -> None:
+        raise IteratorValidationErrorGroup(
+            f"Validation error(s) in {label} (row offset {index}) of `{self.name}`.",
+            [errors],
+            {self.name: value},
+            index,
+            index,
+        )
+
+    def _validate_batch(self, batch: list[Any]) -> None:
+        start = self.index
+        # imported here so NumPy is only loaded once a batched iterator is validated
+        import numpy as np
+
+        values = np.asarray(batch)
+        if values.ndim == 1:
+            if errors := self.batch_check(values):
+                self._raise(values, errors, start, f"items {start}-{start + len(batch) - 1}")
+        else:
+            # items aren't scalars, each item is validated instead
+            for position, item in enumerate(batch):
+                if errors := self.batch_check(item):
+                    self._raise(item, errors, start + position, f"item {start + position}")
+        if self.check is None:
+            self.index = self.offset = start + len(batch)
+            return
+        for item in batch:
+            self._validate(item)
+
+    def __next__(self) -> Any:
+        if not self.buffer:
+            batch = list(itertools.islice(self.iterator, self.size))
+            if not batch:
+                raise StopIteration
+            self._validate_batch(batch)
+            self.buffer.extend(batch)
+        return self.buffer.popleft()
+
+    def send(self, value: Any) -> Any:  # noqa: ARG002
+        message = "Items validated in batches are read ahead, `send` can't be used."
+        raise TypeError(message)
+
+    def throw(self, *args: Any) -> Any:  # noqa: ARG002
+        message = "Items validated in batches are read ahead, `throw` can't be used."
+        raise TypeError(message)
+
+    def close(self) -> None:
+        self.buffer.clear()
+        super().close()
@@ -0,0 +1,92 @@
+"""Decompose type annotations into their origin, arguments and metadata.
+
+Used to find the metadata nested in the arguments of generic types, e.g. the `Gt(0)` in
+`list[Annotated[int, Gt(0)]]`, see `containers`.
+"""
+
+import types
+from dataclasses import dataclass
+from typing import Annotated, Any, Union, get_args, get_origin
+
+UNION_TYPES = frozenset({Union, types.UnionType})
+"""Origins of `Union[X, Y]` and `X | Y`."""
+
+
+def get_comparable_type(py_type: Any) -> Any:
+    """The type that values of `py_type` are instances of, without arguments or metadata.
+
+    Generic types are replaced by their origin (`list[int]` -> `list`), `Annotated` types by the
+    annotated type and each member of a `Union` is replaced the same way.
+    """
+    origin = get_origin(py_type)
+    if origin is None:
+        return py_type
+    arguments = get_args(py_type)
+    if origin is Annotated:
+        return get_comparable_type(arguments[0])
+    if origin in UNION_TYPES:
+        return Union[*(get_comparable_type(argument) for argument in arguments)]
+    return origin
+
+
+@dataclass(frozen=True, slots=True)
+class TypeAnnotation:
+    """A type annotation split into its parts.
+
+    `Annotated[list[int], MinLen(1)]` has the origin `Annotated`, the arguments `(list[int],)` and
+    the metadata `(MinLen(1),)`, the annotated type is decomposed by `inner`.
+    """
+
+    origin: Any
+    """Generic type (`list`, `Union`, `Annotated`), or the type itself if it isn't generic."""
+    arguments: tuple
+    """Type arguments, only the annotated type for `Annotated`."""
+    metadata: tuple
+    """Metadata of an `Annotated` type, empty for any other type."""
+    valid_base_type: Any
+    """Type that valid values are instances of, see `get_comparable_type`."""
+
+    @classmethod
+    def from_py_type(cls, py_type: Any) -> "TypeAnnotation":
+        """Decompose `py_type`, nested `Annotated` types are already flattened by Python."""
+        origin = get_origin(py_type)
+        if origin is None:
+            # a simple type without arguments
+            return cls(py_type, (), (), py_type)
+        arguments = get_args(py_type)
+        metadata: tuple = ()
+        if origin is Annotated:
+            metadata = arguments[1:]
+            arguments = arguments[:1]
+        return cls(origin, arguments, metadata, get_comparable_type(py_type))
+
+    @property
+    def is_annotated(self) -> bool:
+        """`True` for an `Annotated` type."""
+        return self.origin is Annotated
+
+    @property
+    def inner(self) -> "TypeAnnotation":
+        """The annotated type of an `Annotated` type, the annotation itself for any other type."""
+        return TypeAnnotation.from_py_type(self.arguments[0]) if self.is_annotated else self
+
+    @property
+    def optional_type(self) -> Any | None:
+        """`X` for `X | None` (or `Optional[X]`), `None` for any other type."""
+        if self.origin not in UNION_TYPES:
+            return None
+        not_none = [argument for argument in self.arguments if argument is not type(None)]
+        if len(not_none) != 1:
+            return None
+        return not_none[0]
+
+    @property
+    def has_nested_metadata(self) -> bool:
+        """`True` if any of the arguments (at any depth) is an `Annotated` type."""
+        for argument in self.inner.arguments:
+            if argument is Ellipsis:
+                continue
+            argument_annotation = TypeAnnotation.from_py_type(argument)
+            if argument_annotation.is_annotated or argument_annotation.has_nested_metadata:
+                return True
+        return False
@@ -3,32 +3,30 @@
 import functools
 import inspect
 import logging
-from abc import abstractmethod
-from typing import Any, NamedTuple, TypeAlias, get_type_hints
-
-from annotated_types import BaseMetadata, GroupedMetadata
-
-from .annotated_types_validators import get_at_validators
-from .exceptions.validator import ValidatorError
+from collections.abc import Callable
+from dataclasses import replace
+from typing import Any, ClassVar, NamedTuple
+
+# `BaseMetaValidator` and the exception group aliases are re-exported from their original location
+from .base import (  # noqa: F401
+    BaseMetaValidator,
+    ParameterExceptionGroup,
+    ValidatorExceptionGroup,
+)
+from .exceptions.validator import ValidationErrorGroup
+from .options import DEFAULT_OPTIONS, OPTION_NAMES, ValidationOptions
+from .plan import (
+    FunctionPlan,
+    ParametersCheck,
+    compile_function,
+    get_class_plan,
+    get_parameter_plan,
+    validate_parameter,
+)
 
 logger = logging.getLogger(__name__)
 
 
-class BaseMetaValidator(BaseMetadata):
-    """Base Class for all Validation Classes.
-
-    Metadata is checked to see if it of type `Validator` in order to be used for validation.
-    """
-
-    @staticmethod
-    def at_validate(metadata: "BaseMetaValidator", value) -> None | ExceptionGroup[ValidatorError]:
-        return metadata.validate(value)
-
-    @abstractmethod
-    def validate(self, value) -> None | ExceptionGroup[ValidatorError]:
-        ...
-
-
 class ParamData(NamedTuple):
     """Tuple that contains both the value and type of a parameter."""
 
@@ -38,59 +36,30 @@ class ParamData(NamedTuple):
     """Type annotation of a parameter."""
 
 
-ValidatorExceptionGroup: TypeAlias = ExceptionGroup[ValidatorError]
-"""All exceptions from a single validator are contained into this exeception group."""
-
-ParameterExceptionGroup: TypeAlias = ExceptionGroup[ValidatorExceptionGroup]
-"""All exceptions for a parameter (can include errors from multiple validators) are contained in this exception group."""
-
-
 def annotated_validator(parameters: dict[str, ParamData]) -> list[ParameterExceptionGroup]:
     """Review all passed in parameters and perform validation if the proper metatdata is found.
 
-    Metadata must be of type `Validator` to be used for validation.
+    Metadata must be of type `Validator` to be used for validation. The plan for each parameter is
+    built on the first call and cached by its name and type annotation.
     """
     parameter_exeception_groups = []
 
     for param_name, param_data in parameters.items():
-        param_metadata = getattr(param_data.py_type, "__metadata__", None)
-        if not param_metadata:
-            logger.debug("%s doesn't contain metadata, skipping validation.", param_name)
+        param_plan = get_parameter_plan(param_name, param_data.py_type)
+        if param_plan is None:
             continue
-        validation_exception_groups = []
-        for metadata in param_metadata:
-            if not isinstance(metadata, BaseMetaValidator | BaseMetadata | GroupedMetadata):
-                logger.debug(
-                    "Metadata: %s was not an instance of the `Validator` or `annotated_types.BaseMetadata`.",
-                    metadata,
-                )
-                continue
-            if isinstance(metadata, BaseMetaValidator):
-                if errors := metadata.validate(param_data.value):
-                    validation_exception_groups.append(errors)
-            # this is metadata from `annotated_types` and should be validated
-            elif isinstance(metadata, BaseMetadata | GroupedMetadata):
-                at_validators = get_at_validators(metadata)
-                errors = []
-                for at_metadata, at_validator in at_validators:
-                    at_validator_errors = at_validator(at_metadata, param_data.value)
-                    errors.extend(at_validator_errors)
-                if errors:
-                    validation_exception_groups.append(
-                        ExceptionGroup(f"`{metadata.__class__.__name__}` Validation Errors", errors)
-                    )
-        if validation_exception_groups:
-            parameter_exeception_groups.append(
-                ExceptionGroup(f"`{param_name}` Validation Errors", validation_exception_groups)
-            )
-            validation_exception_groups = []
+        if errors := validate_parameter(param_plan, param_data.value):
+            parameter_exeception_groups.append(errors)
     return parameter_exeception_groups
 
 
-def class_annotated_validator(obj: Any) -> Any:
+def class_annotated_validator(
+    obj: Any, *, force: bool = False, deep: bool | None = None, max_depth: int | None = None
+) -> Any:
     """Used to validate a Class.
 
-    Can be used to validate a Pydantic Model if you include the following method in the Pydantic Model:
+    Can be used to validate a Pydantic Model if you include the following method in the Pydantic
+    Model:
 
     ```
     @model_validator(mode="after")
@@ -98,72 +67,220 @@ def class_annotated_validator(obj: Any) -> Any:
         return class_annotated_validator(self)
     ```
 
-    Gathers info from the class that can be used in `annotated_validator`.
+    The validation plan for the class is built on the first validation and cached per class.
+    If validation is disabled for the class nothing is validated, unless `force` is `True`.
+
+    With `deep` (which defaults to the `deep` option of the class), the objects nested in the
+    attributes are validated too, up to `max_depth` levels (see `deep`).
     """
-    param_map = {
-        param_name: ParamData(value=getattr(obj, param_name), py_type=param_type)
-        for param_name, param_type in get_type_hints(obj, include_extras=True).items()
-        if param_type.__name__ == "Annotated"
-    }
-    errors = annotated_validator(param_map)
-    if errors:
-        raise ExceptionGroup(f"`{obj.__class__.__name__}` Validation Errors", errors)  # noqa: TRY003
+    plan = get_class_plan(type(obj))
+    if plan.deep if deep is None else deep:
+        from .deep import deep_errors  # imported here, only deep validation needs it
+
+        if errors := deep_errors(obj, plan, force=force, max_depth=max_depth):
+            raise ExceptionGroup(f"`{plan.name}` Validation Errors", errors)  # noqa: TRY003
+    elif (plan.enabled or force) and (errors := plan.check(obj)):
+        raise ExceptionGroup(f"`{plan.name}` Validation Errors", errors)  # noqa: TRY003
     return obj
 
 
+def _skip_validation(self) -> None:
+    """`__post_init__` of classes that have validation disabled."""
+
+
 class ValidateAnnotated:
-    """If inherited by a dataclass, perform validation on parameters with the proper metadata."""
+    """If inherited by a dataclass, perform validation on parameters with the proper metadata.
+
+    Class keywords are used as `ValidationOptions` for the class and its subclasses:
+
+    ```
+    @dataclass
+    class Item(ValidateAnnotated, generate_code=True):
+        ...
+    ```
+
+    If validation is disabled when the class is created, `__post_init__` doesn't do anything.
+    """
+
+    __validation_options__: ClassVar[ValidationOptions] = DEFAULT_OPTIONS
+
+    def __init_subclass__(cls, **options: Any):
+        class_options = {name: options.pop(name) for name in list(options) if name in OPTION_NAMES}
+        super().__init_subclass__(**options)
+        if class_options:
+            cls.__validation_options__ = replace(cls.__validation_options__, **class_options)
+        if "__post_init__" in cls.__dict__:
+            return
+        if not cls.__validation_options__.resolve(cls.__module__).enabled:
+            cls.__post_init__ = _skip_validation
+        elif cls.__post_init__ is _skip_validation:
+            # the base class has validation disabled, but this class doesn't
+            cls.__post_init__ = ValidateAnnotated.__post_init__
 
     def __post_init__(self):
         class_annotated_validator(self)
 
 
-def validate_annotated(func):
+def validate_annotated(func=None, /, **options: Any):
     """Decorator for functions that performs validation on parameters with the proper metadata.
 
     Also validates the return value if properly annotated.
+
+    The validation plan is built once when the function is decorated. If validation is disabled
+    (`enabled=False`, see `ValidationOptions`) or none of the parameters (or the return value) can
+    be validated, the original function is returned unchanged.
+
+    Can be used with keyword arguments from `ValidationOptions`:
+
+    ```
+    @validate_annotated(generate_code=True, fail_fast=True)
+    def add(num_1: PositiveInt, num_2: PositiveInt) -> PositiveInt:
+        ...
+    ```
+
+    `async def` functions return a coroutine function that validates the awaited return value,
+    only they can use async validators. Iterators (`Iterator[...]` and `Generator[...]`) are
+    wrapped and each item is validated when it is consumed (see `streaming`).
     """
+    if func is None:
+        return functools.partial(validate_annotated, **options)
+    resolved_options = ValidationOptions(**options).resolve(getattr(func, "__module__", None))
+    if not resolved_options.enabled:
+        logger.debug("Validation is disabled for `%s`, skipping the wrapper.", func.__name__)
+        return func
+    plan = compile_function(func, resolved_options)
+    if plan.is_empty:
+        logger.debug("`%s` has nothing to validate, skipping the wrapper.", func.__name__)
+        return func
+    checks = _wrapper_checks(func, plan)
+    if inspect.iscoroutinefunction(func):
+        wrapped = _wrap_coroutine_function(func, plan, checks)
+    else:
+        wrapped = _wrap_function(func, plan, checks)
+    wrapped.__validation_plan__ = plan
+    return wrapped
+
+
+class _WrapperChecks(NamedTuple):
+    """What the wrapper of a function runs, taken from its `FunctionPlan`."""
+
+    check_inputs: ParametersCheck | None
+    """Check of the parameters, `None` if none of them has metadata."""
+    wrap_arguments: Callable[[tuple, dict[str, Any]], tuple[tuple, dict[str, Any]]] | None
+    """Wraps the iterator parameters, `None` if there are none."""
+    check_return: ParametersCheck | None
+    """Check of the return value, `None` if it has no metadata."""
+    wrap_return: Callable[[Any], Any] | None
+    """Wraps the returned iterator, `None` if the return value isn't an iterator."""
+    parameter_names: tuple[str, ...]
+    """Names of the checked parameters, in the order of the values."""
+    inputs_message: str
+    """Message of the group raised for invalid parameters."""
+    return_message: str
+    """Message of the group raised for an invalid return value."""
+
+
+def _wrapper_checks(func, plan: FunctionPlan) -> _WrapperChecks:
+    """Take the checks of `plan` that the wrapper of `func` has to run."""
+    check_return, wrap_return = None, None
+    if plan.return_parameter is not None:
+        check_return = plan.check_return if plan.return_parameter.metadata else None
+        wrap_return = plan.return_parameter.wrap
+    return _WrapperChecks(
+        check_inputs=plan.check_inputs if plan.parameters else None,
+        wrap_arguments=plan.wrap_arguments if plan.wrapped_parameters else None,
+        check_return=check_return,
+        wrap_return=wrap_return,
+        parameter_names=tuple(param_plan.name for param_plan in plan.parameters),
+        inputs_message=f"Validation error(s) when processing inputs for `{func.__name__}`.",
+        return_message=f"Validation error on return value for `{func.__name__}`.",
+    )
+
+
+def _wrap_function(func, plan: FunctionPlan, checks: _WrapperChecks):
+    """Wrapper of a regular function, which runs `checks` around each call."""
+    (
+        check_inputs,
+        wrap_arguments,
+        check_return,
+        wrap_return,
+        parameter_names,
+        inputs_message,
+        return_message,
+    ) = checks
 
     @functools.wraps(func)
     def wrapped_func(*args, **kwargs):
-        # get introspection data on function
-        func_locals = locals()
-        func_signature = inspect.signature(wrapped_func)
-
-        # get map of parameter names to values
-        bound_args = func_signature.bind(*func_locals["args"], **func_locals["kwargs"])
-        bound_args.apply_defaults()
-        value_map = bound_args.arguments
-
-        type_hints = {
-            param_name: param_sig.annotation
-            for param_name, param_sig in func_signature.parameters.items()
-            if param_sig.annotation.__name__ == "Annotated"
-        }
-
-        param_map = {
-            param_name: ParamData(value=value_map[param_name], py_type=py_type)
-            for param_name, py_type in type_hints.items()
-        }
-        logger.debug("Checked Inputs: %s", param_map)
-        errors = annotated_validator(param_map)
-        if errors:
-            raise ExceptionGroup(  # noqa: TRY003
-                f"Validation error(s) when processing inputs for `{func.__name__}`. Checked Inputs: {param_map}",
-                errors,
-            )
+        if check_inputs is not None:
+            values = plan.bind_values(args, kwargs)
+            if errors := check_inputs(values):
+                checked = dict(zip(parameter_names, values, strict=True))
+                raise ValidationErrorGroup(inputs_message, errors, checked)
+        if wrap_arguments is not None:
+            args, kwargs = wrap_arguments(args, kwargs)
 
         return_value = func(*args, **kwargs)
 
-        if (return_type := func_signature.return_annotation) != inspect.Parameter.empty:
-            return_param_map = {"return": ParamData(return_value, return_type)}
-            logger.debug("Checked Return: %s", return_param_map)
-            errors = annotated_validator(return_param_map)
-            if errors:
-                raise ExceptionGroup(  # noqa: TRY003
-                    f"Validation error on return value for `{func.__name__}`. Checked Return: {return_param_map}.",
-                    errors,
-                )
+        if wrap_return is not None:
+            return wrap_return(return_value)
+        if check_return is not None and (errors := check_return((return_value,))):
+            raise ValidationErrorGroup(return_message, errors, {"return": return_value})
         return return_value
 
     return wrapped_func
+
+
+def _wrap_coroutine_function(func, plan: FunctionPlan, checks: _WrapperChecks):
+    """Wrapper of an `async def` function, which runs `checks` around each awaited call."""
+    (
+        check_inputs,
+        wrap_arguments,
+        check_return,
+        wrap_return,
+        parameter_names,
+        inputs_message,
+        return_message,
+    ) = checks
+    # checks of async plans return awaitables, other plans are run directly
+    is_async = plan.is_async
+
+    @functools.wraps(func)
+    async def wrapped_coroutine(*args, **kwargs):
+        if check_inputs is not None:
+            values = plan.bind_values(args, kwargs)
+            errors = await check_inputs(values) if is_async else check_inputs(values)
+            if errors:
+                checked = dict(zip(parameter_names, values, strict=True))
+                raise ValidationErrorGroup(inputs_message, errors, checked)
+        if wrap_arguments is not None:
+            args, kwargs = wrap_arguments(args, kwargs)
+
+        return_value = await func(*args, **kwargs)
+
+        if wrap_return is not None:
+            return wrap_return(return_value)
+        if check_return is not None:
+            values = (return_value,)
+            errors = await check_return(values) if is_async else check_return(values)
+            if errors:
+                raise ValidationErrorGroup(return_message, errors, {"return": return_value})
+        return return_value
+
+    return wrapped_coroutine
+
+
+def validated(func, /, **options: Any):
+    """Validate calls to `func` even if validation is disabled for it.
+
+    Used to re-enable validation for selected call sites, store the result instead of calling this
+    on every call:
+
+    ```
+    checked_transform = validated(transform)
+    ```
+
+    Functions that are already validated are returned unchanged.
+    """
+    if hasattr(func, "__validation_plan__"):
+        return func
+    return validate_annotated(func, **{**options, "enabled": True})
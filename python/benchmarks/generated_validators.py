@@ -0,0 +1,74 @@
+"""Compare generated validators (`generate_code=True`) with the interpreted plan."""
+
+import timeit
+from dataclasses import dataclass
+from typing import Annotated
+
+import annotated_types as at
+
+from annotated_validator.number_validators import NumberRange
+from annotated_validator.validator import ValidateAnnotated, validate_annotated
+
+NUMBER = 200_000
+
+
+def add(
+    num_1: Annotated[int, at.Gt(0), at.Lt(1000)],
+    num_2: Annotated[int, NumberRange(1, 100)],
+    name: Annotated[str, at.MinLen(1)],
+) -> Annotated[int, at.Interval(ge=0, le=10_000)]:
+    return num_1 + num_2
+
+
+@dataclass
+class PlainItem:
+    name: str
+    cost: int
+    quantity: int
+
+
+@dataclass
+class InterpretedItem(ValidateAnnotated):
+    name: Annotated[str, at.MinLen(1)]
+    cost: Annotated[int, at.Ge(0)]
+    quantity: Annotated[int, NumberRange(1, 1000)]
+
+
+@dataclass
+class GeneratedItem(ValidateAnnotated, generate_code=True):
+    name: Annotated[str, at.MinLen(1)]
+    cost: Annotated[int, at.Ge(0)]
+    quantity: Annotated[int, NumberRange(1, 1000)]
+
+
+def report(cases: dict) -> None:
+    baseline = None
+    for name, case in cases.items():
+        per_call = min(timeit.repeat(case, number=NUMBER, repeat=5)) / NUMBER
+        baseline = baseline or per_call
+        print(f"{name:<25} {per_call * 1e9:>8.0f} ns/call  ({per_call / baseline:.1f}x)")
+
+
+def main():
+    interpreted = validate_annotated(add)
+    generated = validate_annotated(generate_code=True)(add)
+    print("Function call")
+    report(
+        {
+            "undecorated": lambda: add(1, 2, "a"),
+            "interpreted": lambda: interpreted(1, 2, "a"),
+            "generated": lambda: generated(1, 2, "a"),
+        }
+    )
+    print("\nDataclass construction")
+    report(
+        {
+            "plain": lambda: PlainItem("Pens", 75, 80),
+            "interpreted": lambda: InterpretedItem("Pens", 75, 80),
+            "generated": lambda: GeneratedItem("Pens", 75, 80),
+        }
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""Compare serial and thread pool (`parallel=True`) validation of several large Dataframes."""
+
+import timeit
+from typing import Annotated, TypeAlias
+
+import annotated_types as at
+import numpy as np
+import pandas as pd
+
+from annotated_validator.pandas_validators import RequiredColumns
+from annotated_validator.parallel import CPU_COUNT
+from annotated_validator.validator import validate_annotated
+
+NUMBER = 10
+ROWS = 5_000_000
+
+Items: TypeAlias = Annotated[
+    pd.DataFrame,
+    RequiredColumns(
+        {
+            "cost": Annotated["float64", at.Ge(0), at.Lt(2)],
+            "quantity": Annotated["int64", at.Gt(-1)],
+        }
+    ),
+]
+
+
+def merge(items_1: Items, items_2: Items, items_3: Items) -> None:
+    return None
+
+
+def main():
+    frames = [
+        pd.DataFrame({"cost": np.random.rand(ROWS), "quantity": np.arange(ROWS)}) for _ in range(3)
+    ]
+    print(f"{CPU_COUNT} CPUs, 3 Dataframes with {ROWS:,} rows")
+    for name, func in {
+        "serial": validate_annotated(merge),
+        "parallel": validate_annotated(parallel=True)(merge),
+    }.items():
+        per_call = min(timeit.repeat(lambda: func(*frames), number=NUMBER, repeat=3)) / NUMBER
+        print(f"{name:<10} {per_call * 1e3:>8.2f} ms/call")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,322 @@
+"""Benchmark suite for the hot paths of `annotated_validator`, time and peak memory per call.
+
+Each benchmark is timed with `timeit` (the number of calls is calibrated so a run takes at least
+0.2 seconds, the fastest of `--repeat` runs is reported) and the peak memory allocated by a single
+call is recorded with `tracemalloc`. Results can be saved and compared with a previous run, which
+fails if a benchmark got slower or allocates more memory than `--tolerance` allows:
+
+```
+python python/benchmarks/suite.py --save baseline.json
+python python/benchmarks/suite.py --compare baseline.json -k required_columns
+```
+"""
+
+import argparse
+import functools
+import gc
+import json
+import os
+import subprocess
+import sys
+import timeit
+import tracemalloc
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Annotated, Any, NamedTuple, Self, TypeAlias
+
+import annotated_types as at
+import numpy as np
+import pandas as pd
+from pydantic import BaseModel, ConfigDict, model_validator
+
+import annotated_validator
+from annotated_validator.pandas_validators import RequiredColumns
+from annotated_validator.validator import (
+    ValidateAnnotated,
+    class_annotated_validator,
+    validate_annotated,
+)
+
+MEMORY_SLACK = 1024
+"""Bytes a benchmark can allocate above the tolerance, so tiny allocations aren't regressions."""
+
+
+class Benchmark(NamedTuple):
+    """A single measured call."""
+
+    name: str
+    """Unique name, `<group>.<case>`."""
+    setup: Callable[[], Callable[[], Any]]
+    """Builds the inputs and returns the measured call (called without arguments), it is only
+    called once the benchmark is selected so unselected benchmarks don't allocate their inputs."""
+
+
+class Result(NamedTuple):
+    """Measurements of a benchmark."""
+
+    name: str
+    """Name of the benchmark."""
+    seconds: float
+    """Fastest time per call."""
+    peak_bytes: int
+    """Peak memory allocated during a call."""
+
+
+def add(num_1: Annotated[int, at.Gt(0)], num_2: int, *, num_3: int = 0) -> Annotated[int, at.Gt(0)]:
+    return num_1 + num_2 + num_3
+
+
+def add_without_metadata(num_1: int, num_2: int, *, num_3: int = 0) -> int:
+    return num_1 + num_2 + num_3
+
+
+def decorator_benchmarks() -> Iterator[Benchmark]:
+    """Per-call overhead of `validate_annotated` compared with an undecorated function."""
+    cases = {
+        "undecorated": add,
+        "validate_annotated": validate_annotated(add),
+        "no_metadata": validate_annotated(add_without_metadata),
+        "generate_code": validate_annotated(generate_code=True)(add),
+    }
+    for name, func in cases.items():
+        yield Benchmark(f"decorator.{name}", lambda func=func: lambda: func(1, 2, num_3=3))
+
+
+@dataclass
+class PlainItem:
+    name: str
+    cost: int
+    quantity: int
+
+
+@dataclass
+class ValidatedItem(ValidateAnnotated):
+    name: Annotated[str, at.MinLen(1)]
+    cost: Annotated[int, at.Ge(0)]
+    quantity: Annotated[int, at.Gt(0)]
+
+
+@dataclass
+class GeneratedItem(ValidateAnnotated, generate_code=True):
+    name: Annotated[str, at.MinLen(1)]
+    cost: Annotated[int, at.Ge(0)]
+    quantity: Annotated[int, at.Gt(0)]
+
+
+def dataclass_benchmarks() -> Iterator[Benchmark]:
+    """`ValidateAnnotated` dataclass construction compared with a plain dataclass."""
+    for cls in (PlainItem, ValidatedItem, GeneratedItem):
+        yield Benchmark(f"dataclass.{cls.__name__}", lambda cls=cls: lambda: cls("Pens", 75, 80))
+
+
+DfWithItemColumns: TypeAlias = Annotated[
+    pd.DataFrame,
+    RequiredColumns({"name": "object", "cost": "int64", "quantity": "int64", "on_sale": "bool"}),
+]
+
+
+class PlainLocations(BaseModel):
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    cleveland: pd.DataFrame
+    columbus: pd.DataFrame
+
+
+class ValidatedLocations(PlainLocations):
+    """The pattern from `examples/pandas_pydantic.py`."""
+
+    cleveland: DfWithItemColumns
+    columbus: DfWithItemColumns
+
+    @model_validator(mode="after")
+    def model_validate_annotated(self) -> Self:
+        return class_annotated_validator(self)
+
+
+def pydantic_benchmarks() -> Iterator[Benchmark]:
+    """Pydantic models validated by `class_annotated_validator` compared with plain models."""
+
+    def setup(cls: type[PlainLocations]) -> Callable[[], Any]:
+        df = item_frame(100, 0)
+        return lambda: cls(cleveland=df, columbus=df)
+
+    for cls in (PlainLocations, ValidatedLocations):
+        yield Benchmark(f"pydantic.{cls.__name__}", functools.partial(setup, cls))
+
+
+REQUIRED_COLUMNS = RequiredColumns(
+    {"name": "object", "cost": "int64", "quantity": "int64", "on_sale": "bool"}
+)
+REQUIRED_COLUMNS_WITH_VALUES = RequiredColumns(
+    {
+        "name": at.MinLen(1),
+        "cost": Annotated["int64", at.Ge(0)],
+        "quantity": Annotated["int64", at.Gt(0)],
+        "on_sale": "bool",
+    }
+)
+
+
+def item_frame(rows: int, extra_columns: int) -> pd.DataFrame:
+    """Item columns followed by `extra_columns` columns that aren't validated."""
+    df = pd.DataFrame(
+        {
+            "name": np.full(rows, "Pens", dtype=object),
+            "cost": np.arange(rows, dtype="int64"),
+            "quantity": np.ones(rows, dtype="int64"),
+            "on_sale": np.zeros(rows, dtype=bool),
+        }
+    )
+    extra = pd.DataFrame(
+        np.zeros((rows, extra_columns), dtype=np.int8),
+        columns=[f"extra_{i}" for i in range(extra_columns)],
+    )
+    return pd.concat([df, extra], axis=1)
+
+
+def required_columns_benchmarks(huge_rows: int) -> Iterator[Benchmark]:
+    """`RequiredColumns` on narrow and wide, small and huge Dataframes."""
+
+    def setup(
+        required_columns: RequiredColumns, rows: int, extra_columns: int
+    ) -> Callable[[], Any]:
+        df = item_frame(rows, extra_columns)
+        return lambda: required_columns.validate(df)
+
+    for size, rows in (("small", 100), ("huge", huge_rows)):
+        for width, extra_columns in (("narrow", 0), ("wide", 500)):
+            yield Benchmark(
+                f"required_columns.{size}_{width}.schema",
+                functools.partial(setup, REQUIRED_COLUMNS, rows, extra_columns),
+            )
+            yield Benchmark(
+                f"required_columns.{size}_{width}.values",
+                functools.partial(setup, REQUIRED_COLUMNS_WITH_VALUES, rows, extra_columns),
+            )
+
+
+@validate_annotated
+def total_cost(costs: list[Annotated[float, at.Ge(0), at.Lt(1_000)]]) -> float:
+    return sum(costs)
+
+
+def container_benchmarks(huge_rows: int) -> Iterator[Benchmark]:
+    """Elements of small lists one at a time, elements of huge lists as an array."""
+
+    def setup(rows: int) -> Callable[[], Any]:
+        costs = [float(row % 1_000) for row in range(rows)]
+        return lambda: total_cost(costs)
+
+    for size, rows in (("small", 16), ("huge", huge_rows)):
+        yield Benchmark(f"containers.{size}_list", functools.partial(setup, rows))
+
+
+def import_benchmarks() -> Iterator[Benchmark]:
+    """Cold start of a new interpreter that imports a module, compared with an empty interpreter.
+
+    Use `python -X importtime -c "import annotated_validator.validator"` to find slow imports.
+    """
+    source_path = str(Path(annotated_validator.__file__).parents[1])
+    env = {
+        **os.environ,
+        "PYTHONPATH": os.pathsep.join([source_path, os.environ.get("PYTHONPATH", "")]),
+    }
+    cases = {
+        "python": "pass",
+        "validator": "import annotated_validator.validator",
+        "pandas_validators": "import annotated_validator.pandas_validators",
+    }
+    for name, source in cases.items():
+        command = [sys.executable, "-c", source]
+        yield Benchmark(
+            f"import.{name}",
+            lambda command=command: lambda: subprocess.run(command, check=True, env=env),
+        )
+
+
+def all_benchmarks(huge_rows: int) -> Iterator[Benchmark]:
+    """Every benchmark in the suite, inputs are only built by `Benchmark.setup`."""
+    yield from import_benchmarks()
+    yield from decorator_benchmarks()
+    yield from dataclass_benchmarks()
+    yield from pydantic_benchmarks()
+    yield from required_columns_benchmarks(huge_rows)
+    yield from container_benchmarks(huge_rows)
+
+
+def measure(benchmark: Benchmark, repeat: int) -> Result:
+    """Build the inputs of `benchmark`, time it and record the peak memory of a single call."""
+    func = benchmark.setup()
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    seconds = min(timer.repeat(repeat=repeat, number=number)) / number
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return Result(benchmark.name, seconds, peak - before)
+
+
+def regressions(
+    results: list[Result], baseline: dict[str, dict[str, float]], tolerance: float
+) -> list[str]:
+    """Benchmarks that are slower or use more memory than `baseline` (by more than `tolerance`)."""
+    messages = []
+    for result in results:
+        if (previous := baseline.get(result.name)) is None:
+            continue
+        if result.seconds > previous["seconds"] * (1 + tolerance):
+            messages.append(
+                f"{result.name}: {format_time(previous['seconds'])} -> "
+                f"{format_time(result.seconds)}"
+            )
+        if result.peak_bytes > previous["peak_bytes"] * (1 + tolerance) + MEMORY_SLACK:
+            messages.append(
+                f"{result.name}: {previous['peak_bytes']:,} -> {result.peak_bytes:,} bytes"
+            )
+    return messages
+
+
+def format_time(seconds: float) -> str:
+    for unit, scale in (("ns", 1e9), ("us", 1e6), ("ms", 1e3)):
+        if seconds * scale < 10_000:
+            return f"{seconds * scale:,.1f} {unit}"
+    return f"{seconds:,.2f} s"
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-k", default="", help="only run benchmarks that contain this text")
+    parser.add_argument("--repeat", type=int, default=5, help="timing runs per benchmark")
+    parser.add_argument("--huge-rows", type=int, default=1_000_000, help="rows in huge frames")
+    parser.add_argument("--save", type=Path, help="save the results to a JSON file")
+    parser.add_argument("--compare", type=Path, help="compare with results saved by `--save`")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed relative increase")
+    args = parser.parse_args(argv)
+
+    results = []
+    for benchmark in all_benchmarks(args.huge_rows):
+        if args.k not in benchmark.name:
+            continue
+        result = measure(benchmark, args.repeat)
+        results.append(result)
+        print(f"{result.name:<45} {format_time(result.seconds):>12} {result.peak_bytes:>14,} B")
+
+    if args.save is not None:
+        args.save.write_text(json.dumps({result.name: result._asdict() for result in results}))
+    if args.compare is not None:
+        baseline = json.loads(args.compare.read_text())
+        if messages := regressions(results, baseline, args.tolerance):
+            print("\nRegressions:", *messages, sep="\n  ")
+            return 1
+        print(f"\nNo regressions compared with {args.compare}.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
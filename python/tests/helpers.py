@@ -0,0 +1,10 @@
+"""Helpers shared by the tests."""
+
+from typing import Any
+
+
+def error_tree(error: BaseException | None) -> Any:
+    """Comparable structure of nested exception groups, `None` if there is no error."""
+    if isinstance(error, ExceptionGroup):
+        return (error.message, [error_tree(sub_error) for sub_error in error.exceptions])
+    return error if error is None else (type(error).__name__, str(error))
@@ -0,0 +1,158 @@
+from typing import Annotated
+
+import annotated_types as at
+import numpy as np
+import pandas as pd
+import pytest
+
+from annotated_validator.exceptions.annotated_types import (
+    ArrayGreaterThanError,
+    ArrayPredicateError,
+    GreaterThanError,
+    MultipleOfError,
+    PredicateError,
+)
+from annotated_validator.exceptions.number import HighBoundError, LowBoundError
+from annotated_validator.number_validators import NumberRange
+from annotated_validator.pandas_validators import RequiredColumns
+from annotated_validator.validator import validate_annotated
+
+
+@validate_annotated
+def positive_series(series: Annotated[pd.Series, at.Gt(0)]) -> Annotated[pd.Series, at.Le(10)]:
+    return series * 2
+
+
+@validate_annotated(generate_code=True)
+def unit_interval(array: Annotated[np.ndarray, NumberRange(0, 1)]) -> float:
+    return float(array.sum())
+
+
+def leaf_errors(error: ExceptionGroup) -> list[Exception]:
+    return [
+        leaf
+        for sub_error in error.exceptions
+        for leaf in (leaf_errors(sub_error) if isinstance(sub_error, ExceptionGroup) else [sub_error])
+    ]
+
+
+def test_valid_series():
+    positive_series(pd.Series([1, 2, 3]))
+
+
+def test_invalid_series_reports_positions():
+    with pytest.raises(ExceptionGroup) as exc_info:
+        positive_series(pd.Series([1, -2, 3, 0, float("nan")]))
+    (error,) = leaf_errors(exc_info.value)
+    assert isinstance(error, ArrayGreaterThanError)
+    assert isinstance(error, GreaterThanError)
+    assert error.positions.tolist() == [1, 3]
+    assert error.count == 2
+    assert "2 of 5 values are not greater than the Bound: 0" in str(error)
+
+
+def test_invalid_series_return():
+    with pytest.raises(ExceptionGroup, match="return value"):
+        positive_series(pd.Series([1, 6]))
+
+
+def test_nullable_series_ignores_missing_values():
+    positive_series(pd.Series([1, None, 3], dtype="Int64"))
+
+
+def test_number_range_array():
+    assert unit_interval(np.array([0, 0.5, 0.75, 1.0])) == 2.25
+    with pytest.raises(ExceptionGroup) as exc_info:
+        unit_interval(np.array([-5, 0.75, 1.5, 2.0]))
+    low_error, high_error = leaf_errors(exc_info.value)
+    assert isinstance(low_error, LowBoundError)
+    assert low_error.positions.tolist() == [0]
+    assert isinstance(high_error, HighBoundError)
+    assert high_error.positions.tolist() == [2, 3]
+
+
+@pytest.mark.parametrize(
+    ("number_range", "valid", "invalid", "error_type"),
+    [
+        (NumberRange(low=0, high=None), 0, -5, LowBoundError),
+        (NumberRange(low=None, high=0), 0, 5, HighBoundError),
+        (NumberRange(low=0, high=1, low_inclusive=False), 1, 0, LowBoundError),
+    ],
+)
+def test_number_range_zero_bounds(number_range, valid, invalid, error_type):
+    assert number_range.validate(valid) is None
+    (error,) = number_range.validate(invalid).exceptions
+    assert type(error) is error_type
+    (array_error,) = number_range.validate(np.array([valid, invalid, valid])).exceptions
+    assert isinstance(array_error, error_type)
+    assert array_error.positions.tolist() == [1]
+
+
+def test_multiple_of_array():
+    @validate_annotated
+    def even(array: Annotated[np.ndarray, at.MultipleOf(2)]) -> None:
+        ...
+
+    with pytest.raises(ExceptionGroup) as exc_info:
+        even(np.arange(6))
+    (error,) = leaf_errors(exc_info.value)
+    assert isinstance(error, MultipleOfError)
+    assert error.positions.tolist() == [1, 3, 5]
+    assert error.multiple == 2
+
+
+def test_message_only_reports_first_positions():
+    with pytest.raises(ExceptionGroup) as exc_info:
+        positive_series(pd.Series(np.zeros(1_000)))
+    (error,) = leaf_errors(exc_info.value)
+    assert error.count == 1_000
+    assert "first 10" in str(error)
+
+
+@validate_annotated
+def finite(
+    values: Annotated[object, at.Predicate(np.isfinite), at.Predicate(lambda x: np.size(x) < 5)],
+):
+    return values
+
+
+@pytest.mark.parametrize(
+    ("values", "positions"),
+    [
+        (np.array([1.0, np.nan, np.inf]), [1, 2]),
+        (pd.Series([1.0, np.nan]), [1]),
+        (pd.Series([1, None], dtype="Int64"), []),
+        (np.array([[1.0, np.nan]]), [1]),
+    ],
+)
+def test_array_predicate(values, positions):
+    if not positions:
+        finite(values)
+        return
+    with pytest.raises(ExceptionGroup) as exc_info:
+        finite(values)
+    (error,) = leaf_errors(exc_info.value)
+    assert isinstance(error, ArrayPredicateError)
+    assert isinstance(error, PredicateError)
+    assert error.positions.tolist() == positions
+    assert "don't satisfy the predicate: isfinite" in str(error)
+
+
+def test_whole_value_and_scalar_predicates():
+    with pytest.raises(ExceptionGroup) as exc_info:
+        finite(np.ones(5))
+    (error,) = leaf_errors(exc_info.value)
+    assert type(error) is PredicateError
+    assert "doesn't satisfy the predicate: <lambda>" in str(error)
+    with pytest.raises(ExceptionGroup) as exc_info:
+        finite(float("nan"))
+    (error,) = leaf_errors(exc_info.value)
+    assert str(error) == "Value: nan doesn't satisfy the predicate: isfinite"
+
+
+def test_predicate_column():
+    required_columns = RequiredColumns({"cost": Annotated["float64", at.Predicate(np.isfinite)]})
+    assert required_columns.validate(pd.DataFrame({"cost": [1.0, 2.0]})) is None
+    error = required_columns.validate(pd.DataFrame({"cost": [1.0, np.inf]}))
+    (leaf,) = leaf_errors(error)
+    assert leaf.positions.tolist() == [1]
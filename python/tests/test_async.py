@@ -0,0 +1,120 @@
+import asyncio
+import threading
+from dataclasses import dataclass
+from typing import Annotated, Any
+
+import annotated_types as at
+import numpy as np
+import pytest
+from helpers import error_tree
+
+from annotated_validator.base import BaseMetaValidator
+from annotated_validator.plan import get_class_plan
+from annotated_validator.validator import ValidateAnnotated, validate_annotated
+
+
+@dataclass
+class AsyncPositive(BaseMetaValidator):
+    delay: float = 0
+
+    async def validate(self, value) -> ExceptionGroup | None:
+        await asyncio.sleep(self.delay)
+        if value <= 0:
+            return ExceptionGroup("async_positive", [ValueError(f"{value} is not positive")])
+        return None
+
+
+@dataclass
+class RecordThread(BaseMetaValidator):
+    threads: list
+
+    def validate(self, value) -> None:
+        self.threads.append(threading.current_thread())
+
+
+def test_awaited_return_value_is_validated():
+    @validate_annotated
+    async def negate(num: int) -> Annotated[int, at.Gt(0)]:
+        return -num
+
+    assert asyncio.iscoroutinefunction(negate)
+    assert asyncio.run(negate(-1)) == 1
+    with pytest.raises(ExceptionGroup) as exc_info:
+        asyncio.run(negate(1))
+    assert exc_info.value.checked == {"return": -1}
+
+
+def test_async_validators_run_concurrently():
+    @validate_annotated
+    async def add(
+        num_1: Annotated[int, AsyncPositive(0.1)], num_2: Annotated[int, AsyncPositive(0.1)]
+    ) -> Annotated[int, AsyncPositive(0)]:
+        return num_1 + num_2
+
+    async def timed() -> float:
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        assert await add(1, 2) == 3
+        return loop.time() - start
+
+    assert asyncio.run(timed()) < 0.18
+
+
+def test_async_errors_match_sync_structure():
+    @validate_annotated
+    async def check(value: Annotated[int, at.Gt(0), AsyncPositive(), at.Lt(5)]):
+        return value
+
+    with pytest.raises(ExceptionGroup) as exc_info:
+        asyncio.run(check(-1))
+    assert error_tree(exc_info.value.exceptions[0]) == (
+        "`value` Validation Errors",
+        [
+            (
+                "`Gt` Validation Errors",
+                [("GreaterThanError", "Value: -1 is not greater than the Bound: 0")],
+            ),
+            ("async_positive", [("ValueError", "-1 is not positive")]),
+        ],
+    )
+
+
+def test_async_fail_fast():
+    @validate_annotated(fail_fast=True)
+    async def check(num_1: Annotated[int, AsyncPositive()], num_2: Annotated[int, at.Gt(0)]):
+        return num_1
+
+    with pytest.raises(ExceptionGroup) as exc_info:
+        asyncio.run(check(-1, -1))
+    assert len(exc_info.value.exceptions) == 1
+    assert exc_info.value.exceptions[0].message == "`num_1` Validation Errors"
+
+
+def test_async_validators_require_async_functions():
+    with pytest.raises(TypeError):
+
+        @validate_annotated
+        def check(value: Annotated[int, AsyncPositive()]):
+            return value
+
+    @dataclass
+    class Item(ValidateAnnotated):
+        cost: Annotated[int, AsyncPositive()]
+
+    with pytest.raises(TypeError):
+        get_class_plan(Item)
+
+
+@pytest.mark.parametrize(
+    ("offload", "value"), [(True, np.ones(3)), (False, np.ones(3)), (True, 1)]
+)
+def test_offload(offload, value):
+    threads = []
+
+    @validate_annotated(offload=offload)
+    async def check(value: Annotated[Any, RecordThread(threads)]):
+        return value
+
+    asyncio.run(check(value))
+    offloaded = offload and isinstance(value, np.ndarray)
+    assert (threads[0] is not threading.main_thread()) == offloaded
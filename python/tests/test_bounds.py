@@ -0,0 +1,121 @@
+import logging
+from dataclasses import dataclass
+from decimal import Decimal
+from fractions import Fraction
+from typing import Annotated, Any
+
+import annotated_types as at
+import numpy as np
+import pytest
+from helpers import error_tree
+
+from annotated_validator.bounds import Bound, fold_bounds
+from annotated_validator.number_validators import NumberRange
+from annotated_validator.plan import (
+    compile_parameter,
+    validate_parameter,
+    validate_parameter_first_error,
+)
+from annotated_validator.validator import ParamData, annotated_validator
+
+STACKED = (at.Ge(0), at.Lt(100), NumberRange(1, 50), at.MultipleOf(2))
+VALUES = [
+    -1,
+    0,
+    1,
+    2,
+    3,
+    50,
+    52,
+    100,
+    True,
+    2.0,
+    float("nan"),
+    float("inf"),
+    Decimal("4"),
+    Fraction(101, 1),
+    np.int64(60),
+    np.array([0, 2, 60]),
+]
+
+
+def test_tightest_bounds():
+    bounds = fold_bounds("value", STACKED)
+    assert bounds.low == Bound(1, True, STACKED[2])
+    assert bounds.high == Bound(50, True, STACKED[2])
+
+
+def test_exclusive_bound_is_tighter():
+    bounds = fold_bounds("value", (at.Ge(1), at.Interval(gt=1, le=5), at.Lt(5)))
+    assert (bounds.low.value, bounds.low.inclusive) == (1, False)
+    assert (bounds.high.value, bounds.high.inclusive) == (5, False)
+
+
+def test_zero_bounds():
+    bounds = fold_bounds("value", (NumberRange(0, None), at.Le(0)))
+    assert (bounds.low.value, bounds.high.value) == (0, 0)
+    assert fold_bounds("value", (NumberRange(0, None), at.Lt(0))).is_empty
+
+
+@pytest.mark.parametrize(
+    "metadata",
+    [
+        at.MultipleOf(2),
+        at.Gt(float("nan")),
+        at.Gt("a"),
+    ],
+)
+def test_not_folded(metadata):
+    assert fold_bounds("value", (metadata,)) is None
+
+
+def test_subclasses_are_not_folded():
+    @dataclass
+    class Percentage(NumberRange):
+        pass
+
+    plan = compile_parameter("value", Annotated[int, at.Gt(0), Percentage(0, 100)])
+    assert [metadata_plan.metadata for metadata_plan in plan.folded.remaining] == [
+        Percentage(0, 100)
+    ]
+
+
+@pytest.mark.parametrize("fail_fast", [False, True])
+@pytest.mark.parametrize("value", VALUES, ids=repr)
+def test_same_errors_as_unfolded_plan(value, fail_fast):
+    plan = compile_parameter("value", Annotated[Any, *STACKED])
+    assert plan.folded is not None
+    validate = validate_parameter_first_error if fail_fast else validate_parameter
+    assert error_tree(validate(plan, value)) == error_tree(
+        validate(plan._replace(folded=None), value)
+    )
+
+
+def test_errors_name_the_failed_constraint():
+    plan = compile_parameter("value", Annotated[int, *STACKED])
+    assert error_tree(validate_parameter(plan, 52)) == (
+        "`value` Validation Errors",
+        [
+            ("number_range", [("HighBoundError", "52 is larger than the higher bound: 50")]),
+        ],
+    )
+
+
+def test_contradictory_bounds_are_logged_once(caplog):
+    py_type = Annotated[int, at.Gt(10), at.Lt(5)]
+    with caplog.at_level(logging.WARNING):
+        plan = compile_parameter("value", py_type)
+        for value in (1, 7, 12):
+            assert validate_parameter(plan, value) is not None
+    assert [record.getMessage() for record in caplog.records] == [
+        "`value`: no number satisfies Gt(gt=10) and Lt(lt=5), every number is invalid."
+    ]
+    assert plan.folded is None
+
+
+def test_contradictory_bounds_are_logged_once_by_annotated_validator(caplog):
+    parameters = {"value": ParamData(7, Annotated[int, at.Gt(20), at.Lt(15)])}
+    with caplog.at_level(logging.WARNING):
+        for _ in range(3):
+            assert len(annotated_validator(parameters)) == 1
+    assert len(caplog.records) == 1
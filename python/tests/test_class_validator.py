@@ -0,0 +1,85 @@
+from dataclasses import dataclass
+from typing import Annotated, Self
+
+import annotated_types as at
+import pytest
+from pydantic import BaseModel, model_validator
+
+from annotated_validator.number_validators import NumberRange
+from annotated_validator.plan import clear_class_plans, get_class_plan
+from annotated_validator.validator import ValidateAnnotated, class_annotated_validator
+
+
+@dataclass
+class Numbers(ValidateAnnotated):
+    num_1: Annotated[int, at.Gt(0)]
+    num_2: int
+
+
+@dataclass
+class MoreNumbers(Numbers):
+    num_3: Annotated[int, at.Lt(0)] = -1
+
+
+@dataclass
+class Later(ValidateAnnotated):
+    value: "Annotated[int, DefinedLater]"
+
+
+class PydanticNumbers(BaseModel):
+    num_1: Annotated[int, at.Gt(0)]
+    num_2: "Annotated[int, NumberRange(low=1, high=None)]"
+
+    @model_validator(mode="after")
+    def model_validate_annotated(self) -> Self:
+        return class_annotated_validator(self)
+
+
+def test_dataclass_validation():
+    Numbers(1, -1)
+    with pytest.raises(ExceptionGroup, match="`Numbers` Validation Errors"):
+        Numbers(-1, 1)
+
+
+def test_plan_is_cached_per_class():
+    Numbers(1, 1)
+    MoreNumbers(1, 1)
+    assert get_class_plan(Numbers) is get_class_plan(Numbers)
+    assert [param_plan.name for param_plan in get_class_plan(Numbers).parameters] == ["num_1"]
+    assert [param_plan.name for param_plan in get_class_plan(MoreNumbers).parameters] == [
+        "num_1",
+        "num_3",
+    ]
+
+
+def test_subclass_validates_inherited_fields():
+    with pytest.raises(ExceptionGroup, match="`MoreNumbers` Validation Errors") as exc_info:
+        MoreNumbers(-1, 1, 1)
+    assert len(exc_info.value.exceptions) == 2
+
+
+def test_unresolved_forward_reference_is_not_cached():
+    global DefinedLater
+    with pytest.raises(NameError):
+        Later(1)
+    DefinedLater = at.Gt(0)
+    try:
+        Later(1)
+        with pytest.raises(ExceptionGroup):
+            Later(-1)
+    finally:
+        del DefinedLater
+        clear_class_plans(Later)
+
+
+def test_clear_class_plans_includes_subclasses():
+    get_class_plan(Numbers)
+    moreplan = get_class_plan(MoreNumbers)
+    clear_class_plans(Numbers)
+    assert get_class_plan(MoreNumbers) is not moreplan
+
+
+def test_pydantic_model_validation_with_string_annotation():
+    PydanticNumbers(num_1=1, num_2=1)
+    with pytest.raises(ExceptionGroup, match="`PydanticNumbers` Validation Errors"):
+        PydanticNumbers(num_1=1, num_2=-1)
@@ -0,0 +1,116 @@
+import re
+from dataclasses import dataclass
+from typing import Annotated, Any
+
+import annotated_types as at
+import pytest
+from helpers import error_tree
+
+from annotated_validator.number_validators import NumberRange
+from annotated_validator.validator import ValidateAnnotated, validate_annotated
+
+METADATA = [
+    at.Gt(0),
+    at.Ge(0),
+    at.Lt(10),
+    at.Le(10),
+    at.MultipleOf(3),
+    at.Interval(gt=0, le=10),
+    NumberRange(low=1, high=9),
+    NumberRange(low=1, high=9, low_inclusive=False, high_inclusive=False),
+    NumberRange(low=None, high=5),
+    NumberRange(low=0, high=None),
+    NumberRange(low=None, high=0, high_inclusive=False),
+]
+VALUES = [-3, 0, 1, 3, 5, 9, 10, 12, 2.5, float("nan"), float("inf")]
+
+
+def call_errors(func, *args) -> Any:
+    try:
+        return ("returned", func(*args))
+    except ExceptionGroup as error:
+        return error_tree(error)
+
+
+def make_functions(*metadata):
+    def func(value: Annotated[Any, *metadata]) -> Annotated[Any, *metadata]:
+        return value
+
+    return validate_annotated(func), validate_annotated(generate_code=True)(func)
+
+
+@pytest.mark.parametrize("metadata", METADATA)
+@pytest.mark.parametrize("value", VALUES)
+def test_single_metadata_parity(metadata, value):
+    interpreted, generated = make_functions(metadata)
+    assert call_errors(interpreted, value) == call_errors(generated, value)
+
+
+@pytest.mark.parametrize("value", VALUES)
+def test_stacked_metadata_parity(value):
+    interpreted, generated = make_functions(at.Ge(0), at.Lt(10), NumberRange(1, 5), at.MultipleOf(2))
+    assert call_errors(interpreted, value) == call_errors(generated, value)
+
+
+@pytest.mark.parametrize("value", ["", "a", "abc", [], [1, 2, 3]])
+@pytest.mark.parametrize("metadata", [at.MinLen(2), at.Len(1, 3), at.MinLen(-1)])
+def test_length_parity(metadata, value):
+    interpreted, generated = make_functions(metadata)
+    assert call_errors(interpreted, value) == call_errors(generated, value)
+
+
+def test_type_errors_are_raised_by_both():
+    interpreted, generated = make_functions(at.Gt(0))
+    for func in (interpreted, generated):
+        with pytest.raises(TypeError):
+            func("a string")
+
+
+def test_comparisons_are_inlined():
+    generated = make_functions(at.Gt(0), NumberRange(1, 9))[1]
+    source = generated.__validation_plan__.check_return.__source__
+    assert re.search(r"_b\d+ >= _v0", source)
+    assert "_validate(" in source
+
+
+def test_unsupported_metadata_is_skipped():
+    interpreted, generated = make_functions(at.MaxLen(3), at.Gt(0))
+    assert call_errors(interpreted, 1) == call_errors(generated, 1)
+
+
+@dataclass
+class InterpretedItem(ValidateAnnotated):
+    name: Annotated[str, at.MinLen(1)]
+    cost: Annotated[int, at.Ge(0)]
+    quantity: Annotated[int, NumberRange(1, 100)]
+
+
+@dataclass
+class GeneratedItem(ValidateAnnotated, generate_code=True):
+    name: Annotated[str, at.MinLen(1)]
+    cost: Annotated[int, at.Ge(0)]
+    quantity: Annotated[int, NumberRange(1, 100)]
+
+
+@dataclass
+class GeneratedSubItem(GeneratedItem):
+    on_sale: Annotated[int, at.Lt(2)] = 0
+
+
+def test_class_options_are_inherited():
+    assert GeneratedSubItem.__validation_options__.generate_code
+    assert not InterpretedItem.__validation_options__.generate_code
+
+
+@pytest.mark.parametrize(
+    "args", [("Pens", 75, 80), ("", 75, 80), ("Pens", -1, 0), ("", -1, 101)]
+)
+def test_class_parity(args):
+    def construct(cls):
+        try:
+            cls(*args)
+        except ExceptionGroup as error:
+            return [error_tree(sub_error) for sub_error in error.exceptions]
+        return None
+
+    assert construct(InterpretedItem) == construct(GeneratedItem) == construct(GeneratedSubItem)
@@ -0,0 +1,161 @@
+from dataclasses import dataclass
+from typing import Annotated, Any
+
+import annotated_types as at
+import pandas as pd
+import pytest
+from helpers import error_tree
+
+from annotated_validator.columnar import validate_many
+from annotated_validator.number_validators import NumberRange
+from annotated_validator.validator import (
+    BaseMetaValidator,
+    ValidateAnnotated,
+    class_annotated_validator,
+)
+
+
+@dataclass
+class Item(ValidateAnnotated, enabled=False):
+    name: Annotated[str, at.MinLen(1)]
+    cost: Annotated[int, at.Ge(0)]
+    quantity: Annotated[int, NumberRange(1, 1000)]
+    note: Annotated[str, at.Len(1, 3)] = "-"
+
+
+ITEMS = [
+    Item("Pens", 1, 1),
+    Item("", -1, 0),
+    Item("Ink", 5, 2000, "long"),
+    Item("Cap", 2, 2, ""),
+    Item("Pad", -2, 3),
+]
+
+
+def expected_errors(items: list[Item]) -> dict[int, Any]:
+    errors = {}
+    for position, item in enumerate(items):
+        try:
+            class_annotated_validator(item, force=True)
+        except ExceptionGroup as error:
+            errors[position] = error_tree(error)
+    return errors
+
+
+def columns(items: list[Item]) -> dict[str, list]:
+    return {name: [getattr(item, name) for item in items] for name in Item.__dataclass_fields__}
+
+
+@pytest.mark.parametrize(
+    "objects",
+    [
+        ITEMS,
+        iter(ITEMS),
+        [item.__dict__ for item in ITEMS],
+        columns(ITEMS),
+        pd.DataFrame(columns(ITEMS)),
+    ],
+)
+def test_validate_many_parity(objects):
+    errors = validate_many(Item, objects, force=True)
+    assert {position: error_tree(error) for position, error in errors.items()} == (
+        expected_errors(ITEMS)
+    )
+
+
+def test_validate_many_fail_fast():
+    @dataclass
+    class FirstError(Item, fail_fast=True):
+        pass
+
+    items = [FirstError(*vars(item).values()) for item in ITEMS]
+    errors = validate_many(FirstError, items, force=True)
+    assert {position: error_tree(error) for position, error in errors.items()} == (
+        expected_errors(items)
+    )
+    assert [len(error.exceptions) for error in errors.values()] == [1, 1, 1, 1]
+
+
+@dataclass(frozen=True)
+class Even(BaseMetaValidator):
+    """A custom validator that only accepts a single value."""
+
+    def validate(self, value):
+        if value % 2:
+            return ExceptionGroup("`Even` Validation Errors", [ValueError(f"{value} is odd")])
+        return None
+
+
+def test_validate_many_single_value_validators():
+    @dataclass
+    class Pair:
+        count: Annotated[int, at.Ge(0), Even()]
+
+    errors = validate_many(Pair, [Pair(2), Pair(3), Pair(-2)])
+    assert {position: error_tree(error) for position, error in errors.items()} == {
+        1: (
+            "`Pair` Validation Errors",
+            [
+                (
+                    "`count` Validation Errors",
+                    [("`Even` Validation Errors", [("ValueError", "3 is odd")])],
+                )
+            ],
+        ),
+        2: (
+            "`Pair` Validation Errors",
+            [
+                (
+                    "`count` Validation Errors",
+                    [
+                        (
+                            "`Ge` Validation Errors",
+                            [
+                                (
+                                    "GreaterThanOrEqualError",
+                                    "Value: -2 is not greater than or equal to the Bound: 0",
+                                )
+                            ],
+                        )
+                    ],
+                )
+            ],
+        ),
+    }
+
+
+def test_validate_many_ragged_lists():
+    @dataclass
+    class Tagged:
+        tags: Annotated[list, at.MinLen(1), at.Predicate(lambda tags: 0 not in tags)]
+
+    # lists of different lengths can't be converted to an array
+    items = [Tagged([1, 2]), Tagged([3]), Tagged([]), Tagged([0, 1, 2])]
+    assert validate_many(Tagged, items[:2]) == {}
+    errors = validate_many(Tagged, items)
+    assert {position: error_tree(error) for position, error in errors.items()} == (
+        expected_errors(items)
+    )
+    assert list(errors) == [2, 3]
+
+
+def test_validate_many_valid_and_empty():
+    assert validate_many(Item, ITEMS[:1], force=True) == {}
+    assert validate_many(Item, [], force=True) == {}
+    assert validate_many(Item, {name: [] for name in columns(ITEMS)}, force=True) == {}
+
+
+def test_validate_many_disabled():
+    assert validate_many(Item, ITEMS) == {}
+
+
+@pytest.mark.parametrize(
+    ("objects", "match"),
+    [
+        ({"name": ["Pens"], "cost": [1]}, "missing"),
+        ({**columns(ITEMS), "cost": [1]}, "different lengths"),
+    ],
+)
+def test_validate_many_invalid_columns(objects, match):
+    with pytest.raises(ValueError, match=match):
+        validate_many(Item, objects, force=True)
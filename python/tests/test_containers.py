@@ -0,0 +1,247 @@
+from collections.abc import Iterator, Mapping, Sequence
+from dataclasses import dataclass
+from fractions import Fraction
+from typing import Annotated, Any, get_origin
+
+import annotated_types as at
+import numpy as np
+import pytest
+from helpers import error_tree
+
+from annotated_validator import containers
+from annotated_validator.base import BaseMetaValidator
+from annotated_validator.exceptions.iterator import IteratorValidationErrorGroup
+from annotated_validator.exceptions.validator import ValidationErrorGroup
+from annotated_validator.number_validators import NumberRange
+from annotated_validator.options import ValidationOptions
+from annotated_validator.plan import compile_parameter, validate_parameter
+from annotated_validator.streaming import Batches
+from annotated_validator.validator import class_annotated_validator, validate_annotated
+
+PositiveInt = Annotated[int, at.Gt(0)]
+Ratio = Annotated[float, at.Ge(0), at.Le(1.0)]
+
+
+@dataclass(frozen=True)
+class Even(BaseMetaValidator):
+    """A custom validator that only accepts a single value."""
+
+    def validate(self, value):
+        if value % 2:
+            return ExceptionGroup("`Even` Validation Errors", [ValueError(f"{value} is odd")])
+        return None
+
+
+def element_errors(path: str, value: Any) -> tuple:
+    return (
+        f"`{path}` Validation Errors",
+        [
+            (
+                "`Gt` Validation Errors",
+                [("GreaterThanError", f"Value: {value} is not greater than the Bound: 0")],
+            )
+        ],
+    )
+
+
+def validate(py_type: Any, value: Any, **options: Any) -> Any:
+    plan = compile_parameter("values", py_type, options=ValidationOptions(**options).resolve())
+    return error_tree(validate_parameter(plan, value))
+
+
+@pytest.mark.parametrize(
+    "py_type", [list[PositiveInt], Sequence[PositiveInt], tuple[PositiveInt, ...]]
+)
+def test_sequence_elements(py_type):
+    assert validate(py_type, [1, 2]) is None
+    assert validate(py_type, (1, -1, 0)) == (
+        "`values` Validation Errors",
+        [
+            (
+                f"`{get_origin(py_type).__name__}` Element Validation Errors",
+                [element_errors("values[1]", -1), element_errors("values[2]", 0)],
+            )
+        ],
+    )
+
+
+def test_mapping_keys_and_values():
+    py_type = dict[Annotated[str, at.MinLen(1)], Ratio]
+    assert validate(py_type, {"a": 0.5}) is None
+    assert validate(py_type, {"": 0.5, "b": 2.0}) == (
+        "`values` Validation Errors",
+        [
+            (
+                "`dict` Element Validation Errors",
+                [
+                    (
+                        "`values{''}` Validation Errors",
+                        [
+                            (
+                                "`MinLen` Validation Errors",
+                                [
+                                    (
+                                        "MinLenError",
+                                        "Length of `''` (0) is less than the minimum length: 1.",
+                                    )
+                                ],
+                            )
+                        ],
+                    ),
+                    (
+                        "`values['b']` Validation Errors",
+                        [
+                            (
+                                "`Le` Validation Errors",
+                                [
+                                    (
+                                        "LessThanOrEqualError",
+                                        "Value: 2.0 is not less than or equal to the Bound: 1.0",
+                                    )
+                                ],
+                            )
+                        ],
+                    ),
+                ],
+            )
+        ],
+    )
+
+
+def test_nested_containers_and_container_metadata():
+    py_type = Annotated[list[set[PositiveInt] | None], at.MinLen(1)]
+    assert validate(py_type, [{1}, None]) is None
+    errors = validate(py_type, [])
+    assert errors[1][0][0] == "`MinLen` Validation Errors"
+    assert validate(py_type, [{1}, {-1}]) == (
+        "`values` Validation Errors",
+        [
+            (
+                "`list` Element Validation Errors",
+                [
+                    (
+                        "`values[1]` Validation Errors",
+                        [
+                            (
+                                "`set` Element Validation Errors",
+                                [element_errors("values[1]{-1}", -1)],
+                            )
+                        ],
+                    )
+                ],
+            )
+        ],
+    )
+
+
+def test_fixed_length_tuple_and_optional_elements():
+    py_type = tuple[str, PositiveInt | None, Ratio]
+    assert validate(py_type, ("a", None, 0.5)) is None
+    errors = validate(py_type, ("a", -1, 0.5, "ignored"))
+    assert errors[1][0][1] == [element_errors("values[1]", -1)]
+
+
+@pytest.mark.parametrize("value", ["a string", iter([-1]), 5])
+def test_values_without_elements_are_skipped(value):
+    assert validate(list[PositiveInt], value) is None
+
+
+def test_no_nested_metadata():
+    assert compile_parameter("values", list[int]) is None
+    assert compile_parameter("values", dict[str, list[int]]) is None
+
+
+def test_fail_fast_stops_at_first_invalid_element():
+    errors = validate(list[PositiveInt], [1, -1, -2], fail_fast=True)
+    assert errors[1][0][1] == [element_errors("values[1]", -1)]
+
+
+@pytest.mark.parametrize(
+    "py_type,values",
+    [
+        (list[PositiveInt], list(range(1, 200))),
+        (list[Annotated[float, NumberRange(0, 10), at.MultipleOf(0.5)]], [0.5] * 200),
+        (dict[str, Ratio], {str(index): 0.5 for index in range(200)}),
+    ],
+)
+def test_vectorized_fast_path(monkeypatch, py_type, values):
+    calls = []
+    original = containers.validate_element
+    monkeypatch.setattr(
+        containers, "validate_element", lambda *args: calls.append(args) or original(*args)
+    )
+    assert validate(py_type, values) is None
+    assert calls == []
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        [*range(1, 101), -1, 0],
+        # elements that aren't converted to an int array are validated one at a time
+        [*range(1, 100), 2.5, -1.0, 0],
+        [*range(1, 100), Fraction(1, 2), -1, 0],
+        [*range(1, 100), 10**30, -1, 0],
+    ],
+)
+def test_invalid_arrays_report_each_element(values):
+    errors = validate(list[PositiveInt], values)
+    assert errors[1][0][1][-1] == element_errors("values[101]", 0)
+
+
+def test_single_value_validators_validate_each_element():
+    errors = validate(list[Annotated[int, Even()]], [*range(0, 200, 2), 3])
+    assert errors[1][0][1] == [
+        (
+            "`values[100]` Validation Errors",
+            [("`Even` Validation Errors", [("ValueError", "3 is odd")])],
+        )
+    ]
+
+
+def test_same_errors_with_and_without_fast_path(monkeypatch):
+    values = np.linspace(-1, 2, 300).tolist()
+    fast = validate(list[Ratio], values)
+    monkeypatch.setattr(containers, "VECTORIZED_MIN_SIZE", len(values) + 1)
+    assert validate(list[Ratio], values) == fast
+    assert len(fast[1][0][1]) == 200
+
+
+def test_wrapped_function():
+    @validate_annotated
+    def total(prices: list[PositiveInt] | None = None) -> dict[str, Annotated[int, at.Ge(0)]]:
+        return {"total": sum(prices or [])}
+
+    assert total([1, 2]) == {"total": 3}
+    assert total() == {"total": 0}
+    with pytest.raises(ValidationErrorGroup):
+        total([1, -1])
+
+
+def test_iterator_of_containers():
+    @validate_annotated
+    def costs(items: Annotated[Iterator[list[PositiveInt]], Batches(2)]) -> list[list[int]]:
+        return list(items)
+
+    assert costs(iter([[1], [1, 2]])) == [[1], [1, 2]]
+    with pytest.raises(IteratorValidationErrorGroup, match="item 1"):
+        costs(iter([[1], [1, -2]]))
+
+
+def test_dataclass_attribute():
+    @dataclass
+    class Order:
+        quantities: Mapping[str, PositiveInt]
+
+    class_annotated_validator(Order({"pens": 1}))
+    with pytest.raises(ExceptionGroup, match="`Order` Validation Errors"):
+        class_annotated_validator(Order({"pens": 0}))
+
+
+def test_async_element_validators_are_rejected():
+    class AsyncValidator(BaseMetaValidator):
+        async def validate(self, value):
+            return None
+
+    with pytest.raises(TypeError, match="elements of a container"):
+        compile_parameter("values", list[Annotated[int, AsyncValidator()]])
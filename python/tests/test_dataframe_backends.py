@@ -0,0 +1,220 @@
+from typing import Annotated, Any
+
+import annotated_types as at
+import pandas as pd
+import pytest
+from helpers import error_tree
+
+from annotated_validator.exceptions.annotated_types import InvalidMetadataError
+from annotated_validator.exceptions.pandas import (
+    RequiredColumnDoesntExistError,
+    RequiredColumnTypeMismatchError,
+)
+from annotated_validator.number_validators import NumberRange
+from annotated_validator.pandas_validators import RequiredColumns
+from annotated_validator.pandas_validators.backends import PANDAS_BACKEND, get_backend
+from annotated_validator.sampling import SamplingPolicy
+
+LIBRARIES = ["pandas", "pyarrow", "polars"]
+
+ITEMS = {
+    "name": ["Pens", "", "Ink", "Pad"],
+    "cost": [1, -1, 5, -2],
+    "quantity": [1, 0, 200, 3],
+    "ratio": [0.5, float("nan"), 1.5, 0.1],
+    "on_sale": [True, False, True, False],
+}
+
+REQUIRED_COLUMNS = RequiredColumns(
+    {
+        "name": at.MinLen(1),
+        "cost": Annotated["int64", at.Ge(0)],
+        "quantity": Annotated["int64", at.Interval(gt=0, lt=1000), NumberRange(1, 100)],
+        "ratio": Annotated["float64", at.Lt(1), at.MultipleOf(0.5)],
+        "on_sale": "bool",
+    }
+)
+
+
+def make_frame(library: str, data: dict[str, list[Any]]) -> Any:
+    if library == "pandas":
+        return pd.DataFrame(data)
+    module = pytest.importorskip(library)
+    return module.table(data) if library == "pyarrow" else module.DataFrame(data)
+
+
+def leaf_errors(error: BaseException) -> list[BaseException]:
+    if isinstance(error, ExceptionGroup):
+        return [leaf for sub_error in error.exceptions for leaf in leaf_errors(sub_error)]
+    return [error]
+
+
+@pytest.mark.parametrize("library", LIBRARIES)
+def test_same_errors_as_pandas(library):
+    expected = error_tree(REQUIRED_COLUMNS.validate(pd.DataFrame(ITEMS)))
+    assert error_tree(REQUIRED_COLUMNS.validate(make_frame(library, ITEMS))) == expected
+    assert expected == (
+        "pandas_required_columns",
+        [
+            (
+                "`name` Column Validation Errors",
+                [
+                    (
+                        "`MinLen` Validation Errors",
+                        [
+                            (
+                                "ArrayMinLenError",
+                                "1 of 4 values have a length less than the minimum length: 1. "
+                                "Invalid positions (first 1): [1], values: ['']",
+                            )
+                        ],
+                    )
+                ],
+            ),
+            (
+                "`cost` Column Validation Errors",
+                [
+                    (
+                        "`Ge` Validation Errors",
+                        [
+                            (
+                                "ArrayGreaterThanOrEqualError",
+                                "2 of 4 values are not greater than or equal to the Bound: 0. "
+                                "Invalid positions (first 2): [1, 3], values: [-1, -2]",
+                            )
+                        ],
+                    )
+                ],
+            ),
+            (
+                "`quantity` Column Validation Errors",
+                [
+                    (
+                        "`Interval` Validation Errors",
+                        [
+                            (
+                                "ArrayGreaterThanError",
+                                "1 of 4 values are not greater than the Bound: 0. "
+                                "Invalid positions (first 1): [1], values: [0]",
+                            )
+                        ],
+                    ),
+                    (
+                        "number_range",
+                        [
+                            (
+                                "ArrayLowBoundError",
+                                "1 of 4 values are smaller than the lower bound: 1. "
+                                "Invalid positions (first 1): [1], values: [0]",
+                            ),
+                            (
+                                "ArrayHighBoundError",
+                                "1 of 4 values are larger than the higher bound: 100. "
+                                "Invalid positions (first 1): [2], values: [200]",
+                            ),
+                        ],
+                    ),
+                ],
+            ),
+            (
+                "`ratio` Column Validation Errors",
+                [
+                    (
+                        "`Lt` Validation Errors",
+                        [
+                            (
+                                "ArrayLessThanError",
+                                "1 of 4 values are not less than the Bound: 1. "
+                                "Invalid positions (first 1): [2], values: [1.5]",
+                            )
+                        ],
+                    ),
+                    (
+                        "`MultipleOf` Validation Errors",
+                        [
+                            (
+                                "ArrayMultipleOfError",
+                                "2 of 4 values are not a multiple of 0.5. "
+                                "Invalid positions (first 2): [1, 3], values: [nan, 0.1]",
+                            )
+                        ],
+                    ),
+                ],
+            ),
+        ],
+    )
+
+
+@pytest.mark.parametrize("library", LIBRARIES)
+def test_schema_errors(library):
+    frame = make_frame(library, {"cost": [1.5], "other": [1]})
+    errors = RequiredColumns({"cost": "int64", "missing": "int64"}).validate(frame)
+    assert [type(error) for error in errors.exceptions] == [
+        RequiredColumnTypeMismatchError,
+        RequiredColumnDoesntExistError,
+    ]
+
+
+@pytest.mark.parametrize("library", LIBRARIES)
+def test_sampled_values(library):
+    frame = make_frame(library, {"cost": list(range(-1, 99))})
+    required_columns = RequiredColumns(
+        {"cost": Annotated["int64", at.Ge(0)]}, sampling=SamplingPolicy(rows=10, head=1)
+    )
+    errors = required_columns.validate(frame)
+    (column_errors,) = errors.exceptions
+    assert column_errors.message == "`cost` Column Validation Errors (sampled 11 of 100 rows)"
+
+
+@pytest.mark.parametrize("library", LIBRARIES)
+def test_min_len_of_elements_without_length(library):
+    frame = make_frame(library, {"name": [1, 2]})
+    errors = RequiredColumns({"name": at.MinLen(1)}).validate(frame)
+    ((min_len_errors,),) = [column_errors.exceptions for column_errors in errors.exceptions]
+    assert min_len_errors.message == "`MinLen` Validation Errors"
+    (error,) = min_len_errors.exceptions
+    assert isinstance(error, InvalidMetadataError)
+    assert "column don't have a length" in str(error)
+
+
+def test_native_dtypes():
+    pa = pytest.importorskip("pyarrow")
+    table = pa.table({"cost": pa.array([1, 2], pa.int32()), "name": ["a", "b"]})
+    assert RequiredColumns({"cost": pa.int32(), "name": "string"}).validate(table) is None
+    errors = RequiredColumns({"cost": "int64"}).validate(table)
+    assert isinstance(errors.exceptions[0], RequiredColumnTypeMismatchError)
+
+
+def test_record_batches_and_chunked_columns():
+    pa = pytest.importorskip("pyarrow")
+    required_columns = RequiredColumns({"cost": Annotated["int64", at.Ge(0), at.MultipleOf(2)]})
+    table = pa.concat_tables([pa.table({"cost": [2, -2]}), pa.table({"cost": [-4, 3]})])
+    assert table.column("cost").num_chunks == 2
+    expected = error_tree(required_columns.validate(pd.DataFrame({"cost": [2, -2, -4, 3]})))
+    assert error_tree(required_columns.validate(table)) == expected
+    assert error_tree(required_columns.validate(table.combine_chunks().to_batches()[0])) == expected
+
+
+@pytest.mark.parametrize("library", ["pyarrow", "polars"])
+def test_nulls(library):
+    frame = make_frame(library, {"cost": [2, None, -2], "name": ["ab", None, ""]})
+    required_columns = RequiredColumns({"cost": Annotated["int64", at.Ge(0)], "name": at.MinLen(1)})
+    # bounds and lengths are computed by the library, nulls are valid
+    errors = required_columns.validate(frame)
+    assert [leaf.positions.tolist() for leaf in leaf_errors(errors)] == [[2], [2]]
+    # other metadata validates a NumPy array, where a null is NaN (the same as in Pandas)
+    errors = RequiredColumns({"cost": Annotated["int64", at.MultipleOf(2)]}).validate(frame)
+    assert [leaf.positions.tolist() for leaf in leaf_errors(errors)] == [[1]]
+
+
+def test_polars_native_dtypes():
+    pl = pytest.importorskip("polars")
+    frame = pl.DataFrame({"cost": pl.Series([1, 2], dtype=pl.Int32), "name": ["a", "b"]})
+    assert RequiredColumns({"cost": pl.Int32, "name": "String"}).validate(frame) is None
+    errors = RequiredColumns({"cost": "Int64"}).validate(frame)
+    assert isinstance(errors.exceptions[0], RequiredColumnTypeMismatchError)
+
+
+def test_pandas_is_the_default_backend():
+    assert get_backend(pd.DataFrame()) is PANDAS_BACKEND
+    assert get_backend({"cost": [1]}) is PANDAS_BACKEND
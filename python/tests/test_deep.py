@@ -0,0 +1,150 @@
+import logging
+from dataclasses import dataclass, field
+from typing import Annotated, Any
+
+import annotated_types as at
+import pytest
+from helpers import error_tree
+from pydantic import BaseModel
+
+from annotated_validator import plan as plan_module
+from annotated_validator.validator import ValidateAnnotated, class_annotated_validator
+
+PositiveInt = Annotated[int, at.Gt(0)]
+
+
+def messages(error: ExceptionGroup) -> list[str]:
+    return [sub_error.message for sub_error in error.exceptions]
+
+
+@dataclass
+class Part:
+    cost: PositiveInt
+
+
+@dataclass
+class Item:
+    cost: PositiveInt
+    parts: list[Part] = field(default_factory=list)
+
+
+@dataclass
+class Order:
+    items: list[Item]
+    quantities: dict[str, list[PositiveInt]] = field(default_factory=dict)
+    parent: "Order | None" = None
+
+
+class Customer(BaseModel):
+    name: Annotated[str, at.MinLen(1)]
+
+
+@dataclass
+class Account:
+    customer: Customer
+    orders: dict[str, Order]
+
+
+def validate(obj: Any, **options: Any) -> Any:
+    try:
+        class_annotated_validator(obj, **options)
+    except ExceptionGroup as error:
+        return error
+    return None
+
+
+def test_nested_errors_have_paths():
+    order = Order([Item(1), Item(-1, [Part(1), Part(0)])], {"pens": [1, -2]})
+    assert validate(order) is not None  # `quantities` is validated without deep
+    error = validate(order, deep=True)
+    assert error.message == "`Order` Validation Errors"
+    assert messages(error) == [
+        "`quantities` Validation Errors",
+        "`items[1].cost` Validation Errors",
+        "`items[1].parts[1].cost` Validation Errors",
+    ]
+    # element paths are prefixed too
+    assert error_tree(error.exceptions[1]) == (
+        "`items[1].cost` Validation Errors",
+        [
+            (
+                "`Gt` Validation Errors",
+                [("GreaterThanError", "Value: -1 is not greater than the Bound: 0")],
+            )
+        ],
+    )
+
+
+def test_element_paths_are_prefixed():
+    account = Account(Customer(name="a"), {"main": Order([], {"pens": [1, -2]})})
+    error = validate(account, deep=True)
+    assert messages(error) == ["`orders['main'].quantities` Validation Errors"]
+    (elements,) = error.exceptions[0].exceptions
+    assert messages(elements) == ["`orders['main'].quantities['pens']` Validation Errors"]
+    assert messages(elements.exceptions[0].exceptions[0]) == [
+        "`orders['main'].quantities['pens'][1]` Validation Errors"
+    ]
+
+
+def test_pydantic_models_are_validated():
+    customer = Customer.model_construct(name="")
+    error = validate(Account(customer, {}), deep=True)
+    assert messages(error) == ["`customer.name` Validation Errors"]
+
+
+def test_valid_and_disabled_deep():
+    order = Order([Item(1, [Part(1)])])
+    assert validate(order, deep=True) is None
+    assert validate(Order([Item(-1)])) is None
+    assert validate(Order([Item(-1)]), deep=False) is None
+
+
+def test_shared_and_cyclic_objects_are_validated_once(monkeypatch):
+    checked = []
+    get_class_plan = plan_module.get_class_plan
+
+    def counting_plan(cls):
+        plan = get_class_plan(cls)
+        return plan._replace(check=lambda obj: checked.append(obj) or plan.check(obj))
+
+    monkeypatch.setattr("annotated_validator.deep.get_class_plan", counting_plan)
+    shared = Item(-1, [Part(1)])
+    order = Order([shared, shared, shared])
+    order.parent = order
+    error = validate(order, deep=True)
+    assert messages(error) == ["`items[0].cost` Validation Errors"]
+    assert [type(obj).__name__ for obj in checked] == ["Item", "Part"]
+
+
+def test_max_depth(caplog):
+    order = Order([Item(1, [Part(-1)])])
+    with caplog.at_level(logging.WARNING, logger="annotated_validator.deep"):
+        assert validate(order, deep=True, max_depth=1) is None
+    assert "deeper than 1 levels in `Order`" in caplog.text
+    assert messages(validate(order, deep=True, max_depth=2)) == [
+        "`items[0].parts[0].cost` Validation Errors"
+    ]
+    # objects are validated at the lowest depth they are found at
+    order.parent = Order([Item(1, [order.items[0].parts[0]])])
+    assert messages(validate(Order([Item(1)], parent=order), deep=True, max_depth=3)) == [
+        "`parent.items[0].parts[0].cost` Validation Errors"
+    ]
+
+
+def test_deep_graph_doesnt_reach_recursion_limit():
+    item = Item(1)
+    for _ in range(5000):
+        item = Item(1, [item])  # type: ignore[list-item]
+    assert validate(Order([item]), deep=True, max_depth=20_000) is None
+
+
+def test_class_options():
+    @dataclass
+    class DeepOrder(ValidateAnnotated, deep=True, fail_fast=True):
+        items: list[Item]
+        other: list[Item] = field(default_factory=list)
+
+    DeepOrder([Item(1)])
+    with pytest.raises(ExceptionGroup) as exc_info:
+        DeepOrder([Item(-1)], [Item(-2)])
+    assert messages(exc_info.value) == ["`items[0].cost` Validation Errors"]
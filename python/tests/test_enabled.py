@@ -0,0 +1,114 @@
+from dataclasses import dataclass
+from typing import Annotated
+
+import annotated_types as at
+import pytest
+
+from annotated_validator import options
+from annotated_validator.options import (
+    ValidationOptions,
+    options_from_environment,
+    set_global_options,
+    set_module_options,
+)
+from annotated_validator.plan import clear_class_plans
+from annotated_validator.validator import (
+    ValidateAnnotated,
+    class_annotated_validator,
+    validate_annotated,
+    validated,
+)
+
+PositiveInt = Annotated[int, at.Gt(0)]
+
+
+@pytest.fixture
+def disabled():
+    previous = options.get_global_options()
+    set_global_options(enabled=False)
+    yield
+    set_global_options(enabled=previous.enabled)
+    clear_class_plans()
+
+
+@pytest.fixture
+def module_options():
+    previous = dict(options._module_options)
+    yield
+    options._module_options.clear()
+    options._module_options.update(previous)
+
+
+def add(num_1: PositiveInt, num_2: PositiveInt) -> PositiveInt:
+    return num_1 + num_2
+
+
+def test_disabled_function_is_not_wrapped(disabled):
+    assert validate_annotated(add) is add
+    assert validate_annotated(fail_fast=True)(add) is add
+
+
+def test_enabled_option_overrides_global(disabled):
+    with pytest.raises(ExceptionGroup):
+        validate_annotated(enabled=True)(add)(-1, 1)
+
+
+def test_validated_call_site(disabled):
+    disabled_add = validate_annotated(add)
+    checked_add = validated(disabled_add)
+    assert checked_add is not add
+    assert validated(checked_add) is checked_add
+    assert disabled_add(-1, 1) == 0
+    with pytest.raises(ExceptionGroup):
+        checked_add(-1, 1)
+
+
+def test_disabled_class(disabled):
+    @dataclass
+    class Item(ValidateAnnotated):
+        cost: PositiveInt
+
+    @dataclass
+    class CheckedItem(Item, enabled=True):
+        pass
+
+    item = Item(-1)
+    with pytest.raises(ExceptionGroup):
+        class_annotated_validator(item, force=True)
+    assert class_annotated_validator(item) is item
+    with pytest.raises(ExceptionGroup):
+        CheckedItem(-1)
+
+
+def test_module_options(module_options):
+    set_module_options(__name__, enabled=False)
+    assert validate_annotated(add) is add
+    assert ValidationOptions(enabled=True).resolve(__name__).enabled
+    assert ValidationOptions().resolve("another.module").enabled
+
+
+def test_module_options_are_more_specific(module_options):
+    set_module_options("package", enabled=False, fail_fast=True)
+    set_module_options("package.module", enabled=True)
+    resolved = ValidationOptions().resolve("package.module")
+    assert resolved.enabled
+    assert resolved.fail_fast
+    assert not ValidationOptions().resolve("package.other").enabled
+    assert ValidationOptions().resolve("packages").enabled
+
+
+@pytest.mark.parametrize(
+    ("environ", "expected"),
+    [
+        ({}, (True, [])),
+        ({"ANNOTATED_VALIDATOR_ENABLED": "0"}, (False, [])),
+        ({"ANNOTATED_VALIDATOR_ENABLED": "Off"}, (False, [])),
+        ({"ANNOTATED_VALIDATOR_ENABLED": "1"}, (True, [])),
+        (
+            {"ANNOTATED_VALIDATOR_DISABLED_MODULES": "app.fast, app.io,"},
+            (True, ["app.fast", "app.io"]),
+        ),
+    ],
+)
+def test_options_from_environment(environ, expected):
+    assert options_from_environment(environ) == expected
@@ -0,0 +1,90 @@
+from typing import Annotated
+
+import annotated_types as at
+import pandas as pd
+import pytest
+
+from annotated_validator.exceptions.annotated_types import GreaterThanError, MinLenError
+from annotated_validator.exceptions.validator import (
+    ValidationErrorGroup,
+    ValidatorError,
+    bounded_repr,
+)
+from annotated_validator.pandas_validators import RequiredColumns
+from annotated_validator.validator import validate_annotated
+
+
+class CountingRepr:
+    repr_calls = 0
+
+    def __repr__(self) -> str:
+        CountingRepr.repr_calls += 1
+        return "CountingRepr()"
+
+    def __le__(self, other) -> bool:
+        return True
+
+    def __ge__(self, other) -> bool:
+        return True
+
+
+@validate_annotated
+def needs_columns(df: Annotated[pd.DataFrame, RequiredColumns({"cost": "int64"})]) -> None:
+    ...
+
+
+def test_messages_are_formatted_lazily():
+    CountingRepr.repr_calls = 0
+    error = GreaterThanError(0, CountingRepr())
+    assert CountingRepr.repr_calls == 0
+    assert error.message == "Value: CountingRepr() is not greater than the Bound: 0"
+    assert str(error) == error.message
+    assert CountingRepr.repr_calls == 1
+
+
+def test_validate_annotated_raise_path_does_not_repr_values():
+    @validate_annotated
+    def positive(value: Annotated[object, at.Gt(0)]) -> None:
+        ...
+
+    CountingRepr.repr_calls = 0
+    with pytest.raises(ValidationErrorGroup) as exc_info:
+        positive(CountingRepr())
+    assert CountingRepr.repr_calls == 0
+    assert "value=CountingRepr()" in str(exc_info.value)
+
+
+def test_bounded_repr():
+    assert bounded_repr(pd.DataFrame({"a": range(1_000)})) == "<DataFrame shape=(1000, 1)>"
+    assert len(bounded_repr("a" * 10_000)) <= 80
+    assert bounded_repr(1) == "1"
+
+
+def test_group_str_uses_bounded_repr():
+    df = pd.DataFrame({"cost": [1.5] * 100_000})
+    with pytest.raises(ValidationErrorGroup) as exc_info:
+        needs_columns(df)
+    assert str(exc_info.value).endswith("Checked: df=<DataFrame shape=(100000, 1)>")
+    assert exc_info.value.checked["df"] is df
+
+
+def test_min_len_error_is_bounded():
+    assert "..." in MinLenError(20_000, "a" * 10_000).message
+
+
+def test_message_can_be_assigned():
+    class CustomError(ValidatorError):
+        def __init__(self):
+            self.message = "custom message"
+            super().__init__(self.message)
+
+    assert str(CustomError()) == "custom message"
+    assert repr(CustomError()) == "CustomError('custom message')"
+
+
+def test_except_star_keeps_group_type():
+    with pytest.raises(ValidationErrorGroup):
+        try:
+            needs_columns(pd.DataFrame({"cost": [1.5]}))
+        except* KeyError:
+            pass
@@ -0,0 +1,94 @@
+from dataclasses import dataclass
+from typing import Annotated
+
+import annotated_types as at
+import pytest
+
+from annotated_validator.base import BaseMetaValidator
+from annotated_validator.options import get_global_options, set_global_options
+from annotated_validator.validator import ValidateAnnotated, validate_annotated
+
+
+@dataclass
+class CountingValidator(BaseMetaValidator):
+    calls: int = 0
+
+    def validate(self, value):
+        self.calls += 1
+
+
+def leaf_count(error: BaseException) -> int:
+    if isinstance(error, ExceptionGroup):
+        return sum(leaf_count(sub_error) for sub_error in error.exceptions)
+    return 1
+
+
+@pytest.fixture
+def counter():
+    return CountingValidator()
+
+
+@pytest.mark.parametrize("generate_code", [False, True])
+def test_fail_fast_stops_at_first_error(counter, generate_code):
+    @validate_annotated(fail_fast=True, generate_code=generate_code)
+    def func(
+        a: Annotated[int, at.Interval(gt=0, lt=-10), at.Lt(-20)],
+        b: Annotated[int, at.Gt(0), counter],
+    ) -> None:
+        ...
+
+    with pytest.raises(ExceptionGroup) as exc_info:
+        func(1, -1)
+    assert leaf_count(exc_info.value) == 1
+    assert exc_info.value.exceptions[0].message == "`a` Validation Errors"
+    assert counter.calls == 0
+
+
+@pytest.mark.parametrize("generate_code", [False, True])
+def test_collect_all_by_default(counter, generate_code):
+    @validate_annotated(generate_code=generate_code)
+    def func(
+        a: Annotated[int, at.Interval(gt=0, lt=-10), at.Lt(-20)],
+        b: Annotated[int, at.Gt(0), counter],
+    ) -> None:
+        ...
+
+    with pytest.raises(ExceptionGroup) as exc_info:
+        func(1, -1)
+    assert leaf_count(exc_info.value) == 3
+    assert counter.calls == 1
+
+
+def test_fail_fast_class_keyword():
+    @dataclass
+    class Item(ValidateAnnotated, fail_fast=True):
+        cost: Annotated[int, at.Ge(0)]
+        quantity: Annotated[int, at.Gt(0)]
+
+    with pytest.raises(ExceptionGroup) as exc_info:
+        Item(-1, -1)
+    assert leaf_count(exc_info.value) == 1
+
+
+def test_fail_fast_global_option():
+    previous = get_global_options()
+    set_global_options(fail_fast=True)
+    try:
+
+        @validate_annotated
+        def func(a: Annotated[int, at.Gt(0)], b: Annotated[int, at.Gt(0)]) -> None:
+            ...
+
+        @validate_annotated(fail_fast=False)
+        def collect_all(a: Annotated[int, at.Gt(0)], b: Annotated[int, at.Gt(0)]) -> None:
+            ...
+
+    finally:
+        set_global_options(fail_fast=previous.fail_fast)
+
+    with pytest.raises(ExceptionGroup) as exc_info:
+        func(-1, -1)
+    assert leaf_count(exc_info.value) == 1
+    with pytest.raises(ExceptionGroup) as exc_info:
+        collect_all(-1, -1)
+    assert leaf_count(exc_info.value) == 2
@@ -0,0 +1,58 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import annotated_validator
+
+IMPORT_BUDGET_US = 150_000
+"""Maximum cumulative import time of each module in microseconds.
+
+None of `HEAVY_MODULES` may be imported, which is checked exactly. Without them an import takes
+about 40-80ms (mostly `annotated_types` and the standard library), the budget is about twice that
+since the tests run on slow and noisy machines. It only catches large regressions, e.g. a new
+dependency imported eagerly, and the fastest of 5 runs is compared so a busy machine doesn't fail
+the test.
+"""
+HEAVY_MODULES = ("numpy", "pandas", "pyarrow", "polars")
+
+
+def import_times(module: str) -> dict[str, int]:
+    """Cumulative import time (in microseconds) of every module imported by `module`."""
+    source_path = str(Path(annotated_validator.__file__).parents[1])
+    env = {
+        **os.environ,
+        "PYTHONPATH": os.pathsep.join([source_path, os.environ.get("PYTHONPATH", "")]),
+    }
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        check=True,
+        env=env,
+        text=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+@pytest.mark.parametrize(
+    "module",
+    [
+        "annotated_validator.validator",
+        "annotated_validator.number_validators",
+        "annotated_validator.pandas_validators",
+    ],
+)
+def test_import_budget(module):
+    times = import_times(module)
+    assert not [name for name in times if name.split(".")[0] in HEAVY_MODULES]
+    # the fastest of a few runs, so a busy machine doesn't fail the test
+    cumulative = min(times[module], *(import_times(module)[module] for _ in range(4)))
+    assert cumulative < IMPORT_BUDGET_US
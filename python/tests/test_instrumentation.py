@@ -0,0 +1,126 @@
+import asyncio
+import contextlib
+import logging
+from dataclasses import dataclass
+from typing import Annotated
+
+import annotated_types as at
+import pytest
+
+from annotated_validator import instrumentation
+from annotated_validator.instrumentation import CheckKey, ValidatorStats
+from annotated_validator.number_validators import NumberRange
+from annotated_validator.plan import clear_class_plans, get_parameter_plan
+from annotated_validator.validator import (
+    ParamData,
+    ValidateAnnotated,
+    annotated_validator,
+    validate_annotated,
+)
+
+
+@pytest.fixture(autouse=True)
+def registry(monkeypatch):
+    monkeypatch.setattr(instrumentation, "_hooks", [])
+    monkeypatch.setattr(instrumentation, "_span_factories", [])
+    monkeypatch.setattr(instrumentation, "_slow_threshold", None)
+
+
+def add(
+    num_1: Annotated[int, at.Gt(0), NumberRange(1, 10)], num_2: int
+) -> Annotated[int, at.Lt(10)]:
+    return num_1 + num_2
+
+
+def test_stats_per_validator():
+    stats = ValidatorStats()
+    instrumentation.add_hook(stats)
+    validated_add = validate_annotated(generate_code=True)(add)
+    validated_add(1, 2)
+    with pytest.raises(ExceptionGroup):
+        validated_add(20, 2)
+    owner = f"{__name__}.add"
+    summary = stats.summary()
+    assert list(summary) == [
+        CheckKey(owner, "num_1", "Gt"),
+        CheckKey(owner, "num_1", "NumberRange"),
+        CheckKey(owner, "return", "Lt"),
+    ]
+    assert [(check.calls, check.failures) for check in summary.values()] == [(2, 0), (2, 1), (1, 0)]
+    assert all(0 < check.p99_seconds <= check.total_seconds for check in summary.values())
+
+
+def test_not_instrumented_without_hooks():
+    calls = []
+    validated_add = validate_annotated(add)
+    instrumentation.add_hook(lambda *args: calls.append(args))
+    validated_add(1, 2)
+    assert calls == []
+
+
+def test_annotated_validator_plans_are_cached():
+    stats = ValidatorStats()
+    parameters = {"num": ParamData(1, Annotated[int, at.Gt(0)])}
+    plain_plan = get_parameter_plan("num", Annotated[int, at.Gt(0)])
+    instrumentation.add_hook(stats)
+    instrumented_plan = get_parameter_plan("num", Annotated[int, at.Gt(0)])
+    assert instrumented_plan is not plain_plan
+    # the instrumented plan is built once, not on every call
+    assert get_parameter_plan("num", Annotated[int, at.Gt(0)]) is instrumented_plan
+    annotated_validator(parameters)
+    annotated_validator(parameters)
+    assert [check.calls for check in stats.summary().values()] == [2]
+    instrumentation.remove_hook(stats)
+    assert get_parameter_plan("num", Annotated[int, at.Gt(0)]) is plain_plan
+
+
+def test_spans():
+    spans = []
+
+    @contextlib.contextmanager
+    def span(key):
+        spans.append(("start", key.validator))
+        yield
+        spans.append(("end", key.validator))
+
+    instrumentation.add_span_factory(span)
+    validate_annotated(add)(1, 2)
+    assert spans == [
+        ("start", "Gt"),
+        ("end", "Gt"),
+        ("start", "NumberRange"),
+        ("end", "NumberRange"),
+        ("start", "Lt"),
+        ("end", "Lt"),
+    ]
+
+
+def test_slow_threshold(caplog):
+    instrumentation.set_slow_threshold(0)
+    with caplog.at_level(logging.WARNING, logger=instrumentation.__name__):
+        validate_annotated(add)(1, 2)
+    assert len(caplog.records) == 3
+    assert caplog.records[0].getMessage().startswith(f"Validating `num_1` of `{__name__}.add`")
+
+
+def test_class_and_async_function():
+    stats = ValidatorStats()
+    instrumentation.add_hook(stats)
+
+    @dataclass
+    class Item(ValidateAnnotated):
+        cost: Annotated[int, at.Ge(0)]
+
+    @validate_annotated
+    async def double(num: Annotated[int, at.Gt(0)]) -> int:
+        return num * 2
+
+    Item(1)
+    asyncio.run(double(1))
+    clear_class_plans(Item)
+    assert {
+        (key.parameter, key.validator): check.calls for key, check in stats.summary().items()
+    } == {
+        ("cost", "Ge"): 1,
+        ("num", "Gt"): 1,
+    }
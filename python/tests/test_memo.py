@@ -0,0 +1,146 @@
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Annotated, Any, ClassVar, NamedTuple
+
+import pytest
+
+from annotated_validator import memo
+from annotated_validator.base import BaseMetaValidator
+from annotated_validator.memo import ValidationCache, cache_key
+from annotated_validator.validator import ValidateAnnotated, validate_annotated
+
+
+@dataclass
+class CountedPositive(BaseMetaValidator):
+    calls: list = field(default_factory=list)
+
+    def validate(self, value) -> ExceptionGroup | None:
+        self.calls.append(value)
+        if not all(item > 0 for item in (value if isinstance(value, tuple | list) else [value])):
+            return ExceptionGroup("counted_positive", [ValueError(f"{value} is not positive")])
+        return None
+
+
+@dataclass
+class Volatile(CountedPositive):
+    memoizable: ClassVar[bool] = False
+
+
+class Color(Enum):
+    RED = 1
+
+
+class Point(NamedTuple):
+    x: int
+    y: int
+
+
+@dataclass(frozen=True)
+class Frozen:
+    values: Any
+
+
+@pytest.fixture(autouse=True)
+def cache(monkeypatch):
+    cache = ValidationCache(max_size=2)
+    monkeypatch.setattr(memo, "_cache", cache)
+    return cache
+
+
+@pytest.mark.parametrize(
+    ("value", "cacheable"),
+    [
+        (1, True),
+        ("a", True),
+        (Color.RED, True),
+        ((1, ("a", None)), True),
+        (Point(1, 2), True),
+        (frozenset({1, 2}), True),
+        (Frozen((1, 2)), True),
+        ([1], False),
+        ((1, [2]), False),
+        (Frozen([1]), False),
+        ({"a": 1}, False),
+        (object(), False),
+    ],
+)
+def test_cache_key(value, cacheable):
+    assert (cache_key(value) is not None) == cacheable
+
+
+def test_equal_values_of_different_types_are_separate():
+    assert cache_key(1) != cache_key(1.0) != cache_key(True)
+    assert cache_key((1,)) != cache_key((1.0,))
+
+
+def test_valid_values_are_memoized(cache):
+    positive = CountedPositive()
+
+    @validate_annotated(memoize=True)
+    def check(value: Annotated[Any, positive]):
+        return value
+
+    for value in [1, 1, (1, 2), (1, 2), [1], [1]]:
+        check(value)
+    assert positive.calls == [1, (1, 2), [1], [1]]
+    assert cache.stats() == memo.CacheStats(hits=2, misses=2, evictions=0, size=2, max_size=2)
+
+
+def test_errors_are_not_memoized(cache):
+    positive = CountedPositive()
+
+    @validate_annotated(memoize=True)
+    def check(value: Annotated[int, positive]):
+        return value
+
+    for _ in range(2):
+        with pytest.raises(ExceptionGroup):
+            check(-1)
+    assert positive.calls == [-1, -1]
+    assert cache.stats().size == 0
+
+
+def test_lru_eviction(cache):
+    positive = CountedPositive()
+
+    @validate_annotated(memoize=True)
+    def check(value: Annotated[int, positive]):
+        return value
+
+    for value in [1, 2, 1, 3, 2, 1]:
+        check(value)
+    # 1 is used again before 3 is added, so 2 is evicted first
+    assert positive.calls == [1, 2, 3, 2, 1]
+    assert cache.stats().evictions == 3
+    cache.resize(0)
+    assert cache.stats().size == 0
+
+
+def test_opt_out_and_disabled_by_default():
+    volatile = Volatile()
+    positive = CountedPositive()
+
+    @validate_annotated(memoize=True)
+    def check(value: Annotated[int, volatile]):
+        return value
+
+    @validate_annotated
+    def not_memoized(value: Annotated[int, positive]):
+        return value
+
+    for _ in range(2):
+        check(1)
+        not_memoized(1)
+    assert volatile.calls == positive.calls == [1, 1]
+
+
+def test_memoized_class(cache):
+    positive = CountedPositive()
+
+    @dataclass
+    class Item(ValidateAnnotated, memoize=True):
+        cost: Annotated[int, positive]
+
+    Item(1)
+    Item(1)
+    assert positive.calls == [1]
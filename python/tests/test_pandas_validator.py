@@ -1,9 +1,17 @@
 from dataclasses import dataclass
 from typing import Annotated, Any, TypeAlias
 
+import annotated_types as at
 import pandas as pd
+import pytest
 
-from annotated_validator.required_columns import RequiredColumns
+from annotated_validator.exceptions.annotated_types import MinLenError
+from annotated_validator.exceptions.pandas import (
+    RequiredColumnDoesntExistError,
+    RequiredColumnTypeMismatchError,
+)
+from annotated_validator.number_validators import NumberRange
+from annotated_validator.pandas_validators import RequiredColumns
 from annotated_validator.validator import validate_annotated
 
 DfWithItemColumns: TypeAlias = Annotated[
@@ -44,5 +52,81 @@ def test_required_columns_validator():
     )
 
 
+DfWithValidItems: TypeAlias = Annotated[
+    pd.DataFrame,
+    RequiredColumns(
+        {
+            "name": at.MinLen(1),
+            "cost": Annotated["int64", at.Ge(0)],
+            "quantity": Annotated["int64", at.Gt(0), NumberRange(low=1, high=100)],
+            "taxable": "bool",
+        }
+    ),
+]
+
+
+@validate_annotated
+def total_cost(df: DfWithValidItems) -> int:
+    return int((df["cost"] * df["quantity"]).sum())
+
+
+def test_column_values_valid():
+    df = pd.DataFrame([Item("Pens", 75, 80, True), Item("Notepad", 300, 40, True)])
+    assert total_cost(df) == 75 * 80 + 300 * 40
+
+
+def test_column_values_invalid():
+    df = pd.DataFrame(
+        [Item("", 75, 80, True), Item("Notepad", -300, 400, True), Item("", 10, 0, False)]
+    )
+    with pytest.raises(ExceptionGroup) as exc_info:
+        total_cost(df)
+    (column_errors,) = exc_info.value.exceptions[0].exceptions
+    assert [group.message for group in column_errors.exceptions] == [
+        "`name` Column Validation Errors",
+        "`cost` Column Validation Errors",
+        "`quantity` Column Validation Errors",
+    ]
+    name_error = column_errors.exceptions[0].exceptions[0].exceptions[0]
+    assert isinstance(name_error, MinLenError)
+    assert name_error.positions.tolist() == [0, 2]
+
+
+def test_column_values_skipped_on_type_mismatch():
+    df = pd.DataFrame({"name": ["Pens"], "cost": [-1.5], "quantity": [1], "taxable": [True]})
+    with pytest.raises(ExceptionGroup) as exc_info:
+        total_cost(df)
+    (column_errors,) = exc_info.value.exceptions[0].exceptions
+    (error,) = column_errors.exceptions
+    assert isinstance(error, RequiredColumnTypeMismatchError)
+
+
+def test_column_zero_bounds():
+    required_columns = RequiredColumns({"cost": Annotated["int64", NumberRange(0, None)]})
+    assert required_columns.validate(pd.DataFrame({"cost": [0, 1]})) is None
+    errors = required_columns.validate(pd.DataFrame({"cost": [0, -5]}))
+    error = errors.exceptions[0].exceptions[0].exceptions[0]
+    assert error.positions.tolist() == [1]
+
+
+def test_schema_fingerprint_cache():
+    required_columns = RequiredColumns({"cost": "int64", "quantity": "int64", "missing": "bool"})
+    df = pd.DataFrame({"cost": [1], "quantity": [1.5], "other": ["a"]})
+    for _ in range(3):
+        errors = required_columns.validate(df)
+        assert [type(error) for error in errors.exceptions] == [
+            RequiredColumnTypeMismatchError,
+            RequiredColumnDoesntExistError,
+        ]
+    assert len(required_columns.schema_cache) == 1
+    assert required_columns.validate(df.assign(quantity=[2], missing=[True])) is None
+    assert len(required_columns.schema_cache) == 2
+
+
+def test_duplicate_columns_use_first_dtype():
+    df = pd.DataFrame([[1, 1.5]], columns=["cost", "cost"])
+    assert RequiredColumns({"cost": "int64"}).validate(df) is None
+
+
 if __name__ == "__main__":
     test_required_columns_validator()
@@ -0,0 +1,97 @@
+import threading
+from dataclasses import dataclass
+from typing import Annotated, Any
+
+import annotated_types as at
+import numpy as np
+import pytest
+from helpers import error_tree
+
+from annotated_validator import parallel
+from annotated_validator.base import BaseMetaValidator
+from annotated_validator.number_validators import NumberRange
+from annotated_validator.validator import ValidateAnnotated, validate_annotated
+
+Prices = Annotated[np.ndarray, at.Gt(0), NumberRange(1, 100), at.MultipleOf(2)]
+
+
+@pytest.fixture(autouse=True)
+def cpus(monkeypatch):
+    monkeypatch.setattr(parallel, "CPU_COUNT", 4)
+
+
+@dataclass
+class RecordThread(BaseMetaValidator):
+    threads: list
+
+    def validate(self, value) -> None:
+        self.threads.append(threading.current_thread())
+
+
+def call_errors(func, *args) -> Any:
+    try:
+        return ("returned", func(*args).tolist())
+    except ExceptionGroup as error:
+        return error_tree(error)
+
+
+def add(prices_1: Prices, prices_2: Prices, offset: Annotated[int, at.Ge(0)]) -> Prices:
+    return prices_1 + prices_2 + offset
+
+
+@pytest.mark.parametrize("fail_fast", [False, True])
+@pytest.mark.parametrize(
+    "args",
+    [
+        (np.full(10, 2), np.full(10, 4), 0),
+        (np.arange(-5, 5), np.arange(10) * 30, -1),
+        (np.full(10, 2), np.arange(10), 1),
+    ],
+)
+def test_parallel_parity(args, fail_fast):
+    serial = validate_annotated(fail_fast=fail_fast)(add)
+    threaded = validate_annotated(parallel=True, parallel_threshold=0, fail_fast=fail_fast)(add)
+    expected = call_errors(serial, *args)
+    for _ in range(5):
+        assert call_errors(threaded, *args) == expected
+
+
+@pytest.mark.parametrize(("threshold", "dispatched"), [(0, True), (11, False)])
+def test_parallel_threshold(threshold, dispatched):
+    threads = []
+    record = RecordThread(threads)
+
+    @validate_annotated(parallel=True, parallel_threshold=threshold)
+    def check(values_1: Annotated[Any, record], values_2: Annotated[Any, record]):
+        return values_1
+
+    check(np.ones(10), np.ones(10))
+    assert len(threads) == 2
+    assert all((thread is not threading.current_thread()) == dispatched for thread in threads)
+
+
+def test_single_large_check_stays_serial():
+    threads = []
+
+    @validate_annotated(parallel=True, parallel_threshold=0)
+    def check(values: Annotated[Any, RecordThread(threads)], scalar: Annotated[int, at.Gt(0)]):
+        return values
+
+    check(np.ones(10), 1)
+    assert threads == [threading.current_thread()]
+
+
+@dataclass
+class Order(ValidateAnnotated, parallel=True, parallel_threshold=0):
+    prices: Prices
+    quantities: Annotated[np.ndarray, at.Ge(0)]
+
+
+def test_parallel_class():
+    Order(np.full(3, 2), np.zeros(3))
+    with pytest.raises(ExceptionGroup) as exc_info:
+        Order(np.full(3, 3), np.full(3, -1))
+    assert [error.message for error in exc_info.value.exceptions] == [
+        "`prices` Validation Errors",
+        "`quantities` Validation Errors",
+    ]
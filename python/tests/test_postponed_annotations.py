@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from typing import Annotated
+
+import annotated_types as at
+import pytest
+
+from annotated_validator.validator import ValidateAnnotated, validate_annotated
+
+PositiveInt = Annotated[int, at.Gt(0)]
+
+
+@validate_annotated
+def double(num: PositiveInt) -> Annotated[int, at.Lt(10)]:
+    return num * 2
+
+
+@dataclass
+class Item(ValidateAnnotated):
+    cost: PositiveInt
+
+    @validate_annotated
+    def with_cost(self, cost: PositiveInt) -> Item:
+        return Item(cost)
+
+
+def test_string_annotations_are_validated():
+    assert double.__validation_plan__.parameters
+    assert double(2) == 4
+    with pytest.raises(ExceptionGroup, match="inputs for `double`"):
+        double(-1)
+    with pytest.raises(ExceptionGroup, match="return value for `double`"):
+        double(5)
+
+
+def test_forward_references_are_skipped(caplog):
+    assert Item(1).with_cost(2) == Item(2)
+    with pytest.raises(ExceptionGroup, match="inputs for `with_cost`"):
+        Item(1).with_cost(-1)
+    with caplog.at_level(logging.WARNING, logger="annotated_validator.plan"):
+
+        @validate_annotated
+        def make(cost: PositiveInt) -> Missing:  # noqa: F821
+            return Item(cost)
+
+    assert "`return` of" in caplog.text
+    with pytest.raises(ExceptionGroup):
+        make(0)
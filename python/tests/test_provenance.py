@@ -0,0 +1,131 @@
+import gc
+from dataclasses import dataclass, field
+from typing import Annotated, Any
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from annotated_validator import provenance
+from annotated_validator.base import BaseMetaValidator
+from annotated_validator.pandas_validators.required_columns import RequiredColumns
+from annotated_validator.provenance import invalidate, is_immutable, is_validated
+from annotated_validator.sampling import SamplingPolicy
+from annotated_validator.validator import validate_annotated
+
+
+@dataclass
+class CountedPositive(BaseMetaValidator):
+    calls: list = field(default_factory=list)
+
+    def validate(self, value) -> ExceptionGroup | None:
+        self.calls.append(id(value))
+        if (np.asarray(value) <= 0).any():
+            return ExceptionGroup("counted_positive", [ValueError("not positive")])
+        return None
+
+
+@pytest.fixture(autouse=True)
+def registry(monkeypatch):
+    registry = {}
+    monkeypatch.setattr(provenance, "_registry", registry)
+    return registry
+
+
+def pipeline(metadata: Any, **options):
+    @validate_annotated(**options)
+    def first(value: Annotated[Any, metadata]) -> Annotated[Any, metadata]:
+        return value
+
+    @validate_annotated(**options)
+    def second(value: Annotated[Any, metadata]) -> Annotated[Any, metadata]:
+        return value
+
+    return lambda value: second(first(value))
+
+
+def test_validated_objects_are_skipped():
+    positive = CountedPositive()
+    run = pipeline(positive, provenance=True)
+    values = np.ones(3)
+    run(values)
+    run(values)
+    assert len(positive.calls) == 1
+    assert is_validated(values, positive)
+    # equal, but not the same object
+    run(values.copy())
+    assert len(positive.calls) == 2
+
+
+def test_invalid_objects_are_not_recorded():
+    positive = CountedPositive()
+    run = pipeline(positive, provenance=True)
+    values = np.zeros(3)
+    for _ in range(2):
+        with pytest.raises(ExceptionGroup):
+            run(values)
+    assert len(positive.calls) == 2
+
+
+def test_invalidate():
+    positive = CountedPositive()
+    run = pipeline(positive, provenance=True)
+    values = np.ones(3)
+    run(values)
+    values[0] = -1
+    invalidate(values)
+    with pytest.raises(ExceptionGroup):
+        run(values)
+
+
+def test_records_are_removed_with_the_object(registry):
+    run = pipeline(CountedPositive(), provenance=True)
+    run(np.ones(3))
+    gc.collect()
+    assert registry == {}
+
+
+def test_strict_provenance():
+    positive = CountedPositive()
+    run = pipeline(positive, provenance=True, strict_provenance=True)
+    writeable = np.ones(3)
+    read_only = np.ones(3)
+    read_only.flags.writeable = False
+    for _ in range(2):
+        run(writeable)
+        run(read_only)
+    # each run validates the inputs and return values of both functions
+    assert positive.calls.count(id(writeable)) == 8
+    assert positive.calls.count(id(read_only)) == 1
+
+
+@pytest.mark.parametrize(
+    ("value", "immutable"),
+    [
+        (1, True),
+        (np.ones(3), False),
+        (np.frombuffer(b"\x01\x02", dtype=np.uint8), True),
+        (pd.Series([1]), False),
+    ],
+)
+def test_is_immutable(value, immutable):
+    assert is_immutable(value) == immutable
+
+
+def test_read_only_view_of_writeable_array():
+    values = np.ones(3)
+    view = values[:]
+    view.flags.writeable = False
+    assert not is_immutable(view)
+
+
+def test_sampled_validation_is_not_recorded(registry):
+    sampled = RequiredColumns({"cost": "int64"}, sampling=SamplingPolicy(rows=1))
+    run = pipeline(sampled, provenance=True)
+    run(pd.DataFrame({"cost": [1, 2, 3]}))
+    assert registry == {}
+
+
+def test_disabled_by_default(registry):
+    pipeline(CountedPositive())(np.ones(3))
+    assert registry == {}
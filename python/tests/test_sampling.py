@@ -0,0 +1,158 @@
+from dataclasses import dataclass
+from typing import Annotated, ClassVar
+
+import annotated_types as at
+import numpy as np
+import pandas as pd
+import pytest
+
+from annotated_validator.exceptions.annotated_types import ArrayGreaterThanError
+from annotated_validator.exceptions.pandas import RequiredColumnTypeMismatchError
+from annotated_validator.number_validators import NumberRange
+from annotated_validator.pandas_validators.required_columns import RequiredColumns
+from annotated_validator.sampling import SamplingPolicy, supports_sampling
+from annotated_validator.validator import BaseMetaValidator, validate_annotated
+
+
+@dataclass
+class RecordLength(BaseMetaValidator):
+    """Records the length of each value, a custom validator that doesn't opt in to sampling."""
+
+    lengths: list[int]
+
+    def validate(self, value):
+        self.lengths.append(len(value))
+
+
+def first_leaf(error: BaseException) -> BaseException:
+    while isinstance(error, ExceptionGroup):
+        error = error.exceptions[0]
+    return error
+
+
+@pytest.mark.parametrize(
+    ("policy", "expected_size"),
+    [
+        (SamplingPolicy(rows=10), 10),
+        (SamplingPolicy(fraction=0.25), 25),
+        (SamplingPolicy(rows=10, head=5, tail=5), 20),
+        (SamplingPolicy(head=3), 3),
+    ],
+)
+def test_select(policy, expected_size):
+    sample = policy.select(100)
+    assert sample.total == 100
+    assert len(sample.positions) == expected_size
+    assert len(np.unique(sample.positions)) == expected_size
+    assert (np.diff(sample.positions) > 0).all()
+    assert set(range(policy.head)) <= set(sample.positions.tolist())
+    assert set(range(100 - policy.tail, 100)) <= set(sample.positions.tolist())
+
+
+def test_select_everything():
+    assert SamplingPolicy(rows=100).select(100) is None
+    assert SamplingPolicy(rows=10, head=50, tail=50).select(100) is None
+
+
+def test_seed_is_reproducible():
+    first, second = SamplingPolicy(rows=10, seed=1), SamplingPolicy(rows=10, seed=1)
+    for _ in range(3):
+        assert first.select(1000).positions.tolist() == second.select(1000).positions.tolist()
+
+
+@pytest.mark.parametrize("kwargs", [{}, {"fraction": 1.5}])
+def test_invalid_policy(kwargs):
+    with pytest.raises(ValueError):
+        SamplingPolicy(**kwargs)
+
+
+def test_detection_probability():
+    policy = SamplingPolicy(rows=100)
+    assert policy.detection_probability(1000, 0) == 0
+    assert policy.detection_probability(1000, 901) == 1
+    assert policy.detection_probability(1000, 1) == pytest.approx(0.1)
+    assert policy.detection_probability(1000, 10) < policy.detection_probability(1000, 20)
+
+
+def test_sampled_parameter():
+    @validate_annotated
+    def func(value: Annotated[np.ndarray, at.Gt(0), SamplingPolicy(rows=10, head=5)]):
+        return value
+
+    values = np.arange(1, 1001)
+    values[:3] = -1
+    with pytest.raises(ExceptionGroup) as exc_info:
+        func(values)
+    metadata_group = exc_info.value.exceptions[0].exceptions[0]
+    assert metadata_group.message == "`Gt` Validation Errors (sampled 15 of 1,000 rows)"
+    error = first_leaf(exc_info.value)
+    assert isinstance(error, ArrayGreaterThanError)
+    assert error.original_positions.tolist() == [0, 1, 2]
+    assert "3 of 15 sampled values" in str(error)
+
+
+def test_sampled_positions_are_original_positions():
+    @validate_annotated
+    def func(value: Annotated[np.ndarray, at.Gt(0), SamplingPolicy(fraction=0.5, seed=0)]):
+        return value
+
+    values = np.full(1000, -1)
+    with pytest.raises(ExceptionGroup) as exc_info:
+        func(values)
+    error = first_leaf(exc_info.value)
+    assert error.count == 500
+    assert error.original_positions.tolist() == sorted(set(error.original_positions.tolist()))
+    assert error.original_positions.max() >= 500
+
+
+def test_length_is_not_sampled():
+    @validate_annotated
+    def func(value: Annotated[list, at.MinLen(50), SamplingPolicy(rows=10)]):
+        return value
+
+    assert func(list(range(100))) == list(range(100))
+
+
+def test_custom_validators_opt_in_to_sampling():
+    @dataclass
+    class SampledLength(RecordLength):
+        supports_sampling: ClassVar[bool] = True
+
+    assert supports_sampling(NumberRange(0, 1))
+    assert supports_sampling(RequiredColumns({}))
+    lengths: list[int] = []
+
+    @validate_annotated
+    def func(
+        value: Annotated[
+            list, RecordLength(lengths), SampledLength(lengths), SamplingPolicy(rows=10)
+        ],
+    ):
+        return value
+
+    func(list(range(100)))
+    assert lengths == [100, 10]
+
+
+def test_scalars_are_not_sampled():
+    @validate_annotated(generate_code=True)
+    def func(value: Annotated[int, at.Gt(0), SamplingPolicy(rows=10)]):
+        return value
+
+    assert func(1) == 1
+    with pytest.raises(ExceptionGroup):
+        func(0)
+
+
+def test_required_columns_sampling():
+    validator = RequiredColumns(
+        {"cost": Annotated["int64", at.Ge(0)], "name": "float64"},
+        sampling=SamplingPolicy(rows=10, tail=2),
+    )
+    df = pd.DataFrame({"cost": np.arange(1000), "name": ["a"] * 1000})
+    df.loc[999, "cost"] = -1
+    errors = validator.validate(df)
+    column_group, type_error = errors.exceptions
+    assert isinstance(type_error, RequiredColumnTypeMismatchError)
+    assert column_group.message == "`cost` Column Validation Errors (sampled 12 of 1,000 rows)"
+    assert first_leaf(column_group).original_positions.tolist() == [999]
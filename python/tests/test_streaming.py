@@ -0,0 +1,213 @@
+import gc
+import io
+import weakref
+from collections.abc import Generator, Iterable, Iterator
+from dataclasses import dataclass
+from typing import Annotated
+
+import annotated_types as at
+import pandas as pd
+import pytest
+
+from annotated_validator.exceptions.iterator import IteratorValidationErrorGroup
+from annotated_validator.pandas_validators import RequiredColumns
+from annotated_validator.streaming import Batches, ValidatedIterator, item_type
+from annotated_validator.validator import BaseMetaValidator, ValidateAnnotated, validate_annotated
+
+ItemChunks = Annotated[
+    Iterator[pd.DataFrame],
+    RequiredColumns({"cost": Annotated["int64", at.Ge(0)], "quantity": "int64"}),
+]
+
+
+def read_items(costs: list[int], chunksize: int) -> Iterator[pd.DataFrame]:
+    rows = "\n".join(f"{cost},1" for cost in costs)
+    return pd.read_csv(io.StringIO(f"cost,quantity\n{rows}\n"), chunksize=chunksize)
+
+
+@validate_annotated
+def total_cost(chunks: ItemChunks) -> int:
+    return sum(int(chunk["cost"].sum()) for chunk in chunks)
+
+
+@pytest.mark.parametrize(
+    ("py_type", "expected"),
+    [
+        (Iterator[int], int),
+        (Generator[int, None, None], int),
+        (Annotated[Iterator[int], at.Gt(0)], Annotated[int, at.Gt(0)]),
+        (Iterator[Annotated[int, at.Gt(0)]], Annotated[int, at.Gt(0)]),
+        (Iterable[int], None),
+        (list[int], None),
+        (Annotated[int, at.Gt(0)], None),
+        (Annotated[Iterator[Annotated[int, at.Gt(0)]], Batches(2)], Annotated[int, at.Gt(0)]),
+    ],
+)
+def test_item_type(py_type, expected):
+    assert item_type(py_type) == expected
+
+
+def test_valid_chunks():
+    assert total_cost(read_items(list(range(10)), chunksize=3)) == 45
+    assert total_cost(chunks=read_items(list(range(10)), chunksize=3)) == 45
+
+
+def test_invalid_chunk_reports_index_and_offset():
+    costs = list(range(10))
+    costs[7] = -1
+    with pytest.raises(IteratorValidationErrorGroup) as exc_info:
+        total_cost(read_items(costs, chunksize=3))
+    assert exc_info.value.index == 2
+    assert exc_info.value.offset == 6
+    assert exc_info.value.message == "Validation error(s) in chunk 2 (row offset 6) of `chunks`."
+
+
+def test_schema_is_cached_across_chunks():
+    validator = RequiredColumns({"cost": "int64"})
+
+    @validate_annotated
+    def consume(chunks: Annotated[Iterator[pd.DataFrame], validator]) -> None:
+        for _ in chunks:
+            pass
+
+    consume(read_items(list(range(10)), chunksize=2))
+    assert len(validator.schema_cache) == 1
+
+
+def test_consumed_chunks_are_not_kept():
+    references = []
+
+    def chunks():
+        for start in range(3):
+            chunk = pd.DataFrame({"cost": [start], "quantity": [1]})
+            references.append(weakref.ref(chunk))
+            yield chunk
+
+    @validate_annotated
+    def consume(chunks: ItemChunks) -> None:
+        for _ in chunks:
+            pass
+
+    consume(chunks())
+    gc.collect()
+    assert all(reference() is None for reference in references)
+
+
+def test_wrapped_iterator_forwards_close():
+    closed = []
+
+    def numbers():
+        try:
+            yield 1
+            yield 2
+        finally:
+            closed.append(True)
+
+    @validate_annotated
+    def first(values: Iterator[Annotated[int, at.Gt(0)]]) -> int:
+        assert isinstance(values, ValidatedIterator)
+        with values:
+            return next(values)
+
+    assert first(numbers()) == 1
+    assert closed == [True]
+
+
+@dataclass
+class Order(ValidateAnnotated):
+    chunks: ItemChunks
+
+
+def test_class_iterators_are_not_validated():
+    iterator = iter([pd.DataFrame({"cost": [-1]})])
+    assert Order(iterator).chunks is iterator
+
+
+def running_total() -> Generator[Annotated[int, at.Ge(0)], int, None]:
+    total = 0
+    while True:
+        value = yield total
+        total += value
+
+
+def test_generator_return_value_is_validated_lazily():
+    @validate_annotated
+    def positive(stop: int) -> Iterator[Annotated[int, at.Gt(0)]]:
+        yield from range(stop, -2, -1)
+
+    values = positive(2)
+    assert next(values) == 2
+    assert next(values) == 1
+    with pytest.raises(IteratorValidationErrorGroup) as exc_info:
+        next(values)
+    assert exc_info.value.index == 2
+    assert exc_info.value.checked == {"return": 0}
+
+
+def test_send_and_close_are_forwarded():
+    totals = validate_annotated(running_total)()
+    assert next(totals) == 0
+    assert totals.send(5) == 5
+    with pytest.raises(IteratorValidationErrorGroup):
+        totals.send(-10)
+    totals.close()
+    with pytest.raises(StopIteration):
+        next(totals)
+
+
+def batched(values: list) -> Annotated[Iterator[Annotated[int, at.Gt(0)]], Batches(3)]:
+    yield from values
+
+
+def test_batches():
+    assert list(validate_annotated(batched)([1, 2, 3, 4, 5])) == [1, 2, 3, 4, 5]
+    values = validate_annotated(batched)([1, 2, 3, 4, -5, 6, 7])
+    assert [next(values) for _ in range(3)] == [1, 2, 3]
+    with pytest.raises(IteratorValidationErrorGroup) as exc_info:
+        next(values)
+    assert exc_info.value.index == 3
+    assert exc_info.value.message == "Validation error(s) in items 3-5 (row offset 3) of `return`."
+    error = exc_info.value.exceptions[0].exceptions[0].exceptions[0]
+    assert error.positions.tolist() == [1]
+
+
+def test_batches_validate_lengths_per_item():
+    @validate_annotated
+    def words(values: list) -> Annotated[Iterator[Annotated[str, at.MinLen(2)]], Batches(10)]:
+        yield from values
+
+    assert list(words(["ab", "cd"])) == ["ab", "cd"]
+    with pytest.raises(IteratorValidationErrorGroup) as exc_info:
+        list(words(["ab", "c"]))
+    assert exc_info.value.index == 1
+
+
+@dataclass(frozen=True)
+class Even(BaseMetaValidator):
+    """A custom validator that only accepts a single value."""
+
+    def validate(self, value):
+        if value % 2:
+            return ExceptionGroup("`Even` Validation Errors", [ValueError(f"{value} is odd")])
+        return None
+
+
+@pytest.mark.parametrize(
+    "item_metadata", [(Even(),), (at.Gt(0), Even())], ids=["item only", "batched and item"]
+)
+def test_batches_validate_single_value_validators_per_item(item_metadata):
+    @validate_annotated
+    def evens(values: list) -> Annotated[Iterator[Annotated[int, *item_metadata]], Batches(4)]:
+        yield from values
+
+    assert list(evens([2, 4, 6, 8, 10])) == [2, 4, 6, 8, 10]
+    with pytest.raises(IteratorValidationErrorGroup) as exc_info:
+        list(evens([2, 4, 6, 8, 10, 11]))
+    assert exc_info.value.index == 5
+    assert exc_info.value.message == "Validation error(s) in item 5 (row offset 5) of `return`."
+
+
+def test_batches_read_ahead():
+    values = validate_annotated(batched)([1, 2])
+    with pytest.raises(TypeError):
+        values.send(None)
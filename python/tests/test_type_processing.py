@@ -2,7 +2,7 @@ from typing import Annotated, Optional, TypeAlias, Union, get_args, get_origin
 
 import pytest
 
-from talk.type_processing import TypeAnnotation
+from annotated_validator.type_processing import TypeAnnotation
 
 TestInteger: TypeAlias = Annotated[int, "test_integer"]
 """integer with metadata."""
@@ -88,5 +88,36 @@ def test_collections_with_union(py_type: type, arguments: tuple[type, ...]):
     assert type_annotation.valid_base_type == get_origin(py_type)
 
 
-def test(py_type: Annotated[Annotated[int, "innter integer"], "outer annotation"]):
-    ...
+def test_nested_annotated_is_flattened():
+    type_annotation = TypeAnnotation.from_py_type(
+        Annotated[Annotated[int, "inner integer"], "outer annotation"]
+    )
+    assert type_annotation.arguments == (int,)
+    assert type_annotation.metadata == ("inner integer", "outer annotation")
+
+
+@pytest.mark.parametrize(
+    "py_type,optional_type",
+    [
+        (int | None, int),
+        (Optional[Annotated[int, "integer"]], Annotated[int, "integer"]),
+        (int | str | None, None),
+        (int, None),
+    ],
+)
+def test_optional_type(py_type: type, optional_type: type | None):
+    assert TypeAnnotation.from_py_type(py_type).optional_type == optional_type
+
+
+@pytest.mark.parametrize(
+    "py_type,has_nested_metadata",
+    [
+        (list[int], False),
+        (Annotated[list[int], "list"], False),
+        (list[TestInteger], True),
+        (Annotated[dict[str, list[TestInteger | None]], "dict"], True),
+        (tuple[int, ...], False),
+    ],
+)
+def test_has_nested_metadata(py_type: type, has_nested_metadata: bool):
+    assert TypeAnnotation.from_py_type(py_type).has_nested_metadata is has_nested_metadata
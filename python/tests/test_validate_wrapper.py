@@ -1,6 +1,12 @@
 from typing import Annotated
 
-from talk.validator import validate_annotated
+import annotated_types as at
+import pytest
+
+from annotated_validator import plan as plan_module
+from annotated_validator.number_validators import NumberRange
+from annotated_validator.plan import get_parameter_plan
+from annotated_validator.validator import ParamData, annotated_validator, validate_annotated
 
 
 @validate_annotated
@@ -8,9 +14,96 @@ def demo_function(a: Annotated[int, "test"], b: str):
     print(type(a))
 
 
+@validate_annotated
+def positive_sum(
+    a: Annotated[int, at.Gt(0)], b: int = 1, *, c: Annotated[int, at.Ge(0)] = 0
+) -> Annotated[int, at.Lt(100)]:
+    return a + b + c
+
+
+@validate_annotated
+def positional_only(a: Annotated[int, at.Gt(0)], /, *args: Annotated[tuple, at.MinLen(1)]) -> int:
+    return a + sum(args)
+
+
 def test_wrapper():
     demo_function(1, b="a string")
 
 
+def test_no_validatable_metadata_returns_original_function():
+    def no_metadata(a: Annotated[int, "test"], b: str) -> int:
+        return a
+
+    assert validate_annotated(no_metadata) is no_metadata
+
+
+def test_plan_is_built_on_decoration():
+    plan = positive_sum.__validation_plan__
+    assert [param_plan.name for param_plan in plan.parameters] == ["a", "c"]
+    assert [param_plan.index for param_plan in plan.parameters] == [0, None]
+    assert plan.return_parameter is not None
+    assert not plan.requires_binding
+
+
+def test_annotated_validator_caches_parameter_plans(monkeypatch):
+    compiled = []
+    original = plan_module.compile_parameter
+    monkeypatch.setattr(
+        plan_module, "compile_parameter", lambda *args: compiled.append(args) or original(*args)
+    )
+    plan_module._cached_parameter_plan.cache_clear()
+    # `NumberRange` isn't hashable, the annotation is cached by identity
+    unhashable = Annotated[int, NumberRange(0, 10)]
+    parameters = {"a": ParamData(1, Annotated[int, at.Gt(0)]), "b": ParamData(11, unhashable)}
+    for _ in range(3):
+        (errors,) = annotated_validator(parameters)
+        assert errors.message == "`b` Validation Errors"
+    assert len(compiled) == 2
+    assert get_parameter_plan("b", unhashable) is get_parameter_plan("b", unhashable)
+    # equal annotations share a plan, unless they aren't hashable
+    assert get_parameter_plan("a", Annotated[int, at.Gt(0)]).name == "a"
+    assert len(compiled) == 2
+    assert get_parameter_plan("b", Annotated[int, NumberRange(0, 10)]).name == "b"
+    assert len(compiled) == 3
+    plan_module._cached_parameter_plan.cache_clear()
+
+
+@pytest.mark.parametrize(
+    "args,kwargs,expected",
+    [((1,), {}, 2), ((1, 2), {"c": 3}, 6), ((), {"a": 1, "b": 2, "c": 3}, 6)],
+)
+def test_valid_calls(args, kwargs, expected):
+    assert positive_sum(*args, **kwargs) == expected
+
+
+@pytest.mark.parametrize("args,kwargs", [((0,), {}), ((1,), {"c": -1}), ((), {"a": -1})])
+def test_invalid_inputs(args, kwargs):
+    with pytest.raises(ExceptionGroup, match="processing inputs for `positive_sum`"):
+        positive_sum(*args, **kwargs)
+
+
+def test_invalid_return():
+    with pytest.raises(ExceptionGroup, match="return value for `positive_sum`"):
+        positive_sum(50, 50)
+
+
+def test_missing_argument_raises_type_error():
+    with pytest.raises(TypeError):
+        positive_sum()
+    with pytest.raises(TypeError):
+        positive_sum(1, 2, 3)
+
+
+def test_variadic_parameters_are_bound_with_signature():
+    assert positional_only.__validation_plan__.requires_binding
+    assert positional_only(1, 2) == 3
+    with pytest.raises(ExceptionGroup) as exc_info:
+        positional_only(-1)
+    assert [group.message for group in exc_info.value.exceptions] == [
+        "`a` Validation Errors",
+        "`args` Validation Errors",
+    ]
+
+
 if __name__ == "__main__":
     test_wrapper()